@@ -4,33 +4,47 @@ Main FastAPI application for the NBA Injury Alert system.
 import asyncio
 from typing import Any, Dict, List, Optional
 
-from fastapi import Depends, FastAPI, HTTPException, WebSocket, WebSocketDisconnect
+from fastapi import Depends, FastAPI, HTTPException, WebSocket, status
 from fastapi.middleware.cors import CORSMiddleware
-from sqlalchemy.orm import Session
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import ORJSONResponse
+from redis.exceptions import RedisError
 
-from ..models.database import get_db, init_db
+from ..models.database import init_db
 from ..notifier.channels import WebSocketNotifier
+from ..notifier.service import notification_service
 from ..utils.config import settings
 from ..utils.logging import logger
+from ..utils.pubsub import WEBSOCKET_CHANNEL, subscribe
+from .routers.users import user_id_from_token
 
 # Create the FastAPI application
 app = FastAPI(
     title="NBA Injury Alert API",
     description="API for the NBA Injury Alert system",
-    version="0.1.0"
+    version="0.1.0",
+    default_response_class=ORJSONResponse
 )
 
 # Add CORS middleware
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=["*"],  # In production, restrict this to your frontend domain
+    allow_origins=settings.allowed_origins,
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
 )
 
-# Create WebSocket notifier
-websocket_notifier = WebSocketNotifier()
+# Compress larger responses (the list endpoints return sizeable JSON)
+app.add_middleware(GZipMiddleware, minimum_size=512, compresslevel=5)
+
+# Share the notification service's WebSocket notifier so its pushes reach
+# the clients connected here
+websocket_notifier: WebSocketNotifier = (
+    notification_service.websocket_notifier
+    if isinstance(notification_service.websocket_notifier, WebSocketNotifier)
+    else WebSocketNotifier()
+)
 
 
 @app.on_event("startup")
@@ -41,81 +55,92 @@ async def startup_event():
     # Initialize the database
     init_db()
     
-    # Start background tasks
-    asyncio.create_task(background_tasks())
+    # Relay notifications from the worker (backend.worker), keeping a
+    # reference to the task so it isn't garbage collected
+    app.state.bg_tasks = set()
+    task = asyncio.create_task(relay_websocket_messages())
+    app.state.bg_tasks.add(task)
+    task.add_done_callback(_on_background_task_done)
+
+
+def _on_background_task_done(task: asyncio.Task) -> None:
+    """
+    Forget a finished background task and log any error it raised.
+    
+    Args:
+        task: The finished task.
+    """
+    app.state.bg_tasks.discard(task)
+    
+    if not task.cancelled() and task.exception():
+        logger.error(f"Background task failed: {str(task.exception())}")
 
 
 @app.on_event("shutdown")
 async def shutdown_event():
     """Clean up resources on shutdown."""
     logger.info("Shutting down NBA Injury Alert API")
+    
+    # Cancel background tasks and wait for them to finish
+    bg_tasks = list(getattr(app.state, "bg_tasks", ()))
+    for task in bg_tasks:
+        task.cancel()
+    await asyncio.gather(*bg_tasks, return_exceptions=True)
 
 
-async def background_tasks():
-    """Run background tasks."""
-    logger.info("Starting background tasks")
-    
-    # Import here to avoid circular imports
-    from ..fetcher.nba import NBAInjuryPoller
-    from ..processor.injury import InjuryReportProcessor
-    from ..notifier.service import notification_service
+async def relay_websocket_messages():
+    """Deliver WebSocket messages published by the worker to this process's clients."""
+    logger.info("Starting WebSocket relay")
     
-    # Create fetcher, processor, and poller
-    processor = InjuryReportProcessor()
-    poller = NBAInjuryPoller()
-    
-    # Define callback for new reports
-    async def on_new_report(report_data):
+    while True:
         try:
-            # Process the report
-            processed = await processor.process(report_data)
-            
-            # Get the previous report for comparison
-            with get_db() as db:
-                from ..models.injury import InjuryReport
-                previous_report = db.query(InjuryReport).order_by(
-                    InjuryReport.report_date.desc()
-                ).offset(1).first()
-                
-                if previous_report:
-                    # Get the previous processed data
-                    previous_data = {
-                        "report_id": previous_report.id,
-                        "player_statuses": []  # This would need to be populated from the database
-                    }
-                    
-                    # Compute the diff
-                    diff = await processor.compute_diff(processed, previous_data)
-                    
-                    # Send notifications for changes
-                    if diff.get("changes"):
-                        await notification_service.process_status_changes(diff["changes"])
-        
-        except Exception as e:
-            logger.error(f"Error processing new report: {str(e)}")
-    
-    # Start polling for injury reports
-    await poller.start_polling(callback=on_new_report)
+            async for message in subscribe(WEBSOCKET_CHANNEL):
+                try:
+                    await websocket_notifier.deliver(message)
+                except Exception as e:
+                    logger.error(f"Failed to deliver WebSocket message: {str(e)}")
+        except RedisError as e:
+            logger.warning(f"WebSocket relay lost its Redis connection: {str(e)}")
+            await asyncio.sleep(5)
 
 
 @app.websocket("/ws/{client_id}")
-async def websocket_endpoint(websocket: WebSocket, client_id: str):
+async def websocket_endpoint(
+    websocket: WebSocket,
+    client_id: str,
+    rooms: Optional[str] = None,
+    token: Optional[str] = None
+):
     """
     WebSocket endpoint for real-time notifications.
     
     Args:
         websocket: The WebSocket connection.
         client_id: The client identifier.
+        rooms: Comma-separated change broadcast rooms, e.g. "top100" (defaults to all changes).
+        token: Access token; authenticated clients receive their user's notifications.
     """
-    await websocket_notifier.connect(websocket, client_id)
+    user_id = None
+    if token:
+        user_id = user_id_from_token(token)
+        if user_id is None:
+            await websocket.close(code=status.WS_1008_POLICY_VIOLATION)
+            return
+    
+    room_set = {room.strip() for room in rooms.split(",") if room.strip()} if rooms else None
+    await websocket_notifier.connect(
+        websocket,
+        client_id,
+        rooms=room_set,
+        user_id=str(user_id) if user_id is not None else None
+    )
     try:
-        while True:
-            # Wait for messages from the client
-            data = await websocket.receive_text()
-            # Echo the message back (for testing)
-            await websocket.send_text(f"Message received: {data}")
-    except WebSocketDisconnect:
-        websocket_notifier.disconnect(client_id)
+        # Notifications are pushed by the notifier; just drain incoming
+        # messages until the client goes away
+        async for _ in websocket.iter_text():
+            pass
+    finally:
+        websocket_notifier.disconnect(client_id, websocket)
 
 
 # Import and include API routers
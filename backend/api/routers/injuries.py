@@ -2,42 +2,102 @@
 API endpoints for injury data.
 """
 from datetime import datetime, timedelta
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 from fastapi import APIRouter, Depends, HTTPException, Query
-from sqlalchemy import desc
-from sqlalchemy.orm import Session
+from fastapi.responses import ORJSONResponse
+from sqlalchemy import desc, func, select, tuple_
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import contains_eager, raiseload, selectinload
 
-from ...models.database import get_db
+from ...models.database import get_async_db
 from ...models.injury import InjuryReport, InjuryStatus, StatusChange
 from ...models.player import Player
-from ...utils.errors import ResourceNotFoundError
+from ...utils.errors import ResourceNotFoundError, ValidationError
+from ...utils.pagination import decode_cursor, encode_cursor
 
 router = APIRouter()
 
 
+def _parse_cursor(cursor: str) -> Tuple[datetime, int]:
+    """
+    Decode a pagination cursor from a query parameter.
+    
+    Args:
+        cursor: The cursor string.
+    
+    Returns:
+        Tuple of (timestamp, row_id).
+    
+    Raises:
+        HTTPException: If the cursor is malformed.
+    """
+    try:
+        return decode_cursor(cursor)
+    except ValidationError as e:
+        raise HTTPException(status_code=400, detail=e.message)
+
+
 @router.get("/reports")
 async def get_injury_reports(
     skip: int = 0,
     limit: int = 10,
-    db: Session = Depends(get_db)
+    cursor: Optional[str] = None,
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     Get a list of injury reports.
     
+    Pass the returned next_cursor as cursor to fetch the following page
+    without an OFFSET scan. Cursor pages don't include a total.
+    
     Args:
-        skip: Number of reports to skip.
+        skip: Number of reports to skip (ignored when a cursor is given).
         limit: Maximum number of reports to return.
+        cursor: Cursor returned with the previous page.
         db: Database session.
     
     Returns:
         List of injury reports.
     """
-    reports = db.query(InjuryReport).order_by(
-        desc(InjuryReport.report_date)
-    ).offset(skip).limit(limit).all()
+    # Skip the raw report content we don't return
+    query = select(
+        InjuryReport.id,
+        InjuryReport.report_date,
+        InjuryReport.source_url,
+        InjuryReport.report_hash
+    ).order_by(
+        desc(InjuryReport.report_date),
+        desc(InjuryReport.id)
+    ).limit(limit)
     
-    return {
+    if cursor:
+        # Seek past the last row of the previous page
+        cursor_date, cursor_id = _parse_cursor(cursor)
+        result = await db.execute(
+            query.filter(tuple_(InjuryReport.report_date, InjuryReport.id) < (cursor_date, cursor_id))
+        )
+        reports = result.all()
+        total = None
+    else:
+        # Fetch the page and the total count in a single round-trip
+        result = await db.execute(
+            query.add_columns(func.count().over().label("total")).offset(skip)
+        )
+        reports = result.all()
+        
+        # An empty page carries no window count, so only count when paging past the end
+        if reports:
+            total = reports[0].total
+        else:
+            total = await db.scalar(select(func.count()).select_from(InjuryReport)) if skip else 0
+    
+    next_cursor = None
+    if len(reports) == limit:
+        next_cursor = encode_cursor(reports[-1].report_date, reports[-1].id)
+    
+    # Return the response directly so FastAPI skips its jsonable_encoder pass
+    return ORJSONResponse({
         "reports": [
             {
                 "id": report.id,
@@ -47,16 +107,17 @@ async def get_injury_reports(
             }
             for report in reports
         ],
-        "total": db.query(InjuryReport).count(),
+        "total": total,
         "skip": skip,
-        "limit": limit
-    }
+        "limit": limit,
+        "next_cursor": next_cursor
+    })
 
 
 @router.get("/reports/{report_id}")
 async def get_injury_report(
     report_id: int,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     Get a specific injury report.
@@ -71,15 +132,21 @@ async def get_injury_report(
     Raises:
         HTTPException: If the report is not found.
     """
-    report = db.query(InjuryReport).filter(InjuryReport.id == report_id).first()
+    report = await db.get(InjuryReport, report_id)
     
     if not report:
         raise HTTPException(status_code=404, detail=f"Report with ID {report_id} not found")
     
-    # Get the statuses for this report
-    statuses = db.query(InjuryStatus).filter(
-        InjuryStatus.report_id == report_id
-    ).all()
+    # Get the statuses for this report, joining in their players
+    result = await db.execute(
+        select(InjuryStatus).join(InjuryStatus.player).options(
+            contains_eager(InjuryStatus.player),
+            raiseload("*")
+        ).filter(
+            InjuryStatus.report_id == report_id
+        )
+    )
+    statuses = result.scalars().all()
     
     return {
         "id": report.id,
@@ -111,16 +178,21 @@ async def get_status_changes(
     top_players_only: bool = True,
     skip: int = 0,
     limit: int = 20,
-    db: Session = Depends(get_db)
+    cursor: Optional[str] = None,
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     Get recent status changes.
     
+    Pass the returned next_cursor as cursor to fetch the following page
+    without an OFFSET scan. Cursor pages don't include a total.
+    
     Args:
         days: Number of days to look back.
         top_players_only: Whether to include only top-ranked players.
-        skip: Number of changes to skip.
+        skip: Number of changes to skip (ignored when a cursor is given).
         limit: Maximum number of changes to return.
+        cursor: Cursor returned with the previous page.
         db: Database session.
     
     Returns:
@@ -129,23 +201,51 @@ async def get_status_changes(
     # Calculate the cutoff date
     cutoff_date = datetime.now() - timedelta(days=days)
     
-    # Build the query
-    query = db.query(StatusChange).filter(
+    # Build the query, joining in the player so the page, its players and the
+    # total all come back in a single round-trip
+    query = select(StatusChange).join(StatusChange.player).filter(
         StatusChange.change_date >= cutoff_date
     )
     
     if top_players_only:
-        query = query.join(Player).filter(Player.is_top_100 == True)
+        query = query.filter(Player.is_top_100 == True)
     
-    # Get the total count
-    total = query.count()
+    page_query = query.options(
+        contains_eager(StatusChange.player),
+        raiseload("*")
+    ).order_by(
+        desc(StatusChange.change_date),
+        desc(StatusChange.id)
+    ).limit(limit)
     
-    # Get the paginated results
-    changes = query.order_by(
-        desc(StatusChange.change_date)
-    ).offset(skip).limit(limit).all()
+    if cursor:
+        # Seek past the last row of the previous page
+        cursor_date, cursor_id = _parse_cursor(cursor)
+        result = await db.execute(
+            page_query.filter(tuple_(StatusChange.change_date, StatusChange.id) < (cursor_date, cursor_id))
+        )
+        changes = result.scalars().all()
+        total = None
+    else:
+        # Get the paginated results along with the windowed total count
+        result = await db.execute(
+            page_query.add_columns(func.count().over().label("total")).offset(skip)
+        )
+        rows = result.all()
+        changes = [row.StatusChange for row in rows]
+        
+        # An empty page carries no window count, so only count when paging past the end
+        if rows:
+            total = rows[0].total
+        else:
+            total = await db.scalar(select(func.count()).select_from(query.subquery())) if skip else 0
     
-    return {
+    next_cursor = None
+    if len(changes) == limit:
+        next_cursor = encode_cursor(changes[-1].change_date, changes[-1].id)
+    
+    # Return the response directly so FastAPI skips its jsonable_encoder pass
+    return ORJSONResponse({
         "changes": [
             {
                 "id": change.id,
@@ -164,15 +264,16 @@ async def get_status_changes(
         ],
         "total": total,
         "skip": skip,
-        "limit": limit
-    }
+        "limit": limit,
+        "next_cursor": next_cursor
+    })
 
 
 @router.get("/players/{player_id}/history")
 async def get_player_injury_history(
     player_id: int,
     limit: int = 10,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     Get injury history for a specific player.
@@ -188,24 +289,24 @@ async def get_player_injury_history(
     Raises:
         HTTPException: If the player is not found.
     """
-    player = db.query(Player).filter(Player.id == player_id).first()
+    player = await db.get(Player, player_id, options=[selectinload(Player.current_status)])
     
     if not player:
         raise HTTPException(status_code=404, detail=f"Player with ID {player_id} not found")
     
     # Get the player's status changes
-    changes = db.query(StatusChange).filter(
-        StatusChange.player_id == player_id
-    ).order_by(
-        desc(StatusChange.change_date)
-    ).limit(limit).all()
+    result = await db.execute(
+        select(StatusChange).options(
+            raiseload("*")
+        ).filter(
+            StatusChange.player_id == player_id
+        ).order_by(
+            desc(StatusChange.change_date)
+        ).limit(limit)
+    )
+    changes = result.scalars().all()
     
-    # Get the player's current status
-    current_status = db.query(InjuryStatus).filter(
-        InjuryStatus.player_id == player_id
-    ).order_by(
-        desc(InjuryStatus.created_at)
-    ).first()
+    current_status = player.current_status
     
     return {
         "player": {
@@ -1,19 +1,49 @@
 """
 API endpoints for player data.
 """
+from datetime import datetime, timedelta
 from typing import Any, Dict, List, Optional
 
-from fastapi import APIRouter, Depends, HTTPException, Query
-from sqlalchemy import desc, func
-from sqlalchemy.orm import Session
+import orjson
+from fastapi import APIRouter, Depends, HTTPException, Query, Response
+from fastapi.responses import ORJSONResponse
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import selectinload
 
-from ...models.database import get_db
+from ...models.database import get_async_db
 from ...models.player import Player, PlayerRanking
 from ...models.injury import InjuryStatus
+from ...utils.cache import cache_get, cache_set, local_cache_get, local_cache_set
 from ...utils.errors import ResourceNotFoundError
 
 router = APIRouter()
 
+# Cache keys and TTLs (seconds) for near-static listings
+TOP_PLAYERS_CACHE_KEY = "players:top100"
+TOP_PLAYERS_CACHE_TTL = 600
+TEAMS_CACHE_KEY = "players:teams"
+TEAMS_CACHE_TTL = 3600
+
+# How long each worker keeps the encoded listings in memory (seconds)
+LOCAL_CACHE_TTL = 30
+
+# Shortest query searched; anything shorter matches most of the table
+MIN_SEARCH_LENGTH = 2
+
+# Columns serialized by the player list endpoints
+PLAYER_LIST_COLUMNS = (
+    Player.id,
+    Player.name,
+    Player.team,
+    Player.position,
+    Player.jersey_number,
+    Player.current_rank,
+    Player.is_top_100,
+    Player.nba_id,
+    Player.espn_id,
+)
+
 
 @router.get("/")
 async def get_players(
@@ -22,7 +52,7 @@ async def get_players(
     has_injury: Optional[bool] = None,
     skip: int = 0,
     limit: int = 50,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     Get a list of players.
@@ -38,8 +68,8 @@ async def get_players(
     Returns:
         List of players.
     """
-    # Build the query
-    query = db.query(Player)
+    # Build the query over only the columns we serialize
+    query = select(*PLAYER_LIST_COLUMNS)
     
     # Apply filters
     if team:
@@ -49,32 +79,30 @@ async def get_players(
         query = query.filter(Player.is_top_100 == is_top_100)
     
     if has_injury is not None:
-        # This is a more complex filter that requires a subquery
-        if has_injury:
-            # Get players with a recent injury status
-            latest_statuses = db.query(
-                InjuryStatus.player_id,
-                func.max(InjuryStatus.created_at).label("latest_date")
-            ).group_by(InjuryStatus.player_id).subquery()
-            
-            query = query.join(
-                latest_statuses,
-                Player.id == latest_statuses.c.player_id
-            )
-        else:
-            # Get players without a recent injury status
-            injured_player_ids = db.query(InjuryStatus.player_id).distinct().subquery()
-            query = query.filter(~Player.id.in_(injured_player_ids))
-    
-    # Get the total count
-    total = query.count()
-    
-    # Apply pagination
-    players = query.order_by(
-        Player.current_rank.asc() if is_top_100 else Player.name.asc()
-    ).offset(skip).limit(limit).all()
+        # A player counts as injured if they have a non-active status
+        # reported within the last week
+        recent_cutoff = datetime.now() - timedelta(days=7)
+        is_injured = Player.current_status.has(
+            (InjuryStatus.created_at >= recent_cutoff) & (InjuryStatus.status != "ACTIVE")
+        )
+        query = query.filter(is_injured if has_injury else ~is_injured)
     
-    return {
+    # Apply pagination, fetching the total count as a window column
+    result = await db.execute(
+        query.add_columns(func.count().over().label("total")).order_by(
+            Player.current_rank.asc() if is_top_100 else Player.name.asc()
+        ).offset(skip).limit(limit)
+    )
+    players = result.all()
+    
+    # An empty page carries no window count, so only count when paging past the end
+    if players:
+        total = players[0].total
+    else:
+        total = await db.scalar(select(func.count()).select_from(query.subquery())) if skip else 0
+    
+    # Return the response directly so FastAPI skips its jsonable_encoder pass
+    return ORJSONResponse({
         "players": [
             {
                 "id": player.id,
@@ -92,12 +120,12 @@ async def get_players(
         "total": total,
         "skip": skip,
         "limit": limit
-    }
+    })
 
 
 @router.get("/top100")
 async def get_top_players(
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     Get the top 100 players.
@@ -108,11 +136,39 @@ async def get_top_players(
     Returns:
         List of top 100 players.
     """
-    players = db.query(Player).filter(
-        Player.is_top_100 == True
-    ).order_by(
-        Player.current_rank.asc()
-    ).all()
+    payload = local_cache_get(TOP_PLAYERS_CACHE_KEY)
+    if payload is not None:
+        return Response(content=payload, media_type="application/json")
+    
+    response = await cache_get(TOP_PLAYERS_CACHE_KEY)
+    if response is None:
+        response = await _fetch_top_players(db)
+        await cache_set(TOP_PLAYERS_CACHE_KEY, response, TOP_PLAYERS_CACHE_TTL)
+    
+    payload = orjson.dumps(response)
+    local_cache_set(TOP_PLAYERS_CACHE_KEY, payload, LOCAL_CACHE_TTL)
+    
+    return Response(content=payload, media_type="application/json")
+
+
+async def _fetch_top_players(db: AsyncSession) -> Dict[str, Any]:
+    """
+    Load the top 100 players from the database.
+    
+    Args:
+        db: Database session.
+    
+    Returns:
+        The top 100 players response.
+    """
+    result = await db.execute(
+        select(*PLAYER_LIST_COLUMNS).filter(
+            Player.is_top_100 == True
+        ).order_by(
+            Player.current_rank.asc()
+        )
+    )
+    players = result.all()
     
     return {
         "players": [
@@ -135,7 +191,7 @@ async def get_top_players(
 
 @router.get("/teams")
 async def get_teams(
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     Get a list of all NBA teams.
@@ -146,18 +202,33 @@ async def get_teams(
     Returns:
         List of teams.
     """
-    # Get distinct teams from the player table
-    teams = db.query(Player.team).distinct().order_by(Player.team).all()
+    payload = local_cache_get(TEAMS_CACHE_KEY)
+    if payload is not None:
+        return Response(content=payload, media_type="application/json")
     
-    return {
-        "teams": [team[0] for team in teams]
-    }
+    response = await cache_get(TEAMS_CACHE_KEY)
+    if response is None:
+        # Get distinct teams from the player table
+        result = await db.execute(
+            select(Player.team).distinct().order_by(Player.team)
+        )
+        
+        response = {
+            "teams": result.scalars().all()
+        }
+        
+        await cache_set(TEAMS_CACHE_KEY, response, TEAMS_CACHE_TTL)
+    
+    payload = orjson.dumps(response)
+    local_cache_set(TEAMS_CACHE_KEY, payload, LOCAL_CACHE_TTL)
+    
+    return Response(content=payload, media_type="application/json")
 
 
 @router.get("/{player_id}")
 async def get_player(
     player_id: int,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     Get a specific player.
@@ -172,17 +243,12 @@ async def get_player(
     Raises:
         HTTPException: If the player is not found.
     """
-    player = db.query(Player).filter(Player.id == player_id).first()
+    player = await db.get(Player, player_id, options=[selectinload(Player.current_status)])
     
     if not player:
         raise HTTPException(status_code=404, detail=f"Player with ID {player_id} not found")
     
-    # Get the player's current status
-    current_status = db.query(InjuryStatus).filter(
-        InjuryStatus.player_id == player_id
-    ).order_by(
-        desc(InjuryStatus.created_at)
-    ).first()
+    current_status = player.current_status
     
     return {
         "id": player.id,
@@ -210,7 +276,7 @@ async def get_player(
 async def search_players(
     query: str,
     limit: int = 10,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     Search for players by name.
@@ -223,12 +289,19 @@ async def search_players(
     Returns:
         List of matching players.
     """
-    # Search for players by name
-    players = db.query(Player).filter(
-        Player.name.ilike(f"%{query}%")
-    ).order_by(
-        Player.current_rank.asc() if query else Player.name.asc()
-    ).limit(limit).all()
+    if len(query) < MIN_SEARCH_LENGTH:
+        return {"players": [], "total": 0, "query": query}
+    
+    # Search for players by name (served by the trigram index on Postgres)
+    result = await db.execute(
+        select(*PLAYER_LIST_COLUMNS).filter(
+            Player.name.ilike(f"%{query}%")
+        ).order_by(
+            Player.current_rank.asc(),
+            Player.name.asc()
+        ).limit(limit)
+    )
+    players = result.all()
     
     return {
         "players": [
@@ -1,27 +1,36 @@
 """
 API endpoints for user data and authentication.
 """
+import asyncio
+import hashlib
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 from typing import Any, Dict, List, Optional
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+import bcrypt
+import orjson
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, status
+from fastapi.responses import Response
 from fastapi.security import OAuth2PasswordBearer, OAuth2PasswordRequestForm
-from jose import JWTError, jwt
-from passlib.context import CryptContext
-from pydantic import BaseModel, EmailStr, Field
-from sqlalchemy import and_, or_
-from sqlalchemy.orm import Session
+from jose import JWTError, jwk, jwt
+from pydantic import BaseModel, ConfigDict, EmailStr, Field, ValidationError, field_validator
+from sqlalchemy import bindparam, delete, select
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session, selectinload, with_parent
 
 from ...models.database import get_db
-from ...models.user import User, NotificationSetting, Team
+from ...models.user import User, NotificationSetting, Team, user_player_favorites, user_team_favorites
 from ...models.player import Player
+from ...utils.cache import TTLCache
 from ...utils.config import settings
 from ...utils.errors import AuthenticationError, AuthorizationError, ResourceNotFoundError
+from ...utils.rate_limit import hit
 
 router = APIRouter()
 
 # Security
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="token")
 
 # JWT settings
@@ -29,12 +38,33 @@ SECRET_KEY = "temporary_secret_key"  # In production, use a secure key
 ALGORITHM = "HS256"
 ACCESS_TOKEN_EXPIRE_MINUTES = 30
 
+# How long clients may reuse /me responses without revalidating
+ME_CACHE_MAX_AGE = 5
+
+# Passwords outside these bounds are rejected before running bcrypt
+MIN_PASSWORD_LENGTH = 8
+MAX_PASSWORD_LENGTH = 128
+
+# Build the HMAC key once instead of on every encode/decode
+_SIGNING_KEY = jwk.construct(SECRET_KEY, ALGORITHM)
+
+# Only the expiry and signature matter for these tokens
+_DECODE_OPTIONS = {"verify_aud": False, "verify_iss": False, "verify_jti": False, "require_exp": True}
+
+# Verified tokens -> user ID, so repeat requests skip decoding the JWT.
+# Entries never outlive the token's own expiry.
+TOKEN_CACHE_TTL = 60
+_token_cache = TTLCache(maxsize=10_000)
+
+# Built once so SQLAlchemy can reuse its compiled form
+_team_by_abbreviation = select(Team).where(Team.abbreviation == bindparam("abbreviation"))
+
 
 # Pydantic models for request/response
 class UserCreate(BaseModel):
     email: EmailStr
     username: Optional[str] = None
-    password: str
+    password: str = Field(..., min_length=MIN_PASSWORD_LENGTH, max_length=MAX_PASSWORD_LENGTH)
     email_notifications: bool = True
     push_notifications: bool = False
     web_notifications: bool = True
@@ -47,6 +77,14 @@ class UserUpdate(BaseModel):
     web_notifications: Optional[bool] = None
     quiet_hours_start: Optional[str] = None
     quiet_hours_end: Optional[str] = None
+    
+    @field_validator("email_notifications", "push_notifications", "web_notifications")
+    @classmethod
+    def not_null(cls, value: Optional[bool]) -> bool:
+        """Reject an explicit null for the non-nullable channel flags."""
+        if value is None:
+            raise ValueError("may not be null")
+        return value
 
 
 class NotificationSettingCreate(BaseModel):
@@ -58,6 +96,51 @@ class NotificationSettingCreate(BaseModel):
     min_importance: int = Field(3, ge=1, le=5)
 
 
+class UserOut(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+    
+    id: int
+    email: str
+    username: Optional[str] = None
+    email_notifications: bool
+    push_notifications: bool
+    web_notifications: bool
+    quiet_hours_start: Optional[str] = None
+    quiet_hours_end: Optional[str] = None
+    is_active: bool
+    is_verified: bool
+
+
+class TeamOut(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+    
+    name: str
+    abbreviation: str
+    city: str
+    conference: str
+    division: str
+
+
+class FavoriteTeamsOut(BaseModel):
+    teams: List[TeamOut]
+
+
+class FavoritePlayerOut(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+    
+    id: int
+    name: str
+    team: Optional[str] = None
+    position: Optional[str] = None
+    jersey_number: Optional[str] = None
+    current_rank: Optional[int] = None
+    is_top_100: bool
+
+
+class FavoritePlayersOut(BaseModel):
+    players: List[FavoritePlayerOut]
+
+
 class Token(BaseModel):
     access_token: str
     token_type: str
@@ -68,20 +151,63 @@ class TokenData(BaseModel):
 
 
 # Helper functions
+def _encode_password(password: str) -> bytes:
+    """Encode a password for bcrypt, which only uses the first 72 bytes."""
+    # Truncate like passlib did so existing hashes keep verifying
+    return password.encode("utf-8")[:72]
+
+
 def verify_password(plain_password, hashed_password):
     """Verify a password against a hash."""
-    return pwd_context.verify(plain_password, hashed_password)
+    # An empty or oversized password can't be valid, so skip the hashing
+    if not plain_password or len(plain_password) > MAX_PASSWORD_LENGTH:
+        return False
+    
+    # Anything that isn't a bcrypt hash can't match
+    if not hashed_password or not hashed_password.startswith(("$2a$", "$2b$", "$2y$")):
+        return False
+    
+    return bcrypt.checkpw(_encode_password(plain_password), hashed_password.encode("utf-8"))
 
 
 def get_password_hash(password):
     """Generate a password hash."""
-    return pwd_context.hash(password)
+    salt = bcrypt.gensalt(rounds=settings.bcrypt_rounds)
+    return bcrypt.hashpw(_encode_password(password), salt).decode("utf-8")
+
+
+# Checked against when there is no real hash, at the same cost as user hashes
+_DUMMY_HASH = get_password_hash("dummy-password")
+
+# Threads for bcrypt, which releases the GIL while hashing; one per core
+# keeps logins from queueing behind each other or blocking the event loop
+_hash_pool = ThreadPoolExecutor(max_workers=os.cpu_count() or 1, thread_name_prefix="bcrypt")
 
 
-def authenticate_user(db: Session, email: str, password: str):
+async def run_in_hash_pool(func, *args):
+    """
+    Run a password hashing function without blocking the event loop.
+    
+    Args:
+        func: verify_password or get_password_hash.
+        args: Arguments for the function.
+    
+    Returns:
+        The function's result.
+    """
+    return await asyncio.get_running_loop().run_in_executor(_hash_pool, func, *args)
+
+
+async def authenticate_user(db: Session, email: str, password: str):
     """Authenticate a user."""
-    user = db.query(User).filter(User.email == email).first()
-    if not user or not verify_password(password, user.hashed_password):
+    user = db.execute(select(User).where(User.email == email)).scalar_one_or_none()
+    
+    # Always check a hash, so unknown emails take as long as wrong passwords
+    if user is None or not user.hashed_password:
+        await run_in_hash_pool(verify_password, password, _DUMMY_HASH)
+        return None
+    
+    if not await run_in_hash_pool(verify_password, password, user.hashed_password):
         return None
     return user
 
@@ -94,10 +220,87 @@ def create_access_token(data: dict, expires_delta: Optional[timedelta] = None):
     else:
         expire = datetime.utcnow() + timedelta(minutes=ACCESS_TOKEN_EXPIRE_MINUTES)
     to_encode.update({"exp": expire})
-    encoded_jwt = jwt.encode(to_encode, SECRET_KEY, algorithm=ALGORITHM)
+    encoded_jwt = jwt.encode(to_encode, _SIGNING_KEY, algorithm=ALGORITHM)
     return encoded_jwt
 
 
+def rate_limited(scope: str):
+    """
+    Build a dependency limiting how often one client address can call an endpoint.
+    
+    Args:
+        scope: Name of the limited endpoint.
+    
+    Returns:
+        The dependency.
+    """
+    async def check_rate_limit(request: Request) -> None:
+        client_host = request.client.host if request.client else "unknown"
+        if not await hit(f"{scope}:{client_host}", settings.auth_rate_limit_per_minute, 60):
+            raise HTTPException(
+                status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+                detail="Too many requests, try again later",
+                headers={"Retry-After": "60"},
+            )
+    
+    return check_rate_limit
+
+
+def conditional_json_response(request: Request, body: bytes) -> Response:
+    """
+    Build a JSON response with an ETag, or a bodiless 304 if the client has it.
+    
+    FastAPI passes a returned Response through without applying the route's
+    response_model, so routes that have one serialize through it (with
+    model_dump_json) before calling this; the ETag is then the hash of
+    exactly what the model would have sent.
+    
+    Args:
+        request: The request, checked for If-None-Match.
+        body: The encoded JSON body.
+    
+    Returns:
+        The response.
+    """
+    etag = f'"{hashlib.blake2s(body, digest_size=8).hexdigest()}"'
+    headers = {"ETag": etag, "Cache-Control": f"private, max-age={ME_CACHE_MAX_AGE}"}
+    
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    
+    return Response(content=body, media_type="application/json", headers=headers)
+
+
+def user_id_from_token(token: str) -> Optional[int]:
+    """
+    Get the user ID from an access token.
+    
+    Args:
+        token: The access token.
+    
+    Returns:
+        The user ID, or None if the token is invalid or expired.
+    """
+    user_id = _token_cache.get(token)
+    if user_id is None:
+        try:
+            payload = jwt.decode(token, _SIGNING_KEY, algorithms=[ALGORITHM], options=_DECODE_OPTIONS)
+            if payload.get("sub") is None:
+                return None
+            token_data = TokenData(user_id=payload.get("sub"))
+        except (JWTError, ValidationError):
+            return None
+        
+        user_id = token_data.user_id
+        
+        # Only tokens that verified are cached
+        ttl = min(TOKEN_CACHE_TTL, payload["exp"] - time.time())
+        if ttl > 0:
+            _token_cache.set(token, user_id, ttl)
+    
+    return user_id
+
+
 async def get_current_user(token: str = Depends(oauth2_scheme), db: Session = Depends(get_db)):
     """Get the current authenticated user."""
     credentials_exception = HTTPException(
@@ -105,23 +308,19 @@ async def get_current_user(token: str = Depends(oauth2_scheme), db: Session = De
         detail="Could not validate credentials",
         headers={"WWW-Authenticate": "Bearer"},
     )
-    try:
-        payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
-        user_id: int = payload.get("sub")
-        if user_id is None:
-            raise credentials_exception
-        token_data = TokenData(user_id=user_id)
-    except JWTError:
+    
+    user_id = user_id_from_token(token)
+    if user_id is None:
         raise credentials_exception
     
-    user = db.query(User).filter(User.id == token_data.user_id).first()
+    user = db.get(User, user_id)
     if user is None:
         raise credentials_exception
     return user
 
 
 # Routes
-@router.post("/token", response_model=Token)
+@router.post("/token", response_model=Token, dependencies=[Depends(rate_limited("token"))])
 async def login_for_access_token(form_data: OAuth2PasswordRequestForm = Depends(), db: Session = Depends(get_db)):
     """
     Get an access token for authentication.
@@ -136,7 +335,7 @@ async def login_for_access_token(form_data: OAuth2PasswordRequestForm = Depends(
     Raises:
         HTTPException: If authentication fails.
     """
-    user = authenticate_user(db, form_data.username, form_data.password)
+    user = await authenticate_user(db, form_data.username, form_data.password)
     if not user:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
@@ -152,7 +351,7 @@ async def login_for_access_token(form_data: OAuth2PasswordRequestForm = Depends(
     return {"access_token": access_token, "token_type": "bearer"}
 
 
-@router.post("/register", status_code=status.HTTP_201_CREATED)
+@router.post("/register", status_code=status.HTTP_201_CREATED, dependencies=[Depends(rate_limited("register"))])
 async def register_user(user_data: UserCreate, db: Session = Depends(get_db)):
     """
     Register a new user.
@@ -168,7 +367,7 @@ async def register_user(user_data: UserCreate, db: Session = Depends(get_db)):
         HTTPException: If the email is already registered.
     """
     # Check if email already exists
-    existing_user = db.query(User).filter(User.email == user_data.email).first()
+    existing_user = db.execute(select(User).where(User.email == user_data.email)).scalar_one_or_none()
     if existing_user:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
@@ -176,7 +375,7 @@ async def register_user(user_data: UserCreate, db: Session = Depends(get_db)):
         )
     
     # Create new user
-    hashed_password = get_password_hash(user_data.password)
+    hashed_password = await run_in_hash_pool(get_password_hash, user_data.password)
     new_user = User(
         email=user_data.email,
         username=user_data.username,
@@ -201,32 +400,22 @@ async def register_user(user_data: UserCreate, db: Session = Depends(get_db)):
     }
 
 
-@router.get("/me")
-async def get_current_user_info(current_user: User = Depends(get_current_user)):
+@router.get("/me", response_model=UserOut)
+async def get_current_user_info(request: Request, current_user: User = Depends(get_current_user)):
     """
     Get information about the current user.
     
     Args:
+        request: The request.
         current_user: The authenticated user.
     
     Returns:
         User information.
     """
-    return {
-        "id": current_user.id,
-        "email": current_user.email,
-        "username": current_user.username,
-        "email_notifications": current_user.email_notifications,
-        "push_notifications": current_user.push_notifications,
-        "web_notifications": current_user.web_notifications,
-        "quiet_hours_start": current_user.quiet_hours_start,
-        "quiet_hours_end": current_user.quiet_hours_end,
-        "is_active": current_user.is_active,
-        "is_verified": current_user.is_verified
-    }
+    return conditional_json_response(request, UserOut.model_validate(current_user).model_dump_json().encode())
 
 
-@router.put("/me")
+@router.put("/me", response_model=UserOut)
 async def update_current_user(
     user_data: UserUpdate,
     current_user: User = Depends(get_current_user),
@@ -243,44 +432,20 @@ async def update_current_user(
     Returns:
         Updated user information.
     """
-    # Update user fields
-    if user_data.username is not None:
-        current_user.username = user_data.username
-    
-    if user_data.email_notifications is not None:
-        current_user.email_notifications = user_data.email_notifications
-    
-    if user_data.push_notifications is not None:
-        current_user.push_notifications = user_data.push_notifications
-    
-    if user_data.web_notifications is not None:
-        current_user.web_notifications = user_data.web_notifications
-    
-    if user_data.quiet_hours_start is not None:
-        current_user.quiet_hours_start = user_data.quiet_hours_start
-    
-    if user_data.quiet_hours_end is not None:
-        current_user.quiet_hours_end = user_data.quiet_hours_end
+    # Update only the fields the client sent; an explicit null clears the
+    # username or quiet hours
+    for field, value in user_data.model_dump(exclude_unset=True).items():
+        setattr(current_user, field, value)
     
     db.commit()
     db.refresh(current_user)
     
-    return {
-        "id": current_user.id,
-        "email": current_user.email,
-        "username": current_user.username,
-        "email_notifications": current_user.email_notifications,
-        "push_notifications": current_user.push_notifications,
-        "web_notifications": current_user.web_notifications,
-        "quiet_hours_start": current_user.quiet_hours_start,
-        "quiet_hours_end": current_user.quiet_hours_end,
-        "is_active": current_user.is_active,
-        "is_verified": current_user.is_verified
-    }
+    return current_user
 
 
-@router.get("/me/favorites/teams")
+@router.get("/me/favorites/teams", response_model=FavoriteTeamsOut)
 async def get_favorite_teams(
+    request: Request,
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
@@ -288,27 +453,18 @@ async def get_favorite_teams(
     Get the current user's favorite teams.
     
     Args:
+        request: The request.
         current_user: The authenticated user.
         db: Database session.
     
     Returns:
         List of favorite teams.
     """
-    # Refresh the user to get the latest favorites
-    db.refresh(current_user)
+    # Query the favorites directly; the user itself is already loaded
+    teams = db.scalars(select(Team).where(with_parent(current_user, User.favorite_teams))).all()
     
-    return {
-        "teams": [
-            {
-                "name": team.name,
-                "abbreviation": team.abbreviation,
-                "city": team.city,
-                "conference": team.conference,
-                "division": team.division
-            }
-            for team in current_user.favorite_teams
-        ]
-    }
+    response = FavoriteTeamsOut.model_validate({"teams": teams})
+    return conditional_json_response(request, response.model_dump_json().encode())
 
 
 @router.post("/me/favorites/teams/{team_abbreviation}")
@@ -332,16 +488,25 @@ async def add_favorite_team(
         HTTPException: If the team is not found.
     """
     # Find the team
-    team = db.query(Team).filter(Team.abbreviation == team_abbreviation).first()
+    team = db.execute(_team_by_abbreviation, {"abbreviation": team_abbreviation}).scalar_one_or_none()
     if not team:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Team with abbreviation {team_abbreviation} not found"
         )
     
-    # Add to favorites if not already there
-    if team not in current_user.favorite_teams:
-        current_user.favorite_teams.append(team)
+    # Add to favorites if not already there, using the association table
+    # directly rather than loading the whole collection
+    is_favorite = db.execute(
+        select(
+            select(user_team_favorites.c.team_id).where(
+                user_team_favorites.c.user_id == current_user.id,
+                user_team_favorites.c.team_id == team.id
+            ).exists()
+        )
+    ).scalar()
+    if not is_favorite:
+        db.execute(user_team_favorites.insert().values(user_id=current_user.id, team_id=team.id))
         db.commit()
     
     return {"message": f"Team {team.name} added to favorites"}
@@ -365,7 +530,7 @@ async def remove_favorite_team(
         Success message.
     """
     # Find the team
-    team = db.query(Team).filter(Team.abbreviation == team_abbreviation).first()
+    team = db.execute(_team_by_abbreviation, {"abbreviation": team_abbreviation}).scalar_one_or_none()
     if not team:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -373,15 +538,20 @@ async def remove_favorite_team(
         )
     
     # Remove from favorites if present
-    if team in current_user.favorite_teams:
-        current_user.favorite_teams.remove(team)
-        db.commit()
+    db.execute(
+        user_team_favorites.delete().where(
+            user_team_favorites.c.user_id == current_user.id,
+            user_team_favorites.c.team_id == team.id
+        )
+    )
+    db.commit()
     
     return {"message": f"Team {team.name} removed from favorites"}
 
 
-@router.get("/me/favorites/players")
+@router.get("/me/favorites/players", response_model=FavoritePlayersOut)
 async def get_favorite_players(
+    request: Request,
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
@@ -389,29 +559,18 @@ async def get_favorite_players(
     Get the current user's favorite players.
     
     Args:
+        request: The request.
         current_user: The authenticated user.
         db: Database session.
     
     Returns:
         List of favorite players.
     """
-    # Refresh the user to get the latest favorites
-    db.refresh(current_user)
+    # Query the favorites directly; the user itself is already loaded
+    players = db.scalars(select(Player).where(with_parent(current_user, User.favorite_players))).all()
     
-    return {
-        "players": [
-            {
-                "id": player.id,
-                "name": player.name,
-                "team": player.team,
-                "position": player.position,
-                "jersey_number": player.jersey_number,
-                "current_rank": player.current_rank,
-                "is_top_100": player.is_top_100
-            }
-            for player in current_user.favorite_players
-        ]
-    }
+    response = FavoritePlayersOut.model_validate({"players": players})
+    return conditional_json_response(request, response.model_dump_json().encode())
 
 
 @router.post("/me/favorites/players/{player_id}")
@@ -435,16 +594,25 @@ async def add_favorite_player(
         HTTPException: If the player is not found.
     """
     # Find the player
-    player = db.query(Player).filter(Player.id == player_id).first()
+    player = db.get(Player, player_id)
     if not player:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Player with ID {player_id} not found"
         )
     
-    # Add to favorites if not already there
-    if player not in current_user.favorite_players:
-        current_user.favorite_players.append(player)
+    # Add to favorites if not already there, using the association table
+    # directly rather than loading the whole collection
+    is_favorite = db.execute(
+        select(
+            select(user_player_favorites.c.player_id).where(
+                user_player_favorites.c.user_id == current_user.id,
+                user_player_favorites.c.player_id == player.id
+            ).exists()
+        )
+    ).scalar()
+    if not is_favorite:
+        db.execute(user_player_favorites.insert().values(user_id=current_user.id, player_id=player.id))
         db.commit()
     
     return {"message": f"Player {player.name} added to favorites"}
@@ -468,7 +636,7 @@ async def remove_favorite_player(
         Success message.
     """
     # Find the player
-    player = db.query(Player).filter(Player.id == player_id).first()
+    player = db.get(Player, player_id)
     if not player:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -476,15 +644,20 @@ async def remove_favorite_player(
         )
     
     # Remove from favorites if present
-    if player in current_user.favorite_players:
-        current_user.favorite_players.remove(player)
-        db.commit()
+    db.execute(
+        user_player_favorites.delete().where(
+            user_player_favorites.c.user_id == current_user.id,
+            user_player_favorites.c.player_id == player.id
+        )
+    )
+    db.commit()
     
     return {"message": f"Player {player.name} removed from favorites"}
 
 
 @router.get("/me/notification-settings")
 async def get_notification_settings(
+    request: Request,
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
@@ -492,16 +665,23 @@ async def get_notification_settings(
     Get the current user's notification settings.
     
     Args:
+        request: The request.
         current_user: The authenticated user.
         db: Database session.
     
     Returns:
         List of notification settings.
     """
-    # Refresh the user to get the latest settings
-    db.refresh(current_user)
-    
-    return {
+    # Query the settings directly, preloading their players rather than
+    # lazy loading each setting's player
+    notification_settings = db.scalars(
+        select(NotificationSetting)
+        .where(with_parent(current_user, User.notification_settings))
+        .options(selectinload(NotificationSetting.player))
+    ).all()
+    
+    # Plain dicts of primitives, so hand them straight to orjson
+    body = orjson.dumps({
         "settings": [
             {
                 "id": setting.id,
@@ -513,9 +693,11 @@ async def get_notification_settings(
                 "web_enabled": setting.web_enabled,
                 "min_importance": setting.min_importance
             }
-            for setting in current_user.notification_settings
+            for setting in notification_settings
         ]
-    }
+    })
+    
+    return conditional_json_response(request, body)
 
 
 @router.post("/me/notification-settings")
@@ -545,20 +727,23 @@ async def create_notification_setting(
             detail="Either player_id or team must be provided"
         )
     
-    # Check if a setting already exists for this player/team
-    existing_setting = db.query(NotificationSetting).filter(
-        NotificationSetting.user_id == current_user.id,
-        or_(
-            and_(
-                NotificationSetting.player_id == setting_data.player_id,
-                setting_data.player_id is not None
-            ),
-            and_(
-                NotificationSetting.team == setting_data.team,
-                setting_data.team is not None
+    # Check if a setting already exists for this player/team (each check
+    # is a lookup on one of the unique indexes)
+    existing_setting = None
+    if setting_data.player_id is not None:
+        existing_setting = db.execute(
+            select(NotificationSetting.id).where(
+                NotificationSetting.user_id == current_user.id,
+                NotificationSetting.player_id == setting_data.player_id
             )
-        )
-    ).first()
+        ).first()
+    if existing_setting is None and setting_data.team is not None:
+        existing_setting = db.execute(
+            select(NotificationSetting.id).where(
+                NotificationSetting.user_id == current_user.id,
+                NotificationSetting.team == setting_data.team
+            )
+        ).first()
     
     if existing_setting:
         raise HTTPException(
@@ -568,7 +753,7 @@ async def create_notification_setting(
     
     # Validate player_id if provided
     if setting_data.player_id is not None:
-        player = db.query(Player).filter(Player.id == setting_data.player_id).first()
+        player = db.get(Player, setting_data.player_id)
         if not player:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
@@ -587,7 +772,15 @@ async def create_notification_setting(
     )
     
     db.add(new_setting)
-    db.commit()
+    try:
+        db.commit()
+    except IntegrityError:
+        # A concurrent request created the same setting first
+        db.rollback()
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="A notification setting already exists for this player or team"
+        )
     db.refresh(new_setting)
     
     return {
@@ -622,20 +815,21 @@ async def delete_notification_setting(
     Raises:
         HTTPException: If the setting is not found or doesn't belong to the user.
     """
-    # Find the setting
-    setting = db.query(NotificationSetting).filter(
-        NotificationSetting.id == setting_id,
-        NotificationSetting.user_id == current_user.id
-    ).first()
+    # Delete the setting in one statement, without loading it first
+    result = db.execute(
+        delete(NotificationSetting).where(
+            NotificationSetting.id == setting_id,
+            NotificationSetting.user_id == current_user.id
+        )
+    )
     
-    if not setting:
+    if result.rowcount == 0:
+        db.rollback()
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Notification setting with ID {setting_id} not found or doesn't belong to you"
         )
     
-    # Delete the setting
-    db.delete(setting)
     db.commit()
     
     return {"message": f"Notification setting with ID {setting_id} deleted"}
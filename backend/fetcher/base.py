@@ -1,13 +1,15 @@
 """
 Base fetcher classes for the NBA Injury Alert system.
 """
+import asyncio
 import hashlib
-import json
+import random
 from abc import ABC, abstractmethod
 from datetime import datetime
 from typing import Any, Dict, List, Optional, Union
 
 import httpx
+import orjson
 
 from ..utils.config import settings
 from ..utils.errors import FetcherError
@@ -16,6 +18,9 @@ from ..utils.logging import logger, setup_logger
 # Create a logger for the fetcher module
 fetcher_logger = setup_logger("nba_injury_alert.fetcher")
 
+# Upper bound on the backoff between request retries
+MAX_RETRY_DELAY_SECONDS = 30
+
 
 class BaseFetcher(ABC):
     """Base class for data fetchers."""
@@ -46,20 +51,27 @@ class BaseFetcher(ABC):
         pass
     
     @staticmethod
-    def generate_hash(data: Union[str, Dict[str, Any], List[Any]]) -> str:
+    def generate_hash(data: Union[bytes, str, Dict[str, Any], List[Any]]) -> str:
         """
         Generate a hash for the given data.
         
         Args:
-            data: The data to hash.
+            data: The data to hash (bytes are hashed as-is).
         
         Returns:
             The hash as a hexadecimal string.
         """
-        if isinstance(data, (dict, list)):
-            data = json.dumps(data, sort_keys=True)
+        # orjson serializes straight to canonical UTF-8 bytes
+        if isinstance(data, bytes):
+            payload = data
+        elif isinstance(data, (dict, list)):
+            payload = orjson.dumps(data, option=orjson.OPT_SORT_KEYS)
+        else:
+            payload = data.encode("utf-8")
         
-        return hashlib.sha256(data.encode("utf-8")).hexdigest()
+        # Only used to detect changed reports, so a fast non-SHA-2 hash is
+        # fine; a 32-byte digest keeps the 64-character hex length
+        return hashlib.blake2b(payload, digest_size=32).hexdigest()
 
 
 class HttpFetcher(BaseFetcher):
@@ -84,6 +96,19 @@ class HttpFetcher(BaseFetcher):
         super().__init__(timeout=timeout, max_retries=max_retries)
         self.base_url = base_url
         self.headers = headers or {}
+        
+        # Shared client so connections are kept alive between requests. A
+        # fetcher talks to one host a request at a time, so a small pool is
+        # plenty; the cap stops retries piling up sockets on a slow host
+        self._client = httpx.AsyncClient(
+            timeout=self.timeout,
+            headers=self.headers,
+            limits=httpx.Limits(max_keepalive_connections=8, max_connections=16)
+        )
+    
+    async def aclose(self) -> None:
+        """Close the underlying HTTP client and its connections."""
+        await self._client.aclose()
     
     async def _make_request(
         self,
@@ -92,11 +117,10 @@ class HttpFetcher(BaseFetcher):
         params: Optional[Dict[str, Any]] = None,
         data: Optional[Dict[str, Any]] = None,
         json_data: Optional[Dict[str, Any]] = None,
-        headers: Optional[Dict[str, str]] = None,
-        retry_count: int = 0
+        headers: Optional[Dict[str, str]] = None
     ) -> httpx.Response:
         """
-        Make an HTTP request.
+        Make an HTTP request, retrying failures with exponential backoff.
         
         Args:
             method: HTTP method (GET, POST, etc.).
@@ -105,7 +129,6 @@ class HttpFetcher(BaseFetcher):
             data: Form data.
             json_data: JSON data.
             headers: HTTP headers.
-            retry_count: Current retry count.
         
         Returns:
             The HTTP response.
@@ -118,65 +141,84 @@ class HttpFetcher(BaseFetcher):
                 raise FetcherError("No base URL provided for relative URL")
             url = f"{self.base_url.rstrip('/')}/{url.lstrip('/')}"
         
-        merged_headers = {**self.headers, **(headers or {})}
-        
-        try:
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
-                response = await client.request(
+        for attempt in range(self.max_retries + 1):
+            delay = None
+            
+            try:
+                # The client adds self.headers; these override them per request
+                response = await self._client.request(
                     method=method,
                     url=url,
                     params=params,
                     data=data,
                     json=json_data,
-                    headers=merged_headers
+                    headers=headers
                 )
                 
                 # Check for rate limiting
                 if response.status_code == 429:
-                    retry_after = int(response.headers.get("Retry-After", "60"))
+                    retry_after = _parse_retry_after(response.headers.get("Retry-After"))
                     self.logger.warning(f"Rate limited. Retry after {retry_after} seconds.")
-                    raise FetcherError(
+                    error = FetcherError(
                         "Rate limited by the API",
                         status_code=429,
                         retry_after=retry_after
                     )
+                    delay = retry_after
                 
                 # Check for other error status codes
-                if response.status_code >= 400:
+                elif response.status_code >= 400:
                     self.logger.error(f"HTTP error: {response.status_code} - {response.text}")
-                    if retry_count < self.max_retries:
-                        retry_count += 1
-                        self.logger.info(f"Retrying request ({retry_count}/{self.max_retries})...")
-                        return await self._make_request(
-                            method, url, params, data, json_data, headers, retry_count
-                        )
-                    
-                    raise FetcherError(
+                    error = FetcherError(
                         f"HTTP error: {response.status_code}",
                         status_code=response.status_code,
                         details={"response": response.text}
                     )
                 
-                return response
+                else:
+                    return response
                 
-        except httpx.TimeoutException:
-            self.logger.error(f"Request timed out: {url}")
-            if retry_count < self.max_retries:
-                retry_count += 1
-                self.logger.info(f"Retrying request ({retry_count}/{self.max_retries})...")
-                return await self._make_request(
-                    method, url, params, data, json_data, headers, retry_count
-                )
+            except httpx.TimeoutException:
+                self.logger.error(f"Request timed out: {url}")
+                error = FetcherError("Request timed out after retries")
+                
+            except httpx.RequestError as e:
+                self.logger.error(f"Request error: {str(e)}")
+                error = FetcherError(f"Request error: {str(e)}")
             
-            raise FetcherError("Request timed out after retries")
+            # Don't wait after the last attempt: a rate-limited caller waits
+            # out the final Retry-After itself, from FetcherError.retry_after
+            if attempt == self.max_retries:
+                raise error
             
-        except httpx.RequestError as e:
-            self.logger.error(f"Request error: {str(e)}")
-            if retry_count < self.max_retries:
-                retry_count += 1
-                self.logger.info(f"Retrying request ({retry_count}/{self.max_retries})...")
-                return await self._make_request(
-                    method, url, params, data, json_data, headers, retry_count
-                )
+            # Back off exponentially (with a little jitter) unless the API said how long to wait
+            if delay is None:
+                delay = min(2 ** attempt, MAX_RETRY_DELAY_SECONDS) + random.random() * 0.1
             
-            raise FetcherError(f"Request error: {str(e)}")
+            self.logger.info(f"Retrying request ({attempt + 1}/{self.max_retries}) in {delay:.1f} seconds...")
+            await asyncio.sleep(delay)
+        
+        # The last attempt either returns or raises
+        raise AssertionError("unreachable")
+
+
+def _parse_retry_after(value: Optional[str]) -> int:
+    """
+    Parse a Retry-After header given in seconds.
+    
+    The wait is capped at MAX_RETRY_DELAY_SECONDS so the server can't stall
+    the fetcher indefinitely.
+    
+    Args:
+        value: The header value.
+    
+    Returns:
+        Seconds to wait, defaulting to the cap if missing or not a number of seconds.
+    """
+    if value is None:
+        return MAX_RETRY_DELAY_SECONDS
+    
+    try:
+        return min(max(0, int(value)), MAX_RETRY_DELAY_SECONDS)
+    except ValueError:
+        return MAX_RETRY_DELAY_SECONDS
@@ -2,9 +2,14 @@
 NBA-specific fetcher for injury reports.
 """
 import asyncio
-import json
-from datetime import datetime, timedelta
-from typing import Any, Dict, List, Optional, Tuple, Union
+import random
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, List, Optional, Set, Tuple, Union
+
+import httpx
+import orjson
+from sqlalchemy import select
+from sqlalchemy.exc import IntegrityError
 
 from ..models.database import db_session
 from ..models.injury import InjuryReport
@@ -12,6 +17,15 @@ from ..utils.config import settings
 from ..utils.errors import FetcherError
 from .base import HttpFetcher
 
+# Default headers to mimic a browser request
+DEFAULT_HEADERS = {
+    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36",
+    "Accept": "application/json",
+    "Accept-Language": "en-US,en;q=0.9",
+    "Referer": "https://www.nba.com/",
+    "Origin": "https://www.nba.com"
+}
+
 
 class NBAInjuryFetcher(HttpFetcher):
     """Fetcher for NBA injury reports."""
@@ -34,16 +48,7 @@ class NBAInjuryFetcher(HttpFetcher):
         """
         base_url = base_url or settings.fetcher.nba_api_base_url
         
-        # Set default headers to mimic a browser request
-        default_headers = {
-            "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36",
-            "Accept": "application/json",
-            "Accept-Language": "en-US,en;q=0.9",
-            "Referer": "https://www.nba.com/",
-            "Origin": "https://www.nba.com"
-        }
-        
-        headers = {**default_headers, **(headers or {})}
+        headers = {**DEFAULT_HEADERS, **(headers or {})}
         
         super().__init__(
             base_url=base_url,
@@ -51,6 +56,89 @@ class NBAInjuryFetcher(HttpFetcher):
             timeout=timeout,
             max_retries=max_retries
         )
+        
+        # Hashes of stored reports, loaded on the first fetch so repeat
+        # polls of an unchanged report don't need the database
+        self._known_hashes: Optional[Set[str]] = None
+        
+        # Resolve the report location once rather than on every poll
+        self._endpoint = settings.fetcher.injury_report_endpoint
+        self._source_url = f"{self.base_url}{self._endpoint}"
+        
+        # Validators from the last handled response, sent back so an
+        # unchanged report comes back as an empty 304
+        self._etag: Optional[str] = None
+        self._last_modified: Optional[str] = None
+    
+    def _load_known_hashes(self) -> Set[str]:
+        """
+        Load the hashes of all stored reports.
+        
+        Returns:
+            The set of report hashes.
+        """
+        with db_session() as session:
+            return set(session.execute(select(InjuryReport.report_hash)).scalars())
+    
+    def _store_report(self, report_hash: str, raw_content: bytes) -> Optional[int]:
+        """
+        Store a new injury report.
+        
+        Args:
+            report_hash: Hash of the raw report.
+            raw_content: The raw report body.
+        
+        Returns:
+            The new report's ID, or None if another process stored it first.
+        """
+        report = InjuryReport(
+            report_date=datetime.now(),
+            source_url=self._source_url,
+            report_hash=report_hash,
+            raw_content=InjuryReport.compress_content(raw_content)
+        )
+        
+        # Flush to assign the ID; db_session commits when the block exits
+        with db_session() as session:
+            session.add(report)
+            try:
+                session.flush()
+            except IntegrityError:
+                # Another process stored the same report first
+                session.rollback()
+                self.logger.info(f"Report with hash {report_hash} already exists in the database.")
+                return None
+            report_id = report.id
+            self.logger.info(f"Stored new injury report with ID {report_id} and hash {report_hash}.")
+        
+        return report_id
+    
+    def _conditional_headers(self) -> Dict[str, str]:
+        """
+        Get the conditional request headers for the last handled response.
+        
+        Returns:
+            The If-None-Match / If-Modified-Since headers, if any.
+        """
+        headers = {}
+        if self._etag:
+            headers["If-None-Match"] = self._etag
+        if self._last_modified:
+            headers["If-Modified-Since"] = self._last_modified
+        return headers
+    
+    def _remember_validators(self, response: httpx.Response) -> None:
+        """
+        Remember a handled response's validators for the next request.
+        
+        Only called once the report is known to be stored, so a failed
+        store is retried with a full download rather than hidden by a 304.
+        
+        Args:
+            response: The HTTP response.
+        """
+        self._etag = response.headers.get("ETag")
+        self._last_modified = response.headers.get("Last-Modified")
     
     async def fetch(self) -> Dict[str, Any]:
         """
@@ -62,64 +150,82 @@ class NBAInjuryFetcher(HttpFetcher):
         Raises:
             FetcherError: If the fetch operation fails.
         """
-        self.logger.info("Fetching NBA injury report...")
+        self.logger.debug("Fetching NBA injury report...")
         
         try:
             response = await self._make_request(
                 method="GET",
-                url=settings.fetcher.injury_report_endpoint
+                url=self._endpoint,
+                headers=self._conditional_headers()
             )
             
-            data = response.json()
+            # Nothing has changed since the last report we handled
+            if response.status_code == 304:
+                self.logger.debug("Injury report not modified since the last fetch.")
+                return {"data": None, "hash": None, "is_new": False}
             
-            # Generate a hash for the report
-            report_hash = self.generate_hash(data)
+            # Hash and store the body as received rather than re-serializing it
+            raw_content = response.content
+            report_hash = self.generate_hash(raw_content)
             
-            # Check if this report already exists in the database
-            with db_session() as session:
-                existing_report = session.query(InjuryReport).filter_by(report_hash=report_hash).first()
-                
-                if existing_report:
-                    self.logger.info(f"Report with hash {report_hash} already exists in the database.")
-                    return {"data": data, "hash": report_hash, "is_new": False}
+            # Check if this report has already been stored
+            if self._known_hashes is None:
+                self._known_hashes = await asyncio.to_thread(self._load_known_hashes)
             
-            # Store the report in the database
-            report_date = datetime.now()
-            report = InjuryReport(
-                report_date=report_date,
-                source_url=f"{self.base_url}{settings.fetcher.injury_report_endpoint}",
-                report_hash=report_hash,
-                raw_content=json.dumps(data)
-            )
+            if report_hash in self._known_hashes:
+                self.logger.debug(f"Report with hash {report_hash} already exists in the database.")
+                self._remember_validators(response)
+                return {"data": None, "hash": report_hash, "is_new": False}
+            
+            # Only a new report needs parsing (which also rejects a malformed
+            # body before it is stored)
+            data = orjson.loads(raw_content)
+            
+            # Store the report on a worker thread so the blocking commit
+            # doesn't stall the event loop
+            report_id = await asyncio.to_thread(self._store_report, report_hash, raw_content)
             
-            with db_session() as session:
-                session.add(report)
-                session.commit()
-                self.logger.info(f"Stored new injury report with ID {report.id} and hash {report_hash}.")
+            self._known_hashes.add(report_hash)
+            self._remember_validators(response)
             
-            return {"data": data, "hash": report_hash, "is_new": True, "report_id": report.id}
+            if report_id is None:
+                return {"data": data, "hash": report_hash, "is_new": False}
             
+            return {"data": data, "hash": report_hash, "is_new": True, "report_id": report_id}
+            
+        except FetcherError:
+            # Keep rate-limit details such as retry_after intact
+            raise
         except Exception as e:
             self.logger.error(f"Error fetching NBA injury report: {str(e)}")
             raise FetcherError(f"Failed to fetch NBA injury report: {str(e)}")
 
 
 class NBAInjuryPoller:
-    """Poller for NBA injury reports."""
+    """
+    Poller for NBA injury reports.
+    
+    The delay between polls starts at poll_interval and doubles (with jitter)
+    each time a poll finds no new report or fails, up to max_poll_interval.
+    It resets as soon as a new report arrives.
+    """
     
     def __init__(
         self,
         poll_interval: Optional[float] = None,
-        fetcher: Optional[NBAInjuryFetcher] = None
+        fetcher: Optional[NBAInjuryFetcher] = None,
+        max_poll_interval: Optional[float] = None
     ):
         """
         Initialize the NBA injury poller.
         
         Args:
-            poll_interval: Interval between poll attempts in seconds.
+            poll_interval: Base interval between poll attempts in seconds.
             fetcher: NBA injury fetcher instance.
+            max_poll_interval: Upper bound on the backed-off interval in seconds.
         """
         self.poll_interval = poll_interval or settings.fetcher.poll_interval_seconds
+        self.max_poll_interval = max_poll_interval or settings.fetcher.max_poll_interval_seconds
         self.fetcher = fetcher or NBAInjuryFetcher()
         self.logger = self.fetcher.logger
         self._running = False
@@ -134,6 +240,20 @@ class NBAInjuryPoller:
         """
         return await self.fetcher.fetch()
     
+    def next_delay(self, misses: int) -> float:
+        """
+        Get the jittered delay before the next poll.
+        
+        Args:
+            misses: Number of consecutive polls without a new report.
+        
+        Returns:
+            The delay in seconds.
+        """
+        # Cap the exponent so the power can't grow without bound
+        delay = min(self.max_poll_interval, self.poll_interval * 2 ** min(misses, 16))
+        return delay * random.uniform(0.5, 1.5)
+    
     async def start_polling(self, callback=None) -> None:
         """
         Start polling for NBA injury reports.
@@ -144,31 +264,53 @@ class NBAInjuryPoller:
         self._running = True
         self.logger.info(f"Starting NBA injury report polling with interval {self.poll_interval} seconds...")
         
+        # Consecutive polls that found nothing new
+        misses = 0
+        
+        loop = asyncio.get_running_loop()
+        
         while self._running:
+            retry_after = None
+            started = loop.time()
+            
             try:
                 result = await self.poll_once()
                 
-                if result.get("is_new", False) and callback:
-                    await callback(result)
+                if result.get("is_new", False):
+                    misses = 0
+                    if callback:
+                        await callback(result)
+                else:
+                    misses += 1
                 
                 self._last_report_time = datetime.now()
                 
             except FetcherError as e:
                 self.logger.error(f"Error during polling: {str(e)}")
-                
-                # If rate limited, wait for the specified time
-                if hasattr(e, "retry_after") and e.retry_after:
-                    self.logger.info(f"Rate limited. Waiting for {e.retry_after} seconds...")
-                    await asyncio.sleep(e.retry_after)
-                    continue
+                misses += 1
+                retry_after = e.retry_after
             
-            # Wait for the next poll interval
-            await asyncio.sleep(self.poll_interval)
+            # Honour Retry-After when rate limited, otherwise back off
+            if retry_after:
+                self.logger.info(f"Rate limited. Waiting for {retry_after} seconds...")
+                await asyncio.sleep(retry_after)
+            else:
+                # Count the delay from when this poll started so the time
+                # spent fetching doesn't stretch the interval
+                delay = self.next_delay(misses)
+                elapsed = loop.time() - started
+                if elapsed > delay:
+                    self.logger.warning(f"Poll took {elapsed:.1f} seconds, longer than the {delay:.1f} second interval")
+                await asyncio.sleep(max(0.0, delay - elapsed))
     
     def stop_polling(self) -> None:
         """Stop polling for NBA injury reports."""
         self._running = False
         self.logger.info("Stopped NBA injury report polling.")
+    
+    async def aclose(self) -> None:
+        """Close the fetcher's HTTP connections."""
+        await self.fetcher.aclose()
 
 
 async def poll_for_new_report(hour: int = None, minute: int = 30) -> Dict[str, Any]:
@@ -196,22 +338,28 @@ async def poll_for_new_report(hour: int = None, minute: int = 30) -> Dict[str, A
     if target_time < now:
         target_time += timedelta(hours=1)
     
-    # Wait until the target time
-    wait_seconds = (target_time - now).total_seconds()
+    # Wait until the target time, measured in UTC so a DST change before
+    # the target doesn't shift the wait by an hour
+    wait_seconds = (target_time.astimezone(timezone.utc) - datetime.now(timezone.utc)).total_seconds()
     if wait_seconds > 0:
         fetcher.logger.info(f"Waiting until {target_time.strftime('%H:%M:%S')} to start polling...")
         await asyncio.sleep(wait_seconds)
     
     # Poll until a new report is found
     fetcher.logger.info("Starting to poll for new injury report...")
-    while True:
-        try:
-            result = await poller.poll_once()
-            if result.get("is_new", False):
-                fetcher.logger.info("Found new injury report!")
-                return result
-        except Exception as e:
-            fetcher.logger.error(f"Error polling for new report: {str(e)}")
-        
-        # Wait before the next poll
-        await asyncio.sleep(poller.poll_interval)
+    loop = asyncio.get_running_loop()
+    try:
+        while True:
+            started = loop.time()
+            try:
+                result = await poller.poll_once()
+                if result.get("is_new", False):
+                    fetcher.logger.info("Found new injury report!")
+                    return result
+            except Exception as e:
+                fetcher.logger.error(f"Error polling for new report: {str(e)}")
+            
+            # Wait out the rest of the interval before the next poll
+            await asyncio.sleep(max(0.0, started + poller.poll_interval - loop.time()))
+    finally:
+        await poller.aclose()
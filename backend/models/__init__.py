@@ -5,7 +5,17 @@ from .base import Base, BaseModel
 from .player import Player, PlayerRanking
 from .injury import InjuryReport, InjuryStatus, StatusChange
 from .user import User, NotificationSetting, Team, user_team_favorites, user_player_favorites
-from .database import engine, SessionLocal, get_db, db_session, with_db_session, init_db
+from .database import (
+    engine,
+    SessionLocal,
+    async_engine,
+    AsyncSessionLocal,
+    get_db,
+    get_async_db,
+    db_session,
+    with_db_session,
+    init_db,
+)
 
 __all__ = [
     # Base models
@@ -31,7 +41,10 @@ __all__ = [
     # Database utilities
     "engine",
     "SessionLocal",
+    "async_engine",
+    "AsyncSessionLocal",
     "get_db",
+    "get_async_db",
     "db_session",
     "with_db_session",
     "init_db",
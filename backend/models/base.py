@@ -1,8 +1,8 @@
 """
 Base database models for the NBA Injury Alert system.
 """
-import datetime
-from typing import Any, Dict, List, Optional, Type, TypeVar
+import re
+from typing import Any, Dict, List, Optional, Tuple, Type, TypeVar
 
 from sqlalchemy import Column, DateTime, Integer, MetaData, func
 from sqlalchemy.ext.declarative import declarative_base, declared_attr
@@ -19,6 +19,9 @@ convention = {
 metadata = MetaData(naming_convention=convention)
 Base = declarative_base(metadata=metadata)
 
+# Matches the boundary before each inner capital letter in a class name
+_CAMEL_BOUNDARY_RE = re.compile(r"(?<!^)(?=[A-Z])")
+
 # Type variable for model classes
 ModelType = TypeVar("ModelType", bound="BaseModel")
 
@@ -36,17 +39,32 @@ class BaseModel(Base):
     def __tablename__(cls) -> str:
         """Generate table name from class name."""
         # Convert CamelCase to snake_case
-        name = cls.__name__
-        return "".join(["_" + c.lower() if c.isupper() else c for c in name]).lstrip("_")
+        return _CAMEL_BOUNDARY_RE.sub("_", cls.__name__).lower()
+    
+    @classmethod
+    def _dict_columns(cls) -> Tuple[Tuple[str, bool], ...]:
+        """
+        Get the column names to serialize, flagging the datetime columns.
+        
+        Computed once per model class, on first use once the table is mapped.
+        """
+        columns = cls.__dict__.get("_dict_columns_cache")
+        if columns is None:
+            columns = tuple(
+                (column.name, isinstance(column.type, DateTime))
+                for column in cls.__table__.columns
+            )
+            cls._dict_columns_cache = columns
+        return columns
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert model instance to dictionary."""
         result = {}
-        for column in self.__table__.columns:
-            value = getattr(self, column.name)
-            if isinstance(value, datetime.datetime):
+        for name, is_datetime in self._dict_columns():
+            value = getattr(self, name)
+            if is_datetime and value is not None:
                 value = value.isoformat()
-            result[column.name] = value
+            result[name] = value
         return result
     
     @classmethod
@@ -2,25 +2,51 @@
 Database connection and session management for the NBA Injury Alert system.
 """
 import contextlib
-from typing import Any, Callable, ContextManager, Iterator, Optional, TypeVar
+from typing import Any, AsyncIterator, Callable, Iterator, Optional, TypeVar
 
 from sqlalchemy import create_engine
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import Session, sessionmaker
 
 from ..utils.config import settings
 from ..utils.logging import logger
 
+# Compiled SQL statements cached per engine (SQLAlchemy's default is 500)
+QUERY_CACHE_SIZE = 1200
+
+# Connections are recycled before Postgres or a proxy drops them as idle;
+# each engine's pool size comes from the database settings
+POOL_RECYCLE_SECONDS = 1800
+
 # Create database engine
 engine = create_engine(
     settings.database.connection_string,
     echo=settings.debug,
-    pool_pre_ping=True
+    pool_pre_ping=True,
+    pool_size=settings.database.pool_size,
+    max_overflow=settings.database.max_overflow,
+    pool_recycle=POOL_RECYCLE_SECONDS,
+    query_cache_size=QUERY_CACHE_SIZE
 )
 
 # Create sessionmaker
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
+# Create async database engine for the API read paths
+async_engine = create_async_engine(
+    settings.database.async_connection_string,
+    echo=settings.debug,
+    pool_pre_ping=True,
+    pool_size=settings.database.async_pool_size,
+    max_overflow=settings.database.async_max_overflow,
+    pool_recycle=POOL_RECYCLE_SECONDS,
+    query_cache_size=QUERY_CACHE_SIZE
+)
+
+# Create async sessionmaker
+AsyncSessionLocal = async_sessionmaker(async_engine, autoflush=False, expire_on_commit=False)
+
 # Type variable for database functions
 T = TypeVar("T")
 
@@ -39,8 +65,19 @@ def get_db() -> Iterator[Session]:
         db.close()
 
 
+async def get_async_db() -> AsyncIterator[AsyncSession]:
+    """
+    Get an async database session.
+    
+    Yields:
+        A SQLAlchemy async session.
+    """
+    async with AsyncSessionLocal() as db:
+        yield db
+
+
 @contextlib.contextmanager
-def db_session() -> ContextManager[Session]:
+def db_session() -> Iterator[Session]:
     """
     Context manager for database sessions.
     
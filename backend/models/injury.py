@@ -1,10 +1,12 @@
 """
 Injury models for the NBA Injury Alert system.
 """
-from typing import List, Optional
+import zlib
+from typing import Any, List, Optional
 
-from sqlalchemy import Column, Integer, String, Text, DateTime, ForeignKey, Boolean
-from sqlalchemy.orm import relationship
+import orjson
+from sqlalchemy import Column, Integer, String, Text, DateTime, ForeignKey, Boolean, Index, LargeBinary
+from sqlalchemy.orm import deferred, relationship
 
 from .base import BaseModel
 
@@ -17,12 +19,32 @@ class InjuryReport(BaseModel):
     source_url = Column(String, nullable=True)
     report_hash = Column(String, nullable=False, unique=True, index=True)
     
-    # Raw report data
-    raw_content = Column(Text, nullable=False)
+    # Raw report data (zlib-compressed JSON; the repeated keys and team
+    # names compress several times over). Deferred so loading a report
+    # doesn't pull the blob unless raw_json is used
+    raw_content = deferred(Column(LargeBinary, nullable=False))
     
     # Relationships
     statuses = relationship("InjuryStatus", back_populates="report", cascade="all, delete-orphan")
     
+    @staticmethod
+    def compress_content(content: bytes) -> bytes:
+        """
+        Compress raw report JSON for storage in raw_content.
+        
+        Args:
+            content: The encoded JSON.
+        
+        Returns:
+            The compressed bytes.
+        """
+        return zlib.compress(content)
+    
+    @property
+    def raw_json(self) -> Any:
+        """The raw report, decompressed and parsed."""
+        return orjson.loads(zlib.decompress(self.raw_content))
+    
     def __repr__(self) -> str:
         """String representation of the injury report."""
         return f"<InjuryReport(id={self.id}, report_date='{self.report_date}')>"
@@ -40,18 +62,32 @@ class InjuryStatus(BaseModel):
     game_date = Column(DateTime, nullable=True, index=True)
     opponent = Column(String, nullable=True)
     
-    # Foreign keys
-    player_id = Column(Integer, ForeignKey("player.id"), nullable=False, index=True)
-    report_id = Column(Integer, ForeignKey("injury_report.id"), nullable=False, index=True)
+    # Foreign keys (indexed by the composite indexes below)
+    player_id = Column(Integer, ForeignKey("player.id"), nullable=False)
+    report_id = Column(Integer, ForeignKey("injury_report.id"), nullable=False)
     
     # Relationships
-    player = relationship("Player", back_populates="injury_statuses")
+    player = relationship("Player", back_populates="injury_statuses", foreign_keys=[player_id])
     report = relationship("InjuryReport", back_populates="statuses")
     
     # Status change tracking
     is_status_change = Column(Boolean, default=False, nullable=False, index=True)
     previous_status = Column(String, nullable=True)
     
+    __table_args__ = (
+        # Latest status per player (ORDER BY created_at DESC LIMIT 1)
+        Index("ix_injury_status_player_created", "player_id", "created_at"),
+        # A player's status in a given report
+        Index("ix_injury_status_player_report", "player_id", "report_id"),
+        # Statuses and changes in a report, covering the status columns on Postgres
+        Index(
+            "ix_injury_status_report_change",
+            "report_id",
+            "is_status_change",
+            postgresql_include=["status", "previous_status"]
+        ),
+    )
+    
     def __repr__(self) -> str:
         """String representation of the injury status."""
         return f"<InjuryStatus(id={self.id}, player_id={self.player_id}, status='{self.status}')>"
@@ -77,6 +113,11 @@ class StatusChange(BaseModel):
     player = relationship("Player")
     report = relationship("InjuryReport")
     
+    __table_args__ = (
+        # Player history (WHERE player_id = ? ORDER BY change_date DESC)
+        Index("ix_status_change_player_date", player_id, change_date.desc()),
+    )
+    
     def __repr__(self) -> str:
         """String representation of the status change."""
         return (
@@ -3,7 +3,7 @@ Player models for the NBA Injury Alert system.
 """
 from typing import List, Optional
 
-from sqlalchemy import Column, Integer, String, Boolean, ForeignKey, Table
+from sqlalchemy import DDL, Column, Integer, String, Boolean, ForeignKey, Index, Table, event, text
 from sqlalchemy.orm import relationship
 
 from .base import BaseModel
@@ -26,15 +26,55 @@ class Player(BaseModel):
     nba_id = Column(String, nullable=True, unique=True, index=True)
     espn_id = Column(String, nullable=True, unique=True)
     
+    # Latest injury status, maintained by the processor when a report lands
+    current_status_id = Column(
+        Integer,
+        ForeignKey("injury_status.id", use_alter=True),
+        nullable=True,
+        index=True
+    )
+    
     # Relationships
-    injury_statuses = relationship("InjuryStatus", back_populates="player", cascade="all, delete-orphan")
+    injury_statuses = relationship(
+        "InjuryStatus",
+        back_populates="player",
+        foreign_keys="InjuryStatus.player_id",
+        cascade="all, delete-orphan"
+    )
+    current_status = relationship("InjuryStatus", foreign_keys=[current_status_id], post_update=True)
     users = relationship("User", secondary="user_player_favorites", back_populates="favorite_players")
     
+    __table_args__ = (
+        # Trigram index so substring name searches (ILIKE '%q%') avoid a full scan
+        Index(
+            "ix_player_name_trgm",
+            "name",
+            postgresql_using="gin",
+            postgresql_ops={"name": "gin_trgm_ops"}
+        ).ddl_if(dialect="postgresql"),
+        # Partial covering index for the processor's top player lookup, so
+        # it reads only the top 100 entries without touching the table
+        Index(
+            "ix_player_top_100_nba_id",
+            "nba_id",
+            postgresql_where=text("is_top_100"),
+            postgresql_include=["current_rank"]
+        ).ddl_if(dialect="postgresql"),
+    )
+    
     def __repr__(self) -> str:
         """String representation of the player."""
         return f"<Player(id={self.id}, name='{self.name}', team='{self.team}', rank={self.current_rank})>"
 
 
+# The trigram index needs the pg_trgm extension
+event.listen(
+    Player.__table__,
+    "before_create",
+    DDL("CREATE EXTENSION IF NOT EXISTS pg_trgm").execute_if(dialect="postgresql")
+)
+
+
 class PlayerRanking(BaseModel):
     """Player ranking snapshot model."""
     
@@ -3,7 +3,7 @@ User models for the NBA Injury Alert system.
 """
 from typing import List, Optional, Set
 
-from sqlalchemy import Column, Integer, String, Boolean, ForeignKey, Table
+from sqlalchemy import Column, Integer, String, Boolean, ForeignKey, Index, Table
 from sqlalchemy.orm import relationship
 
 from .base import BaseModel
@@ -70,6 +70,7 @@ class NotificationSetting(BaseModel):
     
     # What this setting applies to
     player_id = Column(Integer, ForeignKey("player.id"), nullable=True, index=True)
+    player = relationship("Player")
     team = Column(String, nullable=True, index=True)
     
     # Notification channels
@@ -80,6 +81,26 @@ class NotificationSetting(BaseModel):
     # Minimum importance to trigger notification (1-5, where 1 is most important)
     min_importance = Column(Integer, default=3, nullable=False)
     
+    __table_args__ = (
+        # At most one setting per user and player, and per user and team
+        Index(
+            "ix_notification_setting_user_player",
+            "user_id",
+            "player_id",
+            unique=True,
+            postgresql_where=player_id.isnot(None),
+            sqlite_where=player_id.isnot(None)
+        ),
+        Index(
+            "ix_notification_setting_user_team",
+            "user_id",
+            "team",
+            unique=True,
+            postgresql_where=team.isnot(None),
+            sqlite_where=team.isnot(None)
+        ),
+    )
+    
     def __repr__(self) -> str:
         """String representation of the notification setting."""
         target = f"player_id={self.player_id}" if self.player_id else f"team='{self.team}'"
@@ -2,7 +2,7 @@
 Notifier components for the NBA Injury Alert system.
 """
 from .base import BaseNotifier, NotificationFormatter
-from .channels import EmailNotifier, WebSocketNotifier, PushNotifier
+from .channels import EmailNotifier, WebSocketNotifier, WebSocketPublisher, PushNotifier
 from .service import NotificationService, notification_service
 
 __all__ = [
@@ -13,6 +13,7 @@ __all__ = [
     # Channel notifiers
     "EmailNotifier",
     "WebSocketNotifier",
+    "WebSocketPublisher",
     "PushNotifier",
     
     # Service
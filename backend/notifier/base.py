@@ -1,6 +1,8 @@
 """
 Base notifier classes for the NBA Injury Alert system.
 """
+import functools
+import html
 from abc import ABC, abstractmethod
 from typing import Any, Dict, List, Optional, Set, Tuple, Union
 
@@ -10,6 +12,26 @@ from ..utils.logging import logger, setup_logger
 # Create a logger for the notifier module
 notifier_logger = setup_logger("nba_injury_alert.notifier")
 
+# Formatted notifications cached per distinct change; a flush formats the
+# same change once for every subscriber
+FORMAT_CACHE_SIZE = 1024
+
+# HTML template for an injury status change (values are escaped before filling)
+INJURY_CHANGE_HTML = """
+        <div class="injury-alert {change_type}">
+            <div class="player-info">
+                <h3>{player_name}</h3>
+                <div class="team">{team}</div>
+                {rank}
+            </div>
+            <div class="status-info">
+                <div class="status-change">{status_text}</div>
+                {reason}
+                {details}
+            </div>
+        </div>
+        """
+
 
 class BaseNotifier(ABC):
     """Base class for notifiers."""
@@ -89,33 +111,8 @@ class NotificationFormatter:
         Returns:
             Dictionary with formatted subject and message.
         """
-        # Format the subject
-        if old_status is None:
-            subject = f"{player_name} ({team}) added to injury report: {new_status}"
-        elif new_status == "ACTIVE":
-            subject = f"{player_name} ({team}) removed from injury report"
-        else:
-            subject = f"{player_name} ({team}) status change: {old_status} → {new_status}"
-        
-        # Format the message
-        message_parts = [
-            f"Player: {player_name}",
-            f"Team: {team}",
-        ]
-        
-        if old_status is None:
-            message_parts.append(f"Status: {new_status}")
-        else:
-            message_parts.append(f"Previous Status: {old_status}")
-            message_parts.append(f"New Status: {new_status}")
-        
-        if reason:
-            message_parts.append(f"Reason: {reason}")
-        
-        if details:
-            message_parts.append(f"Details: {details}")
-        
-        message = "\n".join(message_parts)
+        # The text is cached; each caller gets its own dict
+        subject, message = _format_injury_change_text(player_name, team, old_status, new_status, reason, details)
         
         return {
             "subject": subject,
@@ -123,6 +120,7 @@ class NotificationFormatter:
         }
     
     @staticmethod
+    @functools.lru_cache(maxsize=FORMAT_CACHE_SIZE)
     def format_html_injury_change(
         player_name: str,
         team: str,
@@ -145,8 +143,12 @@ class NotificationFormatter:
             rank: Player's rank.
         
         Returns:
-            HTML formatted message.
+            HTML formatted message, with the player and status text escaped.
         """
+        player_name = html.escape(player_name)
+        team = html.escape(team)
+        new_status = html.escape(new_status)
+        
         # Determine status change type
         if old_status is None:
             status_text = f"<span class='status new'>{new_status}</span>"
@@ -155,23 +157,68 @@ class NotificationFormatter:
             status_text = "<span class='status active'>ACTIVE</span>"
             change_type = "removed"
         else:
-            status_text = f"<span class='status old'>{old_status}</span> → <span class='status new'>{new_status}</span>"
+            status_text = f"<span class='status old'>{html.escape(old_status)}</span> → <span class='status new'>{new_status}</span>"
             change_type = "changed"
         
-        # Format the HTML
-        html = f"""
-        <div class="injury-alert {change_type}">
-            <div class="player-info">
-                <h3>{player_name}</h3>
-                <div class="team">{team}</div>
-                {f'<div class="rank">Rank: {rank}</div>' if rank else ''}
-            </div>
-            <div class="status-info">
-                <div class="status-change">{status_text}</div>
-                {f'<div class="reason">{reason}</div>' if reason else ''}
-                {f'<div class="details">{details}</div>' if details else ''}
-            </div>
-        </div>
-        """
-        
-        return html
+        # Fill in the HTML template
+        return INJURY_CHANGE_HTML.format(
+            change_type=change_type,
+            player_name=player_name,
+            team=team,
+            rank=f'<div class="rank">Rank: {rank}</div>' if rank else '',
+            status_text=status_text,
+            reason=f'<div class="reason">{html.escape(reason)}</div>' if reason else '',
+            details=f'<div class="details">{html.escape(details)}</div>' if details else ''
+        )
+
+
+@functools.lru_cache(maxsize=FORMAT_CACHE_SIZE)
+def _format_injury_change_text(
+    player_name: str,
+    team: str,
+    old_status: Optional[str],
+    new_status: str,
+    reason: Optional[str],
+    details: Optional[str]
+) -> Tuple[str, str]:
+    """
+    Format the subject and plain text message of an injury status change.
+    
+    Args:
+        player_name: Name of the player.
+        team: Team of the player.
+        old_status: Previous injury status.
+        new_status: New injury status.
+        reason: Reason for the status.
+        details: Additional details.
+    
+    Returns:
+        Tuple of (subject, message).
+    """
+    # Format the subject
+    if old_status is None:
+        subject = f"{player_name} ({team}) added to injury report: {new_status}"
+    elif new_status == "ACTIVE":
+        subject = f"{player_name} ({team}) removed from injury report"
+    else:
+        subject = f"{player_name} ({team}) status change: {old_status} → {new_status}"
+    
+    # Format the message
+    message_parts = [
+        f"Player: {player_name}",
+        f"Team: {team}",
+    ]
+    
+    if old_status is None:
+        message_parts.append(f"Status: {new_status}")
+    else:
+        message_parts.append(f"Previous Status: {old_status}")
+        message_parts.append(f"New Status: {new_status}")
+    
+    if reason:
+        message_parts.append(f"Reason: {reason}")
+    
+    if details:
+        message_parts.append(f"Details: {details}")
+    
+    return subject, "\n".join(message_parts)
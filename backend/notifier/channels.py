@@ -2,22 +2,44 @@
 Notification channel implementations for the NBA Injury Alert system.
 """
 import asyncio
-import json
-import smtplib
 from email.mime.multipart import MIMEMultipart
 from email.mime.text import MIMEText
-from typing import Any, Dict, List, Optional, Set, Tuple, Union
+from typing import Any, Dict, Iterator, List, Optional, Set, Tuple, Union
 
 import aiosmtplib
+import orjson
 from fastapi import WebSocket
 
 from ..utils.config import settings
 from ..utils.errors import NotifierError
+from ..utils.pubsub import WEBSOCKET_CHANNEL, publish
 from .base import BaseNotifier, NotificationFormatter
 
+# To header for a message sent to several recipients who shouldn't see each other
+UNDISCLOSED_RECIPIENTS = "undisclosed-recipients:;"
+
 
 class EmailNotifier(BaseNotifier):
-    """Email notification channel."""
+    """
+    Email notification channel.
+    
+    Batches are sent over a small pool of SMTP connections, each reused for
+    up to MAX_MESSAGES_PER_CONNECTION emails before reconnecting. Sends are
+    paced to email_max_per_second, and temporarily refused emails are
+    retried with exponential backoff.
+    """
+    
+    # Concurrent SMTP connections per batch
+    POOL_SIZE = 5
+    
+    # Emails sent over one connection before reconnecting (providers cap this)
+    MAX_MESSAGES_PER_CONNECTION = 100
+    
+    # Recipients of one identical message (providers cap RCPTs per message)
+    MAX_RECIPIENTS_PER_MESSAGE = 50
+    
+    # Retries for an email the server temporarily refuses (4xx replies)
+    MAX_SEND_RETRIES = 3
     
     def __init__(
         self,
@@ -43,6 +65,57 @@ class EmailNotifier(BaseNotifier):
         self.username = username or settings.notification.email_smtp_username
         self.password = password or settings.notification.email_smtp_password
         self.from_address = from_address or settings.notification.email_from_address
+        
+        # Sends are spaced at least this far apart across all connections
+        max_per_second = settings.notification.email_max_per_second
+        self._send_interval = 1 / max_per_second if max_per_second > 0 else 0.0
+        self._next_send_time = 0.0
+    
+    def _create_client(self) -> aiosmtplib.SMTP:
+        """
+        Create an SMTP client for the configured server.
+        
+        Returns:
+            An unconnected client that logs in when it connects.
+        """
+        return aiosmtplib.SMTP(
+            hostname=self.smtp_server,
+            port=self.smtp_port,
+            username=self.username,
+            password=self.password,
+            use_tls=True
+        )
+    
+    def _build_message(
+        self,
+        recipient: str,
+        subject: str,
+        message: str,
+        html_message: Optional[str] = None,
+        parts: Optional[List[MIMEText]] = None
+    ) -> MIMEMultipart:
+        """
+        Build an email message.
+        
+        Args:
+            recipient: Recipient email address.
+            subject: Email subject.
+            message: Plain text message.
+            html_message: HTML message (optional).
+            parts: Already encoded body parts to use instead of the messages (optional).
+        
+        Returns:
+            The MIME message.
+        """
+        email_message = MIMEMultipart("alternative")
+        email_message["Subject"] = subject
+        email_message["From"] = self.from_address
+        email_message["To"] = recipient
+        
+        for part in parts or _build_body_parts(message, html_message):
+            email_message.attach(part)
+        
+        return email_message
     
     async def send_notification(
         self, 
@@ -50,6 +123,7 @@ class EmailNotifier(BaseNotifier):
         subject: str, 
         message: str, 
         html_message: Optional[str] = None,
+        client: Optional[aiosmtplib.SMTP] = None,
         **kwargs
     ) -> Dict[str, Any]:
         """
@@ -60,6 +134,8 @@ class EmailNotifier(BaseNotifier):
             subject: Email subject.
             message: Plain text message.
             html_message: HTML message (optional).
+            client: Connected SMTP client to send through; without one a
+                connection is opened just for this email.
             **kwargs: Additional parameters.
         
         Returns:
@@ -68,33 +144,15 @@ class EmailNotifier(BaseNotifier):
         Raises:
             NotifierError: If the email fails to send.
         """
-        self.logger.info(f"Sending email to {recipient}: {subject}")
+        self.logger.debug(f"Sending email to {recipient}: {subject}")
         
         try:
-            # Create message
-            email_message = MIMEMultipart("alternative")
-            email_message["Subject"] = subject
-            email_message["From"] = self.from_address
-            email_message["To"] = recipient
-            
-            # Attach plain text part
-            email_message.attach(MIMEText(message, "plain"))
-            
-            # Attach HTML part if provided
-            if html_message:
-                email_message.attach(MIMEText(html_message, "html"))
+            email_message = self._build_message(recipient, subject, message, html_message)
             
             # Send the email
-            await aiosmtplib.send(
-                email_message,
-                hostname=self.smtp_server,
-                port=self.smtp_port,
-                username=self.username,
-                password=self.password,
-                use_tls=True
-            )
+            await self._deliver(email_message, client)
             
-            self.logger.info(f"Email sent successfully to {recipient}")
+            self.logger.debug(f"Email sent successfully to {recipient}")
             
             return {
                 "success": True,
@@ -107,80 +165,384 @@ class EmailNotifier(BaseNotifier):
             self.logger.error(f"Failed to send email to {recipient}: {str(e)}")
             raise NotifierError(f"Failed to send email: {str(e)}")
     
+    async def _deliver(
+        self,
+        email_message: MIMEMultipart,
+        client: Optional[aiosmtplib.SMTP] = None,
+        recipients: Optional[List[str]] = None
+    ) -> Dict[str, aiosmtplib.SMTPResponse]:
+        """
+        Send an email within the rate limit, retrying temporary refusals.
+        
+        Args:
+            email_message: The message to send.
+            client: Connected SMTP client to send through (optional).
+            recipients: Envelope recipients (defaults to the message's To header).
+        
+        Returns:
+            The server's response for each recipient it refused, if only some were.
+        
+        Raises:
+            aiosmtplib.SMTPException: If the email can't be sent to any recipient.
+        """
+        for attempt in range(self.MAX_SEND_RETRIES + 1):
+            await self._await_send_slot()
+            
+            try:
+                if client is None:
+                    refused, _ = await aiosmtplib.send(
+                        email_message,
+                        recipients=recipients,
+                        hostname=self.smtp_server,
+                        port=self.smtp_port,
+                        username=self.username,
+                        password=self.password,
+                        use_tls=True
+                    )
+                else:
+                    # A 421 reply usually comes with the server closing the connection
+                    if not client.is_connected:
+                        await client.connect()
+                    refused, _ = await client.send_message(email_message, recipients=recipients)
+                return refused
+            except aiosmtplib.SMTPException as e:
+                if not _is_temporary_refusal(e) or attempt == self.MAX_SEND_RETRIES:
+                    raise
+                
+                delay = 2 ** attempt
+                self.logger.warning(f"SMTP server temporarily refused email ({str(e)}), retrying in {delay} seconds...")
+                await asyncio.sleep(delay)
+        
+        # The last attempt either returns or raises
+        raise AssertionError("unreachable")
+    
+    async def _await_send_slot(self) -> None:
+        """Wait until the rate limit allows another email to be sent."""
+        now = asyncio.get_running_loop().time()
+        slot = max(now, self._next_send_time)
+        self._next_send_time = slot + self._send_interval
+        
+        if slot > now:
+            await asyncio.sleep(slot - now)
+    
     async def send_batch(
         self, 
         notifications: List[Dict[str, Any]]
     ) -> List[Dict[str, Any]]:
         """
-        Send a batch of email notifications.
+        Send a batch of email notifications over a small pool of SMTP connections.
+        
+        Notifications with identical content are sent as one message addressed
+        to all of their recipients (without disclosing them to each other).
         
         Args:
             notifications: List of notification dictionaries.
         
         Returns:
-            List of notification results.
+            List of notification results, in the order of the notifications.
         
         Raises:
             NotifierError: If the batch operation fails.
         """
         self.logger.info(f"Sending batch of {len(notifications)} emails")
         
-        results = []
+        # Group the notifications by content, capping the recipients per message
+        by_content: Dict[Tuple[str, str, Optional[str]], List[int]] = {}
+        for index, notification in enumerate(notifications):
+            content = (notification["subject"], notification["message"], notification.get("html_message"))
+            by_content.setdefault(content, []).append(index)
         
-        for notification in notifications:
-            try:
-                result = await self.send_notification(
-                    recipient=notification["recipient"],
-                    subject=notification["subject"],
-                    message=notification["message"],
-                    html_message=notification.get("html_message"),
-                    **{k: v for k, v in notification.items() if k not in ["recipient", "subject", "message", "html_message"]}
-                )
-                results.append(result)
-            except Exception as e:
-                self.logger.error(f"Error sending email to {notification['recipient']}: {str(e)}")
-                results.append({
-                    "success": False,
-                    "recipient": notification["recipient"],
-                    "subject": notification["subject"],
-                    "channel": "email",
-                    "error": str(e)
-                })
+        # Encode each distinct body once, shared by all of its messages
+        groups = []
+        for (subject, message, html_message), indices in by_content.items():
+            parts = _build_body_parts(message, html_message)
+            for start in range(0, len(indices), self.MAX_RECIPIENTS_PER_MESSAGE):
+                groups.append((indices[start:start + self.MAX_RECIPIENTS_PER_MESSAGE], parts))
         
-        return results
+        results: List[Optional[Dict[str, Any]]] = [None] * len(notifications)
+        
+        # Each sender holds one connection and takes the next unsent message
+        pending = iter(groups)
+        senders = min(self.POOL_SIZE, len(groups))
+        await asyncio.gather(*(self._send_pending(notifications, pending, results) for _ in range(senders)))
+        
+        # Every group fills the slots of its notifications
+        return [result for result in results if result is not None]
+    
+    async def _send_pending(
+        self,
+        notifications: List[Dict[str, Any]],
+        pending: Iterator[Tuple[List[int], List[MIMEText]]],
+        results: List[Optional[Dict[str, Any]]]
+    ) -> None:
+        """
+        Send messages from a shared queue over one SMTP connection.
+        
+        Args:
+            notifications: The batch's notifications.
+            pending: Iterator of groups of notification indices sharing one
+                message, with the message's body parts, shared between senders.
+            results: Result list to fill in at each notification's index.
+        """
+        client = self._create_client()
+        sent = 0
+        
+        try:
+            for indices, parts in pending:
+                first = notifications[indices[0]]
+                recipients = [notifications[index]["recipient"] for index in indices]
+                
+                try:
+                    # Start a fresh session once this one reaches the per-connection cap
+                    if sent >= self.MAX_MESSAGES_PER_CONNECTION:
+                        await self._close_client(client)
+                    
+                    # Connect on first use, or again if the server dropped the connection
+                    if not client.is_connected:
+                        await client.connect()
+                        sent = 0
+                    
+                    email_message = self._build_message(
+                        recipients[0] if len(recipients) == 1 else UNDISCLOSED_RECIPIENTS,
+                        first["subject"],
+                        first["message"],
+                        first.get("html_message"),
+                        parts
+                    )
+                    refused = await self._deliver(email_message, client, recipients)
+                    sent += 1
+                    
+                    self.logger.debug(f"Email sent to {len(recipients) - len(refused)} of {len(recipients)} recipients: {first['subject']}")
+                    errors = {recipient: str(response) for recipient, response in refused.items()}
+                except Exception as e:
+                    self.logger.error(f"Error sending email to {', '.join(recipients)}: {str(e)}")
+                    errors = {recipient: str(e) for recipient in recipients}
+                
+                for index, recipient in zip(indices, recipients):
+                    result = {
+                        "success": recipient not in errors,
+                        "recipient": recipient,
+                        "subject": first["subject"],
+                        "channel": "email"
+                    }
+                    if recipient in errors:
+                        result["error"] = errors[recipient]
+                    results[index] = result
+        finally:
+            await self._close_client(client)
+    
+    async def _close_client(self, client: aiosmtplib.SMTP) -> None:
+        """
+        Close an SMTP client, politely if the connection is still up.
+        
+        Args:
+            client: The SMTP client.
+        """
+        if not client.is_connected:
+            return
+        
+        try:
+            await client.quit()
+        except aiosmtplib.SMTPException:
+            client.close()
+
+
+def _build_body_parts(message: str, html_message: Optional[str] = None) -> List[MIMEText]:
+    """
+    Build the encoded body parts of an email.
+    
+    Args:
+        message: Plain text message.
+        html_message: HTML message (optional).
+    
+    Returns:
+        The plain text part, followed by the HTML part if provided.
+    """
+    parts = [MIMEText(message, "plain")]
+    if html_message:
+        parts.append(MIMEText(html_message, "html"))
+    return parts
+
+
+def _is_temporary_refusal(error: aiosmtplib.SMTPException) -> bool:
+    """
+    Check whether an SMTP error is a temporary (4xx) refusal.
+    
+    Rate limiting and greylisting are reported this way and are worth retrying.
+    
+    Args:
+        error: The SMTP error.
+    
+    Returns:
+        True if the email may be accepted if sent again later.
+    """
+    if isinstance(error, aiosmtplib.SMTPRecipientsRefused):
+        return all(400 <= refused.code < 500 for refused in error.recipients)
+    return isinstance(error, aiosmtplib.SMTPResponseException) and 400 <= error.code < 500
 
 
 class WebSocketNotifier(BaseNotifier):
-    """WebSocket notification channel."""
+    """
+    WebSocket notification channel.
+    
+    Each client gets a bounded send queue drained by its own sender task, so a
+    slow client never holds up delivery to the others. When a client's queue is
+    full the oldest pending message is dropped.
+    """
+    
+    # Maximum number of messages buffered per client
+    SEND_QUEUE_SIZE = 64
+    
+    # Rooms a client can subscribe to for change broadcasts
+    ROOM_ALL = "all"
+    ROOM_TOP_100 = "top100"
     
     def __init__(self):
         """Initialize the WebSocket notifier."""
         super().__init__()
         self.active_connections: Dict[str, WebSocket] = {}
+        self.client_rooms: Dict[str, Set[str]] = {}
+        # Authenticated clients indexed by user ID, and each client's user
+        self.user_connections: Dict[str, Set[str]] = {}
+        self.client_users: Dict[str, str] = {}
+        self.send_queues: Dict[str, asyncio.Queue] = {}
+        self.sender_tasks: Dict[str, asyncio.Task] = {}
     
-    async def connect(self, websocket: WebSocket, client_id: str) -> None:
+    async def connect(
+        self,
+        websocket: WebSocket,
+        client_id: str,
+        rooms: Optional[Set[str]] = None,
+        user_id: Optional[str] = None
+    ) -> None:
         """
         Connect a WebSocket client.
         
         Args:
             websocket: The WebSocket connection.
             client_id: The client identifier.
+            rooms: Rooms to receive change broadcasts for (defaults to all changes).
+            user_id: The authenticated user, whose notifications the client receives.
         """
         await websocket.accept()
+        
+        # Stop the sender of any previous connection with the same ID and
+        # close its socket, so it doesn't linger unread
+        previous_task = self.sender_tasks.pop(client_id, None)
+        if previous_task:
+            previous_task.cancel()
+        self._unregister_user(client_id)
+        
+        previous_websocket = self.active_connections.get(client_id)
+        if previous_websocket is not None and previous_websocket is not websocket:
+            try:
+                await previous_websocket.close()
+            except Exception as e:
+                self.logger.debug(f"Failed to close superseded WebSocket for client {client_id}: {str(e)}")
+        
+        if user_id is not None:
+            self.client_users[client_id] = user_id
+            self.user_connections.setdefault(user_id, set()).add(client_id)
+        
+        queue: asyncio.Queue[str] = asyncio.Queue(maxsize=self.SEND_QUEUE_SIZE)
         self.active_connections[client_id] = websocket
+        self.client_rooms[client_id] = rooms or {self.ROOM_ALL}
+        self.send_queues[client_id] = queue
+        self.sender_tasks[client_id] = asyncio.create_task(
+            self._send_loop(client_id, websocket, queue)
+        )
         self.logger.info(f"WebSocket client {client_id} connected")
     
-    def disconnect(self, client_id: str) -> None:
+    def disconnect(self, client_id: str, websocket: Optional[WebSocket] = None) -> None:
         """
         Disconnect a WebSocket client.
         
         Args:
             client_id: The client identifier.
+            websocket: Only disconnect if the client is still on this connection,
+                so a superseded connection can't remove the one that replaced it.
         """
-        if client_id in self.active_connections:
+        current = self.active_connections.get(client_id)
+        if current is not None and (websocket is None or current is websocket):
             del self.active_connections[client_id]
+            self.client_rooms.pop(client_id, None)
+            self.send_queues.pop(client_id, None)
+            self._unregister_user(client_id)
+            
+            sender_task = self.sender_tasks.pop(client_id, None)
+            if sender_task and sender_task is not asyncio.current_task():
+                sender_task.cancel()
+            
             self.logger.info(f"WebSocket client {client_id} disconnected")
     
+    def _unregister_user(self, client_id: str) -> None:
+        """
+        Remove a client from the user index.
+        
+        Args:
+            client_id: The client identifier.
+        """
+        user_id = self.client_users.pop(client_id, None)
+        if user_id is None:
+            return
+        
+        client_ids = self.user_connections.get(user_id)
+        if client_ids is not None:
+            client_ids.discard(client_id)
+            if not client_ids:
+                del self.user_connections[user_id]
+    
+    def _recipient_clients(self, recipient: str) -> Set[str]:
+        """
+        Get the connected clients for a recipient.
+        
+        Only token-authenticated clients are looked up: client IDs are chosen
+        by the client, so they must never address a user's notifications.
+        
+        Args:
+            recipient: The user ID.
+        
+        Returns:
+            The IDs of the clients to deliver to.
+        """
+        return self.user_connections.get(recipient, set())
+    
+    async def _send_loop(self, client_id: str, websocket: WebSocket, queue: asyncio.Queue) -> None:
+        """
+        Deliver queued messages to a single client.
+        
+        Args:
+            client_id: The client identifier.
+            websocket: The WebSocket connection.
+            queue: The client's send queue.
+        """
+        try:
+            while True:
+                payload = await queue.get()
+                await websocket.send_text(payload)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            self.logger.error(f"Failed to send to client {client_id}: {str(e)}")
+            # Only drop the connection if it hasn't been replaced in the meantime
+            self.disconnect(client_id, websocket)
+    
+    def _enqueue(self, client_id: str, payload: str) -> None:
+        """
+        Queue a message for a client, dropping the oldest one if the queue is full.
+        
+        Args:
+            client_id: The client identifier.
+            payload: The encoded message.
+        """
+        queue = self.send_queues[client_id]
+        
+        if queue.full():
+            queue.get_nowait()
+            self.logger.warning(f"Send queue full for client {client_id}, dropped oldest message")
+        
+        queue.put_nowait(payload)
+    
     async def send_notification(
         self, 
         recipient: str, 
@@ -193,7 +555,7 @@ class WebSocketNotifier(BaseNotifier):
         Send a WebSocket notification.
         
         Args:
-            recipient: Client ID to send to.
+            recipient: User ID to send to.
             subject: Notification subject.
             message: Notification message.
             data: Additional data to include.
@@ -205,9 +567,10 @@ class WebSocketNotifier(BaseNotifier):
         Raises:
             NotifierError: If the notification fails.
         """
-        self.logger.info(f"Sending WebSocket notification to {recipient}: {subject}")
+        self.logger.debug(f"Sending WebSocket notification to {recipient}: {subject}")
         
-        if recipient not in self.active_connections:
+        client_ids = self._recipient_clients(recipient)
+        if not client_ids:
             error_msg = f"WebSocket client {recipient} not connected"
             self.logger.error(error_msg)
             raise NotifierError(error_msg)
@@ -222,9 +585,11 @@ class WebSocketNotifier(BaseNotifier):
             if data:
                 notification_data["data"] = data
             
-            await self.active_connections[recipient].send_json(notification_data)
+            payload = orjson.dumps(notification_data).decode()
+            for client_id in client_ids:
+                self._enqueue(client_id, payload)
             
-            self.logger.info(f"WebSocket notification sent successfully to {recipient}")
+            self.logger.debug(f"WebSocket notification queued for {recipient}")
             
             return {
                 "success": True,
@@ -265,20 +630,26 @@ class WebSocketNotifier(BaseNotifier):
         if data:
             notification_data["data"] = data
         
+        # Encode once and hand the same payload to every client's queue
+        payload = orjson.dumps(notification_data).decode()
+        
         successful = 0
-        failed = 0
+        failed_clients = []
         
-        for client_id, websocket in list(self.active_connections.items()):
+        for client_id in self.active_connections:
             try:
-                await websocket.send_json(notification_data)
+                self._enqueue(client_id, payload)
                 successful += 1
             except Exception as e:
-                self.logger.error(f"Failed to send to client {client_id}: {str(e)}")
-                failed += 1
-                # Remove the failed connection
-                self.disconnect(client_id)
+                self.logger.error(f"Failed to queue for client {client_id}: {str(e)}")
+                failed_clients.append(client_id)
         
-        self.logger.info(f"Broadcast complete: {successful} successful, {failed} failed")
+        # Remove the failed connections once the iteration is done
+        for client_id in failed_clients:
+            self.disconnect(client_id)
+        failed = len(failed_clients)
+        
+        self.logger.info(f"Broadcast queued: {successful} successful, {failed} failed")
         
         return {
             "success": True,
@@ -289,6 +660,44 @@ class WebSocketNotifier(BaseNotifier):
             "channel": "websocket"
         }
     
+    async def broadcast_batch(
+        self,
+        changes: List[Dict[str, Any]],
+        room: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """
+        Broadcast a list of status changes as a single frame.
+        
+        Args:
+            changes: List of status change dictionaries.
+            room: Only send to clients subscribed to this room (None for every client).
+        
+        Returns:
+            Dictionary with the broadcast result.
+        """
+        recipients = [
+            client_id for client_id, rooms in self.client_rooms.items()
+            if room is None or room in rooms
+        ]
+        
+        if not changes or not recipients:
+            return {"success": True, "total_clients": 0, "changes": len(changes), "channel": "websocket"}
+        
+        self.logger.info(f"Broadcasting {len(changes)} changes to {len(recipients)} WebSocket clients")
+        
+        # Encode once and hand the same payload to every recipient's queue
+        payload = orjson.dumps({"type": "changes", "data": changes}).decode()
+        
+        for client_id in recipients:
+            self._enqueue(client_id, payload)
+        
+        return {
+            "success": True,
+            "total_clients": len(recipients),
+            "changes": len(changes),
+            "channel": "websocket"
+        }
+    
     async def send_batch(
         self, 
         notifications: List[Dict[str, Any]]
@@ -296,40 +705,197 @@ class WebSocketNotifier(BaseNotifier):
         """
         Send a batch of WebSocket notifications.
         
+        Notifications for the same recipient are combined into a single frame,
+        sent to each of the recipient's connected clients.
+        
         Args:
             notifications: List of notification dictionaries.
         
         Returns:
             List of notification results.
-        
-        Raises:
-            NotifierError: If the batch operation fails.
         """
         self.logger.info(f"Sending batch of {len(notifications)} WebSocket notifications")
         
+        # Group the notifications by recipient
+        by_recipient: Dict[str, List[Dict[str, Any]]] = {}
+        for notification in notifications:
+            by_recipient.setdefault(notification["recipient"], []).append(notification)
+        
         results = []
         
-        for notification in notifications:
-            try:
-                result = await self.send_notification(
-                    recipient=notification["recipient"],
-                    subject=notification["subject"],
-                    message=notification["message"],
-                    data=notification.get("data"),
-                    **{k: v for k, v in notification.items() if k not in ["recipient", "subject", "message", "data"]}
-                )
-                results.append(result)
-            except Exception as e:
-                self.logger.error(f"Error sending WebSocket notification to {notification['recipient']}: {str(e)}")
+        for recipient, recipient_notifications in by_recipient.items():
+            client_ids = self._recipient_clients(recipient)
+            if client_ids:
+                frame = {
+                    "type": "notifications",
+                    "notifications": [
+                        {
+                            "subject": notification["subject"],
+                            "message": notification["message"],
+                            "data": notification.get("data")
+                        }
+                        for notification in recipient_notifications
+                    ]
+                }
+                payload = orjson.dumps(frame).decode()
+                for client_id in client_ids:
+                    self._enqueue(client_id, payload)
+                outcome: Dict[str, Any] = {"success": True}
+            else:
+                self.logger.error(f"WebSocket client {recipient} not connected")
+                outcome = {"success": False, "error": f"WebSocket client {recipient} not connected"}
+            
+            for notification in recipient_notifications:
                 results.append({
-                    "success": False,
-                    "recipient": notification["recipient"],
+                    **outcome,
+                    "recipient": recipient,
                     "subject": notification["subject"],
-                    "channel": "websocket",
-                    "error": str(e)
+                    "channel": "websocket"
                 })
         
         return results
+    
+    async def deliver(self, message: Dict[str, Any]) -> None:
+        """
+        Deliver a message published by a WebSocketPublisher to local clients.
+        
+        Args:
+            message: The published message.
+        """
+        if message["type"] == "changes":
+            await self.broadcast_batch(message["changes"], room=message.get("room"))
+        elif message["type"] == "notifications":
+            await self.send_batch(message["notifications"])
+        else:
+            self.logger.warning(f"Ignoring unknown WebSocket message type {message['type']}")
+
+
+class WebSocketPublisher(BaseNotifier):
+    """
+    WebSocket channel for processes without WebSocket clients.
+    
+    Publishes notifications to Redis, where each API process picks them up and
+    hands them to its WebSocketNotifier via deliver().
+    """
+    
+    async def _publish(self, message: Dict[str, Any]) -> None:
+        """
+        Publish a message for the API processes.
+        
+        Args:
+            message: The message to publish.
+        
+        Raises:
+            NotifierError: If the message can't be published.
+        """
+        try:
+            await publish(WEBSOCKET_CHANNEL, message)
+        except Exception as e:
+            self.logger.error(f"Failed to publish WebSocket message: {str(e)}")
+            raise NotifierError(f"Failed to publish WebSocket message: {str(e)}")
+    
+    async def send_notification(
+        self, 
+        recipient: str, 
+        subject: str, 
+        message: str, 
+        data: Optional[Dict[str, Any]] = None,
+        **kwargs
+    ) -> Dict[str, Any]:
+        """
+        Publish a WebSocket notification.
+        
+        Args:
+            recipient: User ID to send to.
+            subject: Notification subject.
+            message: Notification message.
+            data: Additional data to include.
+            **kwargs: Additional parameters.
+        
+        Returns:
+            Dictionary with the notification result.
+        
+        Raises:
+            NotifierError: If the notification can't be published.
+        """
+        await self._publish({
+            "type": "notifications",
+            "notifications": [
+                {"recipient": recipient, "subject": subject, "message": message, "data": data}
+            ]
+        })
+        
+        return {
+            "success": True,
+            "recipient": recipient,
+            "subject": subject,
+            "channel": "websocket"
+        }
+    
+    async def send_batch(
+        self, 
+        notifications: List[Dict[str, Any]]
+    ) -> List[Dict[str, Any]]:
+        """
+        Publish a batch of WebSocket notifications as a single message.
+        
+        Args:
+            notifications: List of notification dictionaries.
+        
+        Returns:
+            List of notification results.
+        """
+        self.logger.info(f"Publishing batch of {len(notifications)} WebSocket notifications")
+        
+        try:
+            await self._publish({
+                "type": "notifications",
+                "notifications": [
+                    {
+                        "recipient": notification["recipient"],
+                        "subject": notification["subject"],
+                        "message": notification["message"],
+                        "data": notification.get("data")
+                    }
+                    for notification in notifications
+                ]
+            })
+            outcome: Dict[str, Any] = {"success": True}
+        except NotifierError as e:
+            outcome = {"success": False, "error": e.message}
+        
+        return [
+            {
+                **outcome,
+                "recipient": notification["recipient"],
+                "subject": notification["subject"],
+                "channel": "websocket"
+            }
+            for notification in notifications
+        ]
+    
+    async def broadcast_batch(
+        self,
+        changes: List[Dict[str, Any]],
+        room: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """
+        Publish a list of status changes for broadcast.
+        
+        Args:
+            changes: List of status change dictionaries.
+            room: Only send to clients subscribed to this room (None for every client).
+        
+        Returns:
+            Dictionary with the publish result.
+        
+        Raises:
+            NotifierError: If the changes can't be published.
+        """
+        if changes:
+            await self._publish({"type": "changes", "changes": changes, "room": room})
+        
+        return {"success": True, "changes": len(changes), "channel": "websocket"}
 
 
 class PushNotifier(BaseNotifier):
@@ -357,11 +923,11 @@ class PushNotifier(BaseNotifier):
         Raises:
             NotifierError: If the notification fails.
         """
-        self.logger.info(f"Sending push notification to {recipient}: {subject}")
+        self.logger.debug(f"Sending push notification to {recipient}: {subject}")
         
         # This is a placeholder implementation
         # In a real implementation, this would use a push notification service
-        self.logger.info(f"Push notification would be sent to {recipient}")
+        self.logger.debug(f"Push notification would be sent to {recipient}")
         
         return {
             "success": True,
@@ -392,12 +958,8 @@ class PushNotifier(BaseNotifier):
         
         for notification in notifications:
             try:
-                result = await self.send_notification(
-                    recipient=notification["recipient"],
-                    subject=notification["subject"],
-                    message=notification["message"],
-                    **{k: v for k, v in notification.items() if k not in ["recipient", "subject", "message"]}
-                )
+                # Extra keys go straight through as send_notification's kwargs
+                result = await self.send_notification(**notification)
                 results.append(result)
             except Exception as e:
                 self.logger.error(f"Error sending push notification to {notification['recipient']}: {str(e)}")
@@ -1,10 +1,14 @@
 """
 Notification service for the NBA Injury Alert system.
 """
+import asyncio
+import functools
+from collections import defaultdict
 from datetime import datetime, time
 from typing import Any, Dict, List, Optional, Set, Tuple, Union
 
-from sqlalchemy import and_, or_
+from sqlalchemy import or_, select, update
+from sqlalchemy.orm import joinedload, selectinload
 
 from ..models.database import db_session
 from ..models.injury import StatusChange
@@ -12,20 +16,47 @@ from ..models.user import User, NotificationSetting
 from ..utils.config import settings
 from ..utils.errors import NotifierError
 from ..utils.logging import logger
-from .base import NotificationFormatter
-from .channels import EmailNotifier, WebSocketNotifier, PushNotifier
+from .base import BaseNotifier, NotificationFormatter
+from .channels import EmailNotifier, WebSocketNotifier, WebSocketPublisher, PushNotifier
 
 
 class NotificationService:
     """Service for managing and sending notifications."""
     
-    def __init__(self):
-        """Initialize the notification service."""
+    def __init__(
+        self,
+        websocket_notifier: Optional[Union[WebSocketNotifier, WebSocketPublisher]] = None
+    ):
+        """
+        Initialize the notification service.
+        
+        Args:
+            websocket_notifier: WebSocket channel to use instead of a local WebSocketNotifier.
+        """
         self.email_notifier = EmailNotifier() if settings.notification.email_enabled else None
         self.push_notifier = PushNotifier() if settings.notification.push_enabled else None
-        self.websocket_notifier = WebSocketNotifier() if settings.notification.websocket_enabled else None
+        self.websocket_notifier: Optional[Union[WebSocketNotifier, WebSocketPublisher]] = None
+        if settings.notification.websocket_enabled:
+            self.websocket_notifier = websocket_notifier or WebSocketNotifier()
         self.logger = logger
     
+    def _active_notifiers(self) -> Dict[str, BaseNotifier]:
+        """
+        Get the notifiers of the enabled channels.
+        
+        Returns:
+            The notifiers keyed by channel name.
+        """
+        return {
+            channel: notifier
+            for channel, notifier in (
+                ("email", self.email_notifier),
+                ("push", self.push_notifier),
+                ("websocket", self.websocket_notifier)
+            )
+            if notifier
+        }
+    
     async def process_status_changes(self, changes: List[Dict[str, Any]]) -> Dict[str, Any]:
         """
         Process status changes and send notifications.
@@ -38,54 +69,163 @@ class NotificationService:
         """
         self.logger.info(f"Processing {len(changes)} status changes for notifications")
         
+        # Run the synchronous queries on a worker thread so they don't block
+        # the event loop (and the WebSocket sends on it)
+        change_ids = [change["id"] for change in changes]
+        pending_ids, summaries, notifications_by_channel = await asyncio.to_thread(
+            self._collect_notifications, change_ids
+        )
+        
+        if not pending_ids:
+            self.logger.info("No status changes require notifications")
+            return {"success": True, "notifications_sent": 0}
+        
+        # Send the notifications
+        results = await self._send_notifications(notifications_by_channel)
+        
+        # Push every change in this batch to live clients as one frame per room
+        if self.websocket_notifier:
+            await self._broadcast_changes(summaries)
+        
+        # Mark the status changes as notified
+        await asyncio.to_thread(self._mark_notified, pending_ids)
+        
+        return {
+            "success": True,
+            "notifications_sent": len(results),
+            "results": results
+        }
+    
+    def _collect_notifications(
+        self,
+        change_ids: List[int]
+    ) -> Tuple[List[int], List[Dict[str, Any]], Dict[str, List[Dict[str, Any]]]]:
+        """
+        Load the status changes still to be notified and build their notifications.
+        
+        Args:
+            change_ids: IDs of the status changes.
+        
+        Returns:
+            The IDs of the changes needing notifications, a summary of each
+            change for broadcasting, and the notifications to send grouped by channel.
+        """
         # Get the list of status changes that need notifications
         with db_session() as session:
-            change_ids = [change["id"] for change in changes]
-            db_changes = session.query(StatusChange).filter(
-                StatusChange.id.in_(change_ids),
-                StatusChange.notification_sent == False
-            ).all()
+            db_changes = session.execute(
+                select(StatusChange).options(
+                    joinedload(StatusChange.player)
+                ).where(
+                    StatusChange.id.in_(change_ids),
+                    StatusChange.notification_sent == False
+                )
+            ).scalars().all()
             
             if not db_changes:
-                self.logger.info("No status changes require notifications")
-                return {"success": True, "notifications_sent": 0}
+                return [], [], {}
             
             self.logger.info(f"Found {len(db_changes)} status changes requiring notifications")
             
-            # Get the users who should receive notifications
-            notifications_to_send = []
+            # With every channel disabled there are no users to look up
+            if not self._active_notifiers():
+                return [change.id for change in db_changes], self._summarize_changes(db_changes), {}
             
-            for change in db_changes:
-                # Get users who have notification settings for this player or team
-                users = session.query(User).join(
+            # Get every active user with a setting for any changed player or
+            # their team in one query, along with all of their settings
+            player_ids = {change.player_id for change in db_changes}
+            teams = {change.player.team for change in db_changes if change.player.team}
+            rows = session.execute(
+                select(User, NotificationSetting).join(
                     NotificationSetting,
-                    and_(
-                        NotificationSetting.user_id == User.id,
-                        or_(
-                            NotificationSetting.player_id == change.player_id,
-                            NotificationSetting.team == change.player.team
-                        )
+                    NotificationSetting.user_id == User.id
+                ).options(
+                    selectinload(User.notification_settings)
+                ).where(
+                    User.is_active == True,
+                    or_(
+                        NotificationSetting.player_id.in_(player_ids),
+                        NotificationSetting.team.in_(teams)
                     )
-                ).filter(
-                    User.is_active == True
-                ).all()
+                )
+            ).all()
+            
+            # Group the users by the player and team they follow (keyed by
+            # user ID so a user is only notified once per change)
+            users_by_player: Dict[int, Dict[int, User]] = defaultdict(dict)
+            users_by_team: Dict[str, Dict[int, User]] = defaultdict(dict)
+            for user, notification_setting in rows:
+                if notification_setting.player_id in player_ids:
+                    users_by_player[notification_setting.player_id][user.id] = user
+                if notification_setting.team in teams:
+                    users_by_team[notification_setting.team][user.id] = user
+            
+            # Get the users who should receive notifications, grouped by
+            # channel as they are built so sending needs no second pass
+            notifications_by_channel: Dict[str, List[Dict[str, Any]]] = defaultdict(list)
+            
+            # Quiet hours are checked against one time for the whole batch
+            now = datetime.now().time()
+            
+            # Counts for the batch summary, logged once instead of per user
+            users_found = 0
+            quiet_skipped = 0
+            
+            # Each user's settings indexed by player and by team, built on first use
+            settings_by_user: Dict[int, Tuple[Dict[int, NotificationSetting], Dict[str, NotificationSetting]]] = {}
+            
+            for change in db_changes:
+                # Users with notification settings for this player or team
+                users = {
+                    **users_by_player.get(change.player_id, {}),
+                    **users_by_team.get(change.player.team, {})
+                }.values()
+                
+                users_found += len(users)
                 
-                self.logger.info(f"Found {len(users)} users to notify about player {change.player.name}")
+                # Format the notification once; it is the same for every user
+                formatted = NotificationFormatter.format_injury_change(
+                    player_name=change.player.name,
+                    team=change.player.team,
+                    old_status=change.old_status,
+                    new_status=change.new_status,
+                    reason=None,  # Add reason if available
+                    details=None  # Add details if available
+                )
+                
+                html_formatted = NotificationFormatter.format_html_injury_change(
+                    player_name=change.player.name,
+                    team=change.player.team,
+                    old_status=change.old_status,
+                    new_status=change.new_status,
+                    reason=None,  # Add reason if available
+                    details=None,  # Add details if available
+                    rank=change.player.current_rank
+                )
+                
+                # WebSocket payload shared by every recipient of this change
+                websocket_data = {
+                    "html": html_formatted,
+                    "player_id": change.player_id,
+                    "team": change.player.team,
+                    "old_status": change.old_status,
+                    "new_status": change.new_status,
+                    "change_id": change.id
+                }
                 
                 # Prepare notifications for each user
                 for user in users:
                     # Check if user is in quiet hours
-                    if self._is_in_quiet_hours(user):
-                        self.logger.info(f"User {user.email} is in quiet hours, skipping notification")
+                    if self._is_in_quiet_hours(user, now):
+                        quiet_skipped += 1
                         continue
                     
-                    # Get notification settings for this player/team
-                    notification_setting = next(
-                        (
-                            ns for ns in user.notification_settings
-                            if ns.player_id == change.player_id or ns.team == change.player.team
-                        ),
-                        None
+                    # Get notification settings for this player/team, preferring the player's
+                    if user.id not in settings_by_user:
+                        settings_by_user[user.id] = self._index_notification_settings(user)
+                    settings_by_player, settings_by_team = settings_by_user[user.id]
+                    notification_setting = (
+                        settings_by_player.get(change.player_id)
+                        or settings_by_team.get(change.player.team)
                     )
                     
                     # If no specific setting, use user's default preferences
@@ -98,29 +238,9 @@ class NotificationService:
                         push_enabled = user.push_notifications
                         web_enabled = user.web_notifications
                     
-                    # Format the notification
-                    formatted = NotificationFormatter.format_injury_change(
-                        player_name=change.player.name,
-                        team=change.player.team,
-                        old_status=change.old_status,
-                        new_status=change.new_status,
-                        reason=None,  # Add reason if available
-                        details=None  # Add details if available
-                    )
-                    
-                    html_formatted = NotificationFormatter.format_html_injury_change(
-                        player_name=change.player.name,
-                        team=change.player.team,
-                        old_status=change.old_status,
-                        new_status=change.new_status,
-                        reason=None,  # Add reason if available
-                        details=None,  # Add details if available
-                        rank=change.player.current_rank
-                    )
-                    
                     # Add to notifications list based on user preferences
-                    if email_enabled and self.email_notifier:
-                        notifications_to_send.append({
+                    if self.email_notifier and email_enabled:
+                        notifications_by_channel["email"].append({
                             "channel": "email",
                             "recipient": user.email,
                             "subject": formatted["subject"],
@@ -130,8 +250,8 @@ class NotificationService:
                             "change_id": change.id
                         })
                     
-                    if push_enabled and self.push_notifier:
-                        notifications_to_send.append({
+                    if self.push_notifier and push_enabled:
+                        notifications_by_channel["push"].append({
                             "channel": "push",
                             "recipient": user.id,  # Using user ID as recipient for push
                             "subject": formatted["subject"],
@@ -140,100 +260,145 @@ class NotificationService:
                             "change_id": change.id
                         })
                     
-                    if web_enabled and self.websocket_notifier:
-                        # For WebSocket, we'll broadcast to all connected clients
-                        # and let the frontend filter based on user ID
-                        notifications_to_send.append({
+                    if self.websocket_notifier and web_enabled:
+                        # Delivered to every client the user authenticated with
+                        notifications_by_channel["websocket"].append({
                             "channel": "websocket",
                             "recipient": str(user.id),  # Using user ID as recipient for WebSocket
                             "subject": formatted["subject"],
                             "message": formatted["message"],
-                            "data": {
-                                "html": html_formatted,
-                                "player_id": change.player_id,
-                                "team": change.player.team,
-                                "old_status": change.old_status,
-                                "new_status": change.new_status,
-                                "change_id": change.id
-                            },
+                            "data": websocket_data,
                             "user_id": user.id,
                             "change_id": change.id
                         })
             
-            # Send the notifications
-            results = await self._send_notifications(notifications_to_send)
-            
-            # Mark the status changes as notified
-            for change in db_changes:
-                change.notification_sent = True
-                change.notification_date = datetime.now()
-            
-            session.commit()
+            self.logger.info(
+                f"Found {users_found} users to notify about {len(db_changes)} changes "
+                f"({quiet_skipped} skipped for quiet hours), {sum(map(len, notifications_by_channel.values()))} notifications to send"
+            )
             
-            return {
-                "success": True,
-                "notifications_sent": len(results),
-                "results": results
-            }
+            return [change.id for change in db_changes], self._summarize_changes(db_changes), notifications_by_channel
     
-    async def _send_notifications(self, notifications: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    def _mark_notified(self, change_ids: List[int]) -> None:
+        """
+        Mark status changes as notified.
+        
+        Args:
+            change_ids: IDs of the status changes.
+        """
+        with db_session() as session:
+            session.execute(
+                update(StatusChange).where(
+                    StatusChange.id.in_(change_ids)
+                ).values(
+                    notification_sent=True,
+                    notification_date=datetime.now()
+                )
+            )
+    
+    async def _send_notifications(
+        self,
+        notifications_by_channel: Dict[str, List[Dict[str, Any]]]
+    ) -> List[Dict[str, Any]]:
         """
         Send notifications through appropriate channels.
         
         Args:
-            notifications: List of notification dictionaries.
+            notifications_by_channel: Notification dictionaries grouped by channel.
         
         Returns:
             List of notification results.
         """
         results = []
+        notifiers = self._active_notifiers()
         
-        # Group notifications by channel
-        email_notifications = []
-        push_notifications = []
-        websocket_notifications = []
-        
-        for notification in notifications:
-            channel = notification["channel"]
-            if channel == "email":
-                email_notifications.append(notification)
-            elif channel == "push":
-                push_notifications.append(notification)
-            elif channel == "websocket":
-                websocket_notifications.append(notification)
-        
-        # Send email notifications
-        if email_notifications and self.email_notifier:
+        # Send each channel's notifications as one batch
+        for channel, notifier in notifiers.items():
+            channel_notifications = notifications_by_channel.get(channel)
+            if not channel_notifications:
+                continue
+            
             try:
-                email_results = await self.email_notifier.send_batch(email_notifications)
-                results.extend(email_results)
+                results.extend(await notifier.send_batch(channel_notifications))
             except Exception as e:
-                self.logger.error(f"Error sending email notifications: {str(e)}")
+                self.logger.error(f"Error sending {channel} notifications: {str(e)}")
         
-        # Send push notifications
-        if push_notifications and self.push_notifier:
-            try:
-                push_results = await self.push_notifier.send_batch(push_notifications)
-                results.extend(push_results)
-            except Exception as e:
-                self.logger.error(f"Error sending push notifications: {str(e)}")
+        return results
+    
+    def _summarize_changes(self, changes: List[StatusChange]) -> List[Dict[str, Any]]:
+        """
+        Summarize status changes for broadcasting.
         
-        # Send WebSocket notifications
-        if websocket_notifications and self.websocket_notifier:
-            try:
-                websocket_results = await self.websocket_notifier.send_batch(websocket_notifications)
-                results.extend(websocket_results)
-            except Exception as e:
-                self.logger.error(f"Error sending WebSocket notifications: {str(e)}")
+        Args:
+            changes: The status changes, with their players loaded.
         
-        return results
+        Returns:
+            A summary dictionary per change.
+        """
+        return [
+            {
+                "change_id": change.id,
+                "player_id": change.player_id,
+                "player_name": change.player.name,
+                "team": change.player.team,
+                "old_status": change.old_status,
+                "new_status": change.new_status,
+                "rank": change.player.current_rank
+            }
+            for change in changes
+        ]
+    
+    async def _broadcast_changes(self, summaries: List[Dict[str, Any]]) -> None:
+        """
+        Broadcast status changes to connected WebSocket clients.
+        
+        Args:
+            summaries: Summaries of the status changes to broadcast.
+        """
+        top_100 = [
+            summary for summary in summaries
+            if summary["rank"] is not None and summary["rank"] <= 100
+        ]
+        
+        websocket_notifier = self.websocket_notifier
+        if websocket_notifier is None:
+            return
+        
+        try:
+            await websocket_notifier.broadcast_batch(summaries, room=WebSocketNotifier.ROOM_ALL)
+            await websocket_notifier.broadcast_batch(top_100, room=WebSocketNotifier.ROOM_TOP_100)
+        except Exception as e:
+            self.logger.error(f"Error broadcasting status changes: {str(e)}")
+    
+    def _index_notification_settings(
+        self,
+        user: User
+    ) -> Tuple[Dict[int, NotificationSetting], Dict[str, NotificationSetting]]:
+        """
+        Index a user's notification settings by player and by team.
+        
+        Args:
+            user: The user.
+        
+        Returns:
+            The settings keyed by player ID and the settings keyed by team.
+        """
+        settings_by_player: Dict[int, NotificationSetting] = {}
+        settings_by_team: Dict[str, NotificationSetting] = {}
+        for notification_setting in user.notification_settings:
+            if notification_setting.player_id is not None:
+                settings_by_player.setdefault(notification_setting.player_id, notification_setting)
+            if notification_setting.team is not None:
+                settings_by_team.setdefault(notification_setting.team, notification_setting)
+        return settings_by_player, settings_by_team
     
-    def _is_in_quiet_hours(self, user: User) -> bool:
+    def _is_in_quiet_hours(self, user: User, now: Optional[time] = None) -> bool:
         """
         Check if the current time is within the user's quiet hours.
         
         Args:
             user: The user to check.
+            now: The current time of day (looked up if not given).
         
         Returns:
             True if in quiet hours, False otherwise.
@@ -241,28 +406,44 @@ class NotificationService:
         if not user.quiet_hours_start or not user.quiet_hours_end:
             return False
         
-        try:
-            # Parse quiet hours
-            start_hour, start_minute = map(int, user.quiet_hours_start.split(":"))
-            end_hour, end_minute = map(int, user.quiet_hours_end.split(":"))
-            
-            start_time = time(start_hour, start_minute)
-            end_time = time(end_hour, end_minute)
-            
-            # Get current time
-            now = datetime.now().time()
-            
-            # Check if current time is in quiet hours
-            if start_time <= end_time:
-                # Simple case: quiet hours within the same day
-                return start_time <= now <= end_time
-            else:
-                # Complex case: quiet hours span midnight
-                return now >= start_time or now <= end_time
-                
-        except (ValueError, AttributeError):
+        quiet_hours = _parse_quiet_hours(user.quiet_hours_start, user.quiet_hours_end)
+        if quiet_hours is None:
             # If there's an error parsing the quiet hours, assume not in quiet hours
             return False
+        
+        start_time, end_time = quiet_hours
+        
+        # Get current time
+        if now is None:
+            now = datetime.now().time()
+        
+        # Check if current time is in quiet hours
+        if start_time <= end_time:
+            # Simple case: quiet hours within the same day
+            return start_time <= now <= end_time
+        else:
+            # Complex case: quiet hours span midnight
+            return now >= start_time or now <= end_time
+
+
+@functools.lru_cache(maxsize=4096)
+def _parse_quiet_hours(start: str, end: str) -> Optional[Tuple[time, time]]:
+    """
+    Parse a quiet hours range (users share a handful of distinct ranges).
+    
+    Args:
+        start: Start time as "HH:MM".
+        end: End time as "HH:MM".
+    
+    Returns:
+        The start and end times, or None if either can't be parsed.
+    """
+    try:
+        start_hour, start_minute = map(int, start.split(":"))
+        end_hour, end_minute = map(int, end.split(":"))
+        return time(start_hour, start_minute), time(end_hour, end_minute)
+    except (ValueError, AttributeError):
+        return None
 
 
 # Global notification service instance
@@ -71,13 +71,16 @@ class DiffProcessor(BaseProcessor):
         Args:
             current_items: The current list of items.
             previous_items: The previous list of items.
-            key_func: Function to extract a key for comparison (default: identity).
+            key_func: Function to extract a key for comparison, preferably a C-level
+                one such as operator.itemgetter("player_id") (default: the item itself).
         
         Returns:
             Items that were added.
         """
+        # Compare the items themselves rather than calling an identity function per item
         if key_func is None:
-            key_func = lambda x: x
+            previous_keys = set(previous_items)
+            return [item for item in current_items if item not in previous_keys]
         
         previous_keys = {key_func(item) for item in previous_items}
         return [item for item in current_items if key_func(item) not in previous_keys]
@@ -94,13 +97,16 @@ class DiffProcessor(BaseProcessor):
         Args:
             current_items: The current list of items.
             previous_items: The previous list of items.
-            key_func: Function to extract a key for comparison (default: identity).
+            key_func: Function to extract a key for comparison, preferably a C-level
+                one such as operator.itemgetter("player_id") (default: the item itself).
         
         Returns:
             Items that were removed.
         """
+        # Compare the items themselves rather than calling an identity function per item
         if key_func is None:
-            key_func = lambda x: x
+            current_keys = set(current_items)
+            return [item for item in previous_items if item not in current_keys]
         
         current_keys = {key_func(item) for item in current_items}
         return [item for item in previous_items if key_func(item) not in current_keys]
@@ -118,26 +124,32 @@ class DiffProcessor(BaseProcessor):
         Args:
             current_items: The current list of items.
             previous_items: The previous list of items.
-            key_func: Function to extract a key for comparison (default: identity).
+            key_func: Function to extract a key for comparison, preferably a C-level
+                one such as operator.itemgetter("player_id") (default: the item itself).
             compare_func: Function to compare items (default: equality).
         
         Returns:
             Pairs of (current_item, previous_item) that have changed.
         """
+        # Create dictionaries for faster lookup
         if key_func is None:
-            key_func = lambda x: x
+            previous_dict = {item: item for item in previous_items}
+            current_dict = {item: item for item in current_items}
+        else:
+            previous_dict = {key_func(item): item for item in previous_items}
+            current_dict = {key_func(item): item for item in current_items}
         
-        if compare_func is None:
-            compare_func = lambda x, y: x == y
+        # Find common keys (in current order)
+        common_keys = [key for key in current_dict if key in previous_dict]
         
-        # Create dictionaries for faster lookup
-        previous_dict = {key_func(item): item for item in previous_items}
-        current_dict = {key_func(item): item for item in current_items}
-        
-        # Find common keys
-        common_keys = set(previous_dict.keys()) & set(current_dict.keys())
+        # Return items that have changed, comparing inline unless told otherwise
+        if compare_func is None:
+            return [
+                (current_dict[key], previous_dict[key])
+                for key in common_keys
+                if current_dict[key] != previous_dict[key]
+            ]
         
-        # Return items that have changed
         return [
             (current_dict[key], previous_dict[key])
             for key in common_keys
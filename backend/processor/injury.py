@@ -1,10 +1,12 @@
 """
 Injury report processor for the NBA Injury Alert system.
 """
-import json
+import time
 from datetime import datetime
 from typing import Any, Dict, List, Optional, Set, Tuple, Union
 
+from sqlalchemy import insert, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.orm import Session
 
 from ..models.database import db_session
@@ -17,6 +19,10 @@ from .base import DiffProcessor
 class InjuryReportProcessor(DiffProcessor):
     """Processor for NBA injury reports."""
     
+    # How long the top player ranks are reused before being reloaded
+    # (rankings are only updated every few days)
+    TOP_PLAYERS_CACHE_SECONDS = 3600
+    
     def __init__(self, top_players_only: bool = True):
         """
         Initialize the injury report processor.
@@ -26,6 +32,10 @@ class InjuryReportProcessor(DiffProcessor):
         """
         super().__init__()
         self.top_players_only = top_players_only
+        
+        # Ranks of the top players keyed by NBA ID, and when they were loaded
+        self._top_player_ranks: Dict[str, Optional[int]] = {}
+        self._top_players_loaded_at: Optional[float] = None
     
     async def process(self, data: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -103,52 +113,25 @@ class InjuryReportProcessor(DiffProcessor):
             current_by_player = {status["player_id"]: status for status in current_statuses}
             previous_by_player = {status["player_id"]: status for status in previous_statuses}
             
-            # Find players with status changes
+            # Players in both reports whose status changed, then players new to
+            # the report, then players dropped from it (kept in report order).
+            # One pass over the current report looks each player up once
             changes = []
+            added = []
+            for player_id, status in current_by_player.items():
+                previous_status = previous_by_player.get(player_id)
+                if previous_status is None:
+                    added.append(_status_change(player_id, status, None, status["status"]))
+                elif status["status"] != previous_status["status"]:
+                    changes.append(_status_change(player_id, status, previous_status["status"], status["status"]))
+            changes += added
             
-            # Check for status changes in players present in both reports
-            for player_id, current_status in current_by_player.items():
-                if player_id in previous_by_player:
-                    prev_status = previous_by_player[player_id]
-                    if current_status["status"] != prev_status["status"]:
-                        changes.append({
-                            "player_id": player_id,
-                            "player_name": current_status["player_name"],
-                            "team": current_status["team"],
-                            "old_status": prev_status["status"],
-                            "new_status": current_status["status"],
-                            "reason": current_status.get("reason"),
-                            "details": current_status.get("details"),
-                            "rank": current_status.get("rank")
-                        })
-            
-            # Check for new players in the injury report
-            for player_id, current_status in current_by_player.items():
-                if player_id not in previous_by_player:
-                    changes.append({
-                        "player_id": player_id,
-                        "player_name": current_status["player_name"],
-                        "team": current_status["team"],
-                        "old_status": None,
-                        "new_status": current_status["status"],
-                        "reason": current_status.get("reason"),
-                        "details": current_status.get("details"),
-                        "rank": current_status.get("rank")
-                    })
-            
-            # Check for players removed from the injury report
-            for player_id, prev_status in previous_by_player.items():
-                if player_id not in current_by_player:
-                    changes.append({
-                        "player_id": player_id,
-                        "player_name": prev_status["player_name"],
-                        "team": prev_status["team"],
-                        "old_status": prev_status["status"],
-                        "new_status": "ACTIVE",  # Assuming removal means player is now active
-                        "reason": None,
-                        "details": None,
-                        "rank": prev_status.get("rank")
-                    })
+            # Assuming removal means player is now active
+            changes += [
+                _status_change(player_id, status, status["status"], "ACTIVE", include_details=False)
+                for player_id, status in previous_by_player.items()
+                if player_id not in current_by_player
+            ]
             
             # Store the changes in the database
             stored_changes = await self._store_status_changes(
@@ -180,21 +163,31 @@ class InjuryReportProcessor(DiffProcessor):
         # This is a placeholder implementation
         # In a real implementation, this would parse the NBA API response format
         # For now, we'll assume the report_data already contains a list of player statuses
-        player_statuses = []
-        
-        # Example parsing logic (adjust based on actual NBA API response format)
-        if "players" in report_data:
-            for player_data in report_data["players"]:
-                player_statuses.append({
-                    "player_id": player_data.get("personId"),
-                    "player_name": player_data.get("name"),
-                    "team": player_data.get("teamName"),
-                    "status": player_data.get("status"),
-                    "reason": player_data.get("reason"),
-                    "details": player_data.get("details"),
-                    "game_date": player_data.get("gameDate"),
-                    "opponent": player_data.get("opponent")
-                })
+        
+        # Example parsing logic (adjust based on actual NBA API response format).
+        # NBA IDs may arrive as ints from the feed but are stored as strings;
+        # convert them once here so they compare directly
+        players_data = report_data.get("players") or []
+        player_statuses = [
+            {
+                "player_id": str(person_id),
+                "player_name": player_data.get("name"),
+                "team": player_data.get("teamName"),
+                "status": player_data.get("status"),
+                "reason": player_data.get("reason"),
+                "details": player_data.get("details"),
+                "game_date": player_data.get("gameDate"),
+                "opponent": player_data.get("opponent")
+            }
+            for player_data in players_data
+            # Players are matched across reports by NBA ID, so rows without
+            # one can't be stored or diffed
+            if (person_id := player_data.get("personId")) is not None
+        ]
+        
+        skipped = len(players_data) - len(player_statuses)
+        if skipped:
+            self.logger.warning(f"Skipped {skipped} players without an NBA ID")
         
         return player_statuses
     
@@ -208,25 +201,38 @@ class InjuryReportProcessor(DiffProcessor):
         Returns:
             Filtered list of player status dictionaries.
         """
-        # Get the list of top players from the database
-        with db_session() as session:
-            top_players = session.query(Player).filter(Player.is_top_100 == True).all()
-            top_player_ids = {str(player.nba_id) for player in top_players}
+        top_player_ranks = self._get_top_player_ranks()
         
-        # Filter the player statuses
+        # Filter the player statuses, adding each player's rank
         filtered_statuses = []
         for status in player_statuses:
-            player_id = str(status.get("player_id"))
-            if player_id in top_player_ids:
-                # Get the player's rank
-                for player in top_players:
-                    if str(player.nba_id) == player_id:
-                        status["rank"] = player.current_rank
-                        break
+            player_id = status["player_id"]
+            if player_id in top_player_ranks:
+                status["rank"] = top_player_ranks[player_id]
                 filtered_statuses.append(status)
         
         return filtered_statuses
     
+    def _get_top_player_ranks(self) -> Dict[str, Optional[int]]:
+        """
+        Get the ranks of the top players, reloading them once the cache expires.
+        
+        Returns:
+            The top players' ranks keyed by NBA ID.
+        """
+        now = time.monotonic()
+        if self._top_players_loaded_at is None or now - self._top_players_loaded_at > self.TOP_PLAYERS_CACHE_SECONDS:
+            with db_session() as session:
+                self._top_player_ranks = {
+                    nba_id: current_rank
+                    for nba_id, current_rank in session.execute(
+                        select(Player.nba_id, Player.current_rank).where(Player.is_top_100 == True)
+                    )
+                }
+            self._top_players_loaded_at = now
+        
+        return self._top_player_ranks
+    
     async def _store_player_statuses(
         self, 
         player_statuses: List[Dict[str, Any]], 
@@ -242,38 +248,50 @@ class InjuryReportProcessor(DiffProcessor):
         Returns:
             List of stored player status dictionaries.
         """
-        stored_statuses = []
+        stored_statuses: List[Dict[str, Any]] = []
         
         with db_session() as session:
-            # Get the report
-            report = session.query(InjuryReport).filter_by(id=report_id).first()
-            if not report:
+            # Check the report exists without loading it
+            report_exists = session.execute(
+                select(InjuryReport.id).where(InjuryReport.id == report_id)
+            ).first()
+            if report_exists is None:
                 raise ProcessorError(f"Report with ID {report_id} not found")
             
-            # Process each player status
+            # Resolve every player at once and build the status rows
+            players_by_nba_id = self._get_or_create_players(session, player_statuses)
+            players = []
+            rows = []
             for status_data in player_statuses:
-                player_id = status_data.get("player_id")
-                
-                # Get or create the player
-                player = self._get_or_create_player(session, status_data)
+                player = players_by_nba_id[status_data["player_id"]]
+                players.append(player)
                 
-                # Create the injury status
-                injury_status = InjuryStatus(
-                    status=status_data.get("status"),
-                    reason=status_data.get("reason"),
-                    details=status_data.get("details"),
-                    game_date=status_data.get("game_date"),
-                    opponent=status_data.get("opponent"),
-                    player_id=player.id,
-                    report_id=report_id
-                )
-                
-                session.add(injury_status)
-                session.flush()  # Flush to get the ID
+                rows.append({
+                    "status": status_data.get("status"),
+                    "reason": status_data.get("reason"),
+                    "details": status_data.get("details"),
+                    "game_date": status_data.get("game_date"),
+                    "opponent": status_data.get("opponent"),
+                    "player_id": player.id,
+                    "report_id": report_id
+                })
+            
+            if not rows:
+                return stored_statuses
+            
+            # Insert every status in one batched statement, returning the IDs in row order
+            status_ids = session.scalars(
+                insert(InjuryStatus).returning(InjuryStatus.id, sort_by_parameter_order=True),
+                rows
+            ).all()
+            
+            for status_data, player, status_id in zip(player_statuses, players, status_ids):
+                # Point the player at their latest status
+                player.current_status_id = status_id
                 
                 # Add the stored status to the result
                 stored_status = status_data.copy()
-                stored_status["id"] = injury_status.id
+                stored_status["id"] = status_id
                 stored_status["player_db_id"] = player.id
                 stored_statuses.append(stored_status)
         
@@ -294,74 +312,131 @@ class InjuryReportProcessor(DiffProcessor):
         Returns:
             List of stored status change dictionaries.
         """
-        stored_changes = []
+        stored_changes: List[Dict[str, Any]] = []
         
         with db_session() as session:
-            # Process each status change
+            # Resolve every player at once and build the change rows
+            players_by_nba_id = self._get_or_create_players(session, changes)
+            players = []
+            rows = []
+            change_date = datetime.now()
             for change_data in changes:
-                player_id = change_data.get("player_id")
-                
-                # Get the player
-                player = session.query(Player).filter_by(nba_id=player_id).first()
-                if not player:
-                    # Create a minimal player record if not found
-                    player = Player(
-                        name=change_data.get("player_name"),
-                        team=change_data.get("team"),
-                        nba_id=player_id,
-                        current_rank=change_data.get("rank"),
-                        is_top_100=change_data.get("rank") is not None and change_data.get("rank") <= 100
-                    )
-                    session.add(player)
-                    session.flush()  # Flush to get the ID
-                
-                # Create the status change
-                status_change = StatusChange(
-                    player_id=player.id,
-                    old_status=change_data.get("old_status"),
-                    new_status=change_data.get("new_status"),
-                    change_date=datetime.now(),
-                    report_id=report_id,
-                    notification_sent=False
-                )
-                
-                session.add(status_change)
-                session.flush()  # Flush to get the ID
+                player = players_by_nba_id[change_data["player_id"]]
+                players.append(player)
                 
+                rows.append({
+                    "player_id": player.id,
+                    "old_status": change_data.get("old_status"),
+                    "new_status": change_data.get("new_status"),
+                    "change_date": change_date,
+                    "report_id": report_id,
+                    "notification_sent": False
+                })
+            
+            if not rows:
+                return stored_changes
+            
+            # Insert every change in one batched statement, returning the IDs in row order
+            change_ids = session.scalars(
+                insert(StatusChange).returning(StatusChange.id, sort_by_parameter_order=True),
+                rows
+            ).all()
+            
+            for change_data, player, change_id in zip(changes, players, change_ids):
                 # Add the stored change to the result
                 stored_change = change_data.copy()
-                stored_change["id"] = status_change.id
+                stored_change["id"] = change_id
                 stored_change["player_db_id"] = player.id
                 stored_changes.append(stored_change)
         
         return stored_changes
     
-    def _get_or_create_player(self, session: Session, player_data: Dict[str, Any]) -> Player:
+    def _get_or_create_players(
+        self,
+        session: Session,
+        players_data: List[Dict[str, Any]]
+    ) -> Dict[str, Player]:
         """
-        Get an existing player or create a new one.
+        Get existing players or create the missing ones, a few statements for all of them.
         
         Args:
             session: Database session.
-            player_data: Player data dictionary.
+            players_data: Player data dictionaries.
         
         Returns:
-            Player instance.
+            Player instances keyed by NBA ID.
         """
-        player_id = player_data.get("player_id")
-        
-        # Try to find the player by NBA ID
-        player = session.query(Player).filter_by(nba_id=player_id).first()
-        
-        if not player:
-            # Create a new player
-            player = Player(
-                name=player_data.get("player_name"),
-                team=player_data.get("team"),
-                nba_id=player_id,
-                current_rank=player_data.get("rank"),
-                is_top_100=player_data.get("rank") is not None and player_data.get("rank") <= 100
+        if not players_data:
+            return {}
+        
+        # Find the players that already exist by NBA ID
+        nba_ids = {player_data["player_id"] for player_data in players_data}
+        players = {
+            player.nba_id: player
+            for player in session.scalars(select(Player).where(Player.nba_id.in_(nba_ids)))
+        }
+        
+        # Create the missing players in one statement. Another process may
+        # have created some of them since the lookup above, so rows whose
+        # NBA ID already exists are skipped rather than failing the report
+        new_rows = {}
+        for player_data in players_data:
+            nba_id = player_data["player_id"]
+            if nba_id in players or nba_id in new_rows:
+                continue
+            
+            rank = player_data.get("rank")
+            new_rows[nba_id] = {
+                "name": player_data.get("player_name"),
+                "team": player_data.get("team"),
+                "nba_id": nba_id,
+                "current_rank": rank,
+                "is_top_100": rank is not None and rank <= 100
+            }
+        
+        if new_rows:
+            session.execute(
+                pg_insert(Player).values(list(new_rows.values())).on_conflict_do_nothing(
+                    index_elements=["nba_id"]
+                )
+            )
+            
+            # Load the new players, whichever process created them
+            players.update(
+                (player.nba_id, player)
+                for player in session.scalars(select(Player).where(Player.nba_id.in_(new_rows)))
             )
-            session.add(player)
-            session.flush()  # Flush to get the ID
         
-        return player
+        return players
+
+
+def _status_change(
+    player_id: str,
+    status: Dict[str, Any],
+    old_status: Optional[str],
+    new_status: str,
+    include_details: bool = True
+) -> Dict[str, Any]:
+    """
+    Build a status change dictionary for a player.
+    
+    Args:
+        player_id: The player's NBA ID.
+        status: The player's status dictionary from a report.
+        old_status: Status in the previous report (None if the player is new).
+        new_status: Status in the current report.
+        include_details: Whether to carry over the status's reason and details.
+    
+    Returns:
+        The status change dictionary.
+    """
+    return {
+        "player_id": player_id,
+        "player_name": status["player_name"],
+        "team": status["team"],
+        "old_status": old_status,
+        "new_status": new_status,
+        "reason": status.get("reason") if include_details else None,
+        "details": status.get("details") if include_details else None,
+        "rank": status.get("rank")
+    }
@@ -0,0 +1,138 @@
+"""
+Caching utilities for the NBA Injury Alert system.
+"""
+import time
+from typing import Any, Dict, Optional, Tuple
+
+import orjson
+import redis.asyncio as redis
+from redis.exceptions import RedisError
+
+from .config import settings
+from .logging import logger
+
+# Prefix applied to every cache key
+CACHE_PREFIX = "nba"
+
+# Shared Redis client (connections are opened lazily on first use)
+redis_client = redis.from_url(
+    settings.redis.connection_string,
+    socket_connect_timeout=1,
+    socket_timeout=1
+)
+
+
+class TTLCache:
+    """Bounded per-process cache whose entries expire after a per-entry TTL."""
+
+    def __init__(self, maxsize: int):
+        """
+        Initialize the cache.
+
+        Args:
+            maxsize: Maximum number of entries; the oldest is evicted beyond this.
+        """
+        self.maxsize = maxsize
+        self._entries: Dict[Any, Tuple[float, Any]] = {}
+
+    def get(self, key: Any) -> Optional[Any]:
+        """
+        Get a cached value.
+
+        Args:
+            key: The cache key.
+
+        Returns:
+            The cached value, or None on a miss or once expired.
+        """
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+
+        if entry[0] <= time.monotonic():
+            self._entries.pop(key, None)
+            return None
+
+        return entry[1]
+
+    def set(self, key: Any, value: Any, ttl: float) -> None:
+        """
+        Cache a value.
+
+        Args:
+            key: The cache key.
+            value: The value to cache.
+            ttl: Time to live in seconds.
+        """
+        if key not in self._entries and len(self._entries) >= self.maxsize:
+            self._entries.pop(next(iter(self._entries)))
+
+        self._entries[key] = (time.monotonic() + ttl, value)
+
+
+# Per-process cache of encoded responses
+_local_cache = TTLCache(maxsize=128)
+
+
+def _make_key(key: str) -> str:
+    """Namespace a cache key."""
+    return f"{CACHE_PREFIX}:{key}"
+
+
+async def cache_get(key: str) -> Optional[Any]:
+    """
+    Get a cached value.
+
+    Args:
+        key: The cache key.
+
+    Returns:
+        The cached value, or None on a miss or if Redis is unavailable.
+    """
+    try:
+        value = await redis_client.get(_make_key(key))
+    except RedisError as e:
+        logger.warning(f"Cache read failed for {key}: {str(e)}")
+        return None
+
+    return orjson.loads(value) if value is not None else None
+
+
+async def cache_set(key: str, value: Any, ttl: int) -> None:
+    """
+    Cache a JSON-serializable value.
+
+    Args:
+        key: The cache key.
+        value: The value to cache.
+        ttl: Time to live in seconds.
+    """
+    try:
+        await redis_client.setex(_make_key(key), ttl, orjson.dumps(value))
+    except RedisError as e:
+        logger.warning(f"Cache write failed for {key}: {str(e)}")
+
+
+def local_cache_get(key: str) -> Optional[bytes]:
+    """
+    Get an encoded payload from the per-process cache.
+
+    Args:
+        key: The cache key.
+
+    Returns:
+        The cached bytes, or None on a miss or once expired.
+    """
+    return _local_cache.get(key)
+
+
+def local_cache_set(key: str, payload: bytes, ttl: float) -> None:
+    """
+    Store an encoded payload in the per-process cache.
+
+    Args:
+        key: The cache key.
+        payload: The encoded payload.
+        ttl: Time to live in seconds.
+    """
+    _local_cache.set(key, payload, ttl)
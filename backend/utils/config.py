@@ -1,27 +1,43 @@
 """
 Configuration settings for the NBA Injury Alert system.
 """
+import functools
 import os
-from typing import Dict, List, Optional, Union
-from pydantic import BaseModel, Field
+from typing import Any, Dict, List, Optional, Union
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class DatabaseSettings(BaseModel):
     """Database connection settings."""
+    model_config = ConfigDict(frozen=True, extra="forbid")
+    
     host: str = Field(default="localhost")
     port: int = Field(default=5432)
     username: str = Field(default="postgres")
     password: str = Field(default="localdev")
     database: str = Field(default="nba_injury_alert")
+    # Connection pools per process: the sync engine serves the processor and
+    # the user routes, the async engine the API read paths
+    pool_size: int = Field(default=10)
+    max_overflow: int = Field(default=5)
+    async_pool_size: int = Field(default=20)
+    async_max_overflow: int = Field(default=10)
     
     @property
     def connection_string(self) -> str:
         """Get the database connection string."""
         return f"postgresql://{self.username}:{self.password}@{self.host}:{self.port}/{self.database}"
+    
+    @property
+    def async_connection_string(self) -> str:
+        """Get the asyncpg database connection string."""
+        return f"postgresql+asyncpg://{self.username}:{self.password}@{self.host}:{self.port}/{self.database}"
 
 
 class RedisSettings(BaseModel):
     """Redis connection settings."""
+    model_config = ConfigDict(frozen=True, extra="forbid")
+    
     host: str = Field(default="localhost")
     port: int = Field(default=6379)
     db: int = Field(default=0)
@@ -34,7 +50,10 @@ class RedisSettings(BaseModel):
 
 class FetcherSettings(BaseModel):
     """Settings for the NBA data fetcher."""
+    model_config = ConfigDict(frozen=True, extra="forbid")
+    
     poll_interval_seconds: float = Field(default=1.0)
+    max_poll_interval_seconds: float = Field(default=60.0)
     max_retries: int = Field(default=3)
     timeout_seconds: float = Field(default=10.0)
     nba_api_base_url: str = Field(default="https://stats.nba.com/stats")
@@ -43,6 +62,8 @@ class FetcherSettings(BaseModel):
 
 class NotificationSettings(BaseModel):
     """Settings for notifications."""
+    model_config = ConfigDict(frozen=True, extra="forbid")
+    
     email_enabled: bool = Field(default=False)
     push_enabled: bool = Field(default=False)
     websocket_enabled: bool = Field(default=True)
@@ -51,16 +72,22 @@ class NotificationSettings(BaseModel):
     email_smtp_port: int = Field(default=587)
     email_smtp_username: Optional[str] = Field(default=None)
     email_smtp_password: Optional[str] = Field(default=None)
+    email_max_per_second: float = Field(default=10.0)
 
 
 class Settings(BaseModel):
     """Main application settings."""
+    model_config = ConfigDict(frozen=True, extra="forbid")
+    
     environment: str = Field(default="development")
     debug: bool = Field(default=True)
     database: DatabaseSettings = Field(default_factory=DatabaseSettings)
     redis: RedisSettings = Field(default_factory=RedisSettings)
     fetcher: FetcherSettings = Field(default_factory=FetcherSettings)
     notification: NotificationSettings = Field(default_factory=NotificationSettings)
+    allowed_origins: List[str] = Field(default_factory=lambda: ["http://localhost:3000"])
+    bcrypt_rounds: int = Field(default=12)
+    auth_rate_limit_per_minute: int = Field(default=10)
     top_players_source_url: str = Field(
         default="https://www.espn.com/nba/story/_/id/38387889/nba-rank-2023-24-top-100-best-players-season-predictions"
     )
@@ -73,39 +100,73 @@ class Settings(BaseModel):
 
 
 # Create settings instance with environment variable overrides
+@functools.lru_cache(maxsize=1)
 def get_settings() -> Settings:
     """Get application settings with environment variable overrides."""
-    settings = Settings()
+    # Collect the overrides from environment variables, then build the
+    # (immutable) settings in one pass
+    database: Dict[str, Any] = {}
+    redis: Dict[str, Any] = {}
+    notification: Dict[str, Any] = {}
+    overrides: Dict[str, Any] = {}
     
-    # Override settings from environment variables
     if db_host := os.environ.get("DB_HOST"):
-        settings.database.host = db_host
+        database["host"] = db_host
     
     if db_port := os.environ.get("DB_PORT"):
-        settings.database.port = int(db_port)
+        database["port"] = int(db_port)
     
     if db_user := os.environ.get("DB_USER"):
-        settings.database.username = db_user
+        database["username"] = db_user
     
     if db_pass := os.environ.get("DB_PASSWORD"):
-        settings.database.password = db_pass
+        database["password"] = db_pass
     
     if db_name := os.environ.get("DB_NAME"):
-        settings.database.database = db_name
+        database["database"] = db_name
+    
+    if db_pool_size := os.environ.get("DB_POOL_SIZE"):
+        database["pool_size"] = int(db_pool_size)
+    
+    if db_max_overflow := os.environ.get("DB_MAX_OVERFLOW"):
+        database["max_overflow"] = int(db_max_overflow)
+    
+    if db_async_pool_size := os.environ.get("DB_ASYNC_POOL_SIZE"):
+        database["async_pool_size"] = int(db_async_pool_size)
+    
+    if db_async_max_overflow := os.environ.get("DB_ASYNC_MAX_OVERFLOW"):
+        database["async_max_overflow"] = int(db_async_max_overflow)
     
     if redis_host := os.environ.get("REDIS_HOST"):
-        settings.redis.host = redis_host
+        redis["host"] = redis_host
     
     if redis_port := os.environ.get("REDIS_PORT"):
-        settings.redis.port = int(redis_port)
+        redis["port"] = int(redis_port)
     
     if env := os.environ.get("ENVIRONMENT"):
-        settings.environment = env
+        overrides["environment"] = env
     
     if debug := os.environ.get("DEBUG"):
-        settings.debug = debug.lower() in ("true", "1", "yes")
+        overrides["debug"] = debug.lower() in ("true", "1", "yes")
+    
+    if allowed_origins := os.environ.get("ALLOWED_ORIGINS"):
+        overrides["allowed_origins"] = [origin.strip() for origin in allowed_origins.split(",") if origin.strip()]
     
-    return settings
+    if bcrypt_rounds := os.environ.get("BCRYPT_ROUNDS"):
+        overrides["bcrypt_rounds"] = int(bcrypt_rounds)
+    
+    if auth_rate_limit := os.environ.get("AUTH_RATE_LIMIT_PER_MINUTE"):
+        overrides["auth_rate_limit_per_minute"] = int(auth_rate_limit)
+    
+    if email_max_per_second := os.environ.get("EMAIL_MAX_PER_SECOND"):
+        notification["email_max_per_second"] = float(email_max_per_second)
+    
+    return Settings(
+        database=DatabaseSettings(**database),
+        redis=RedisSettings(**redis),
+        notification=NotificationSettings(**notification),
+        **overrides
+    )
 
 
 # Global settings instance
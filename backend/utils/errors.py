@@ -3,11 +3,13 @@ Error handling utilities for the NBA Injury Alert system.
 """
 from typing import Any, Dict, List, Optional, Union
 
-from .logging import logger
-
 
 class BaseAppError(Exception):
-    """Base exception class for application errors."""
+    """
+    Base exception class for application errors.
+    
+    Errors are logged by the code that handles them, not when they are created.
+    """
     
     def __init__(
         self, 
@@ -27,12 +29,6 @@ class BaseAppError(Exception):
         self.status_code = status_code
         self.details = details or {}
         super().__init__(self.message)
-        
-        # Log the error
-        logger.error(
-            f"Error {self.__class__.__name__} ({status_code}): {message}",
-            extra={"details": self.details}
-        )
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert the error to a dictionary representation."""
@@ -7,11 +7,20 @@ from typing import Optional
 
 from .config import settings
 
+# One console handler shared by every application logger
+_console_handler = logging.StreamHandler(sys.stdout)
+_console_handler.setFormatter(logging.Formatter(
+    '%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+    datefmt='%Y-%m-%d %H:%M:%S'
+))
+
 
 def setup_logger(name: str, level: Optional[int] = None) -> logging.Logger:
     """
     Set up a logger with the specified name and level.
     
+    Calling it again for the same name only updates the level.
+    
     Args:
         name: The name of the logger.
         level: The logging level. If None, uses DEBUG for development and INFO for production.
@@ -25,23 +34,11 @@ def setup_logger(name: str, level: Optional[int] = None) -> logging.Logger:
     logger = logging.getLogger(name)
     logger.setLevel(level)
     
-    # Remove existing handlers to avoid duplicates
-    for handler in logger.handlers[:]:
-        logger.removeHandler(handler)
-    
-    # Create console handler
-    console_handler = logging.StreamHandler(sys.stdout)
-    console_handler.setLevel(level)
-    
-    # Create formatter
-    formatter = logging.Formatter(
-        '%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-        datefmt='%Y-%m-%d %H:%M:%S'
-    )
-    console_handler.setFormatter(formatter)
-    
-    # Add handler to logger
-    logger.addHandler(console_handler)
+    # Attach the shared handler once; records don't also propagate to the
+    # parent's handler, which would print them twice
+    if _console_handler not in logger.handlers:
+        logger.addHandler(_console_handler)
+        logger.propagate = False
     
     return logger
 
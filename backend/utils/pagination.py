@@ -0,0 +1,44 @@
+"""
+Keyset pagination helpers for the NBA Injury Alert system.
+"""
+import base64
+from datetime import datetime
+from typing import Tuple
+
+from .errors import ValidationError
+
+
+def encode_cursor(timestamp: datetime, row_id: int) -> str:
+    """
+    Encode the sort key of the last row on a page as an opaque cursor.
+
+    Args:
+        timestamp: Timestamp the list is ordered by.
+        row_id: ID of the row, used to break ties between equal timestamps.
+
+    Returns:
+        URL-safe cursor string.
+    """
+    raw = f"{timestamp.isoformat()}|{row_id}"
+    return base64.urlsafe_b64encode(raw.encode()).decode()
+
+
+def decode_cursor(cursor: str) -> Tuple[datetime, int]:
+    """
+    Decode a cursor produced by encode_cursor.
+
+    Args:
+        cursor: The cursor string.
+
+    Returns:
+        Tuple of (timestamp, row_id).
+
+    Raises:
+        ValidationError: If the cursor is malformed.
+    """
+    try:
+        raw = base64.urlsafe_b64decode(cursor.encode()).decode()
+        timestamp, row_id = raw.split("|", 1)
+        return datetime.fromisoformat(timestamp), int(row_id)
+    except (ValueError, UnicodeDecodeError) as e:
+        raise ValidationError(f"Invalid cursor: {cursor}") from e
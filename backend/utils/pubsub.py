@@ -0,0 +1,56 @@
+"""
+Redis pub/sub utilities for the NBA Injury Alert system.
+"""
+from typing import Any, AsyncIterator
+
+import orjson
+import redis.asyncio as redis
+
+from .cache import redis_client
+from .config import settings
+
+# Channel carrying WebSocket messages from the worker to the API processes
+WEBSOCKET_CHANNEL = "nba:websocket"
+
+
+async def publish(channel: str, message: Any) -> None:
+    """
+    Publish a JSON-serializable message.
+
+    Args:
+        channel: The channel to publish on.
+        message: The message to publish.
+
+    Raises:
+        RedisError: If Redis is unavailable.
+    """
+    await redis_client.publish(channel, orjson.dumps(message))
+
+
+async def subscribe(channel: str) -> AsyncIterator[Any]:
+    """
+    Yield messages published on a channel until the connection drops.
+
+    Args:
+        channel: The channel to subscribe to.
+
+    Yields:
+        Decoded messages.
+
+    Raises:
+        RedisError: If the connection to Redis fails.
+    """
+    # Use a dedicated client: the shared one has a short read timeout that
+    # would keep interrupting an idle subscription
+    client = redis.from_url(settings.redis.connection_string)
+    pubsub = client.pubsub()
+
+    try:
+        await pubsub.subscribe(channel)
+
+        async for message in pubsub.listen():
+            if message["type"] == "message":
+                yield orjson.loads(message["data"])
+    finally:
+        await pubsub.aclose()
+        await client.aclose()
@@ -0,0 +1,39 @@
+"""
+Rate limiting utilities for the NBA Injury Alert system.
+"""
+import time
+
+from redis.exceptions import RedisError
+
+from .cache import redis_client
+from .logging import logger
+
+# Prefix applied to every rate limit counter
+RATE_LIMIT_PREFIX = "nba:ratelimit"
+
+
+async def hit(key: str, limit: int, window: int) -> bool:
+    """
+    Count a request against a fixed-window rate limit.
+
+    Args:
+        key: Who and what is being limited, e.g. "token:<client address>".
+        limit: Number of requests allowed per window.
+        window: Window length in seconds.
+
+    Returns:
+        True if the request is within the limit (or Redis is unavailable).
+    """
+    counter = f"{RATE_LIMIT_PREFIX}:{key}:{int(time.time()) // window}"
+
+    try:
+        async with redis_client.pipeline(transaction=True) as pipe:
+            pipe.incr(counter)
+            pipe.expire(counter, window)
+            count, _ = await pipe.execute()
+    except RedisError as e:
+        # Fail open: an outage shouldn't lock everyone out
+        logger.warning(f"Rate limit check failed for {key}: {str(e)}")
+        return True
+
+    return count <= limit
@@ -0,0 +1,118 @@
+"""
+Background worker for the NBA Injury Alert system.
+
+Polls for new injury reports, processes them and sends notifications. Run a
+single worker next to any number of API processes:
+
+    python -m backend.worker
+"""
+import asyncio
+
+from sqlalchemy import select
+from sqlalchemy.orm import joinedload
+
+from .fetcher.nba import NBAInjuryPoller
+from .models.database import AsyncSessionLocal, init_db
+from .models.injury import InjuryReport, InjuryStatus
+from .notifier.channels import WebSocketPublisher
+from .notifier.service import NotificationService
+from .processor.injury import InjuryReportProcessor
+from .utils.logging import logger
+
+
+async def run_worker() -> None:
+    """Poll for injury reports and send notifications for status changes."""
+    logger.info("Starting NBA Injury Alert worker")
+    
+    # Create processor, poller, and notification service
+    processor = InjuryReportProcessor()
+    poller = NBAInjuryPoller()
+    
+    # WebSocket clients are connected to the API processes, so publish
+    # WebSocket notifications to them through Redis
+    notification_service = NotificationService(websocket_notifier=WebSocketPublisher())
+    
+    # The last report processed, reused as the previous report for the next
+    # diff instead of loading it back from the database
+    last_processed = None
+    
+    # Define callback for new reports
+    async def on_new_report(report_data):
+        nonlocal last_processed
+        
+        try:
+            # Process the report
+            processed = await processor.process(report_data)
+            
+            # Get the previous report's ID, and its statuses and players in
+            # one query unless it is the report processed last
+            async with AsyncSessionLocal() as db:
+                previous_report_id = (await db.execute(
+                    select(InjuryReport.id).order_by(
+                        InjuryReport.report_date.desc()
+                    ).offset(1).limit(1)
+                )).scalar_one_or_none()
+                
+                previous_report = None
+                if previous_report_id is not None and (
+                    last_processed is None or last_processed["report_id"] != previous_report_id
+                ):
+                    result = await db.execute(
+                        select(InjuryReport).options(
+                            joinedload(InjuryReport.statuses).joinedload(InjuryStatus.player)
+                        ).where(InjuryReport.id == previous_report_id)
+                    )
+                    previous_report = result.unique().scalar_one()
+            
+            if previous_report:
+                # Rebuild the previous processed data in the shape process() returns
+                previous_data = {
+                    "report_id": previous_report.id,
+                    "player_statuses": [
+                        {
+                            "player_id": status.player.nba_id,
+                            "player_name": status.player.name,
+                            "team": status.player.team,
+                            "status": status.status,
+                            "reason": status.reason,
+                            "details": status.details,
+                            "game_date": status.game_date,
+                            "opponent": status.opponent,
+                            "rank": status.player.current_rank
+                        }
+                        for status in previous_report.statuses
+                    ]
+                }
+            elif previous_report_id is not None:
+                previous_data = last_processed
+            else:
+                previous_data = None
+            
+            last_processed = processed
+            
+            if previous_data:
+                # Compute the diff
+                diff = await processor.compute_diff(processed, previous_data)
+                
+                # Send notifications for changes
+                if diff.get("changes"):
+                    await notification_service.process_status_changes(diff["changes"])
+        
+        except Exception as e:
+            logger.error(f"Error processing new report: {str(e)}")
+    
+    # Start polling for injury reports
+    try:
+        await poller.start_polling(callback=on_new_report)
+    finally:
+        await poller.aclose()
+
+
+def main():
+    """Run the NBA Injury Alert worker."""
+    init_db()
+    asyncio.run(run_worker())
+
+
+if __name__ == "__main__":
+    main()
@@ -15,18 +15,20 @@ setup(
     install_requires=[
         "fastapi>=0.95.0",
         "uvicorn>=0.21.1",
-        "sqlalchemy>=2.0.9",
+        "orjson>=3.8.0",
+        "sqlalchemy[asyncio]>=2.0.9",
         "pydantic>=1.10.7",
         "python-dotenv>=1.0.0",
         "httpx>=0.24.0",
         "asyncio>=3.4.3",
         "python-jose>=3.3.0",
-        "passlib>=1.7.4",
         "bcrypt>=4.0.1",
         "python-multipart>=0.0.6",
         "aiosmtplib>=2.0.1",
         "alembic>=1.10.3",
         "psycopg2-binary>=2.9.6",
+        "asyncpg>=0.27.0",
+        "redis>=5.0.1",
         "python-dateutil>=2.8.2",
         "pytz>=2023.3",
         "tenacity>=8.2.2",
@@ -35,6 +37,8 @@ setup(
         "dev": [
             "pytest>=7.3.1",
             "pytest-asyncio>=0.21.0",
+            "pytest-xdist>=3.3.1",
+            "aiosqlite>=0.19.0",
             "black>=23.3.0",
             "isort>=5.12.0",
             "flake8>=6.0.0",
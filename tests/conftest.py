@@ -1,39 +1,119 @@
 """
 Pytest configuration for the NBA Injury Alert system tests.
 """
-import os
-import sys
+from contextlib import contextmanager
+
+import anyio
 import pytest
-from sqlalchemy import create_engine
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine, event
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
 from sqlalchemy.orm import sessionmaker
-
-# Add the parent directory to the Python path
-sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+from sqlalchemy.pool import NullPool
 
 from backend.models.base import Base
-from backend.models.database import get_db
-from backend.api.main import app
+from backend.models.database import get_async_db, get_db
 
 
-# Test database URL
-TEST_DATABASE_URL = "sqlite:///./test.db"
+# Test database URL: a named in-memory database, shared by the sync and
+# async engines' connections
+TEST_DATABASE_URL = "sqlite:///file:nba_injury_alert_test?mode=memory&cache=shared&uri=true"
+TEST_ASYNC_DATABASE_URL = "sqlite+aiosqlite:///file:nba_injury_alert_test?mode=memory&cache=shared&uri=true"
 
 
 @pytest.fixture(scope="session")
 def test_engine():
     """Create a test database engine."""
     engine = create_engine(TEST_DATABASE_URL, connect_args={"check_same_thread": False})
+    
+    # Let SQLAlchemy emit BEGIN itself so SAVEPOINTs work under pysqlite
+    @event.listens_for(engine, "connect")
+    def do_connect(dbapi_connection, connection_record):
+        dbapi_connection.isolation_level = None
+    
+    @event.listens_for(engine, "begin")
+    def do_begin(connection):
+        connection.exec_driver_sql("BEGIN")
+    
+    # The in-memory database lives as long as a connection to it is open
+    keep_alive = engine.connect()
     Base.metadata.create_all(bind=engine)
     yield engine
-    Base.metadata.drop_all(bind=engine)
-    os.remove("./test.db")
+    keep_alive.close()
+    engine.dispose()
+
+
+@pytest.fixture(scope="session")
+def async_test_engine(test_engine):
+    """Create the async engine the API uses during tests."""
+    return create_async_engine(TEST_ASYNC_DATABASE_URL, poolclass=NullPool)
+
+
+@pytest.fixture(scope="session")
+def session_factory(test_engine):
+    """Create the session factory shared by the test database sessions."""
+    return sessionmaker(
+        autocommit=False,
+        autoflush=False,
+        bind=test_engine,
+        expire_on_commit=False
+    )
+
+
+@pytest.fixture(scope="module")
+def module_connection(test_engine):
+    """
+    Open a test database connection for the whole test module.
+    
+    Its transaction is rolled back after the module's last test, so rows
+    created on it can be shared by the module's tests.
+    """
+    connection = test_engine.connect()
+    transaction = connection.begin()
+    try:
+        yield connection
+    finally:
+        transaction.rollback()
+        connection.close()
+
+
+@pytest.fixture(scope="module")
+def module_db_session(module_connection, session_factory):
+    """Create a test database session for reference data shared by a module."""
+    session = session_factory(bind=module_connection, join_transaction_mode="create_savepoint")
+    try:
+        yield session
+    finally:
+        session.close()
+
+
+@pytest.fixture(scope="function")
+def db_session(module_connection, session_factory):
+    """
+    Create a test database session rolled back at the end of the test.
+    
+    The session runs inside a SAVEPOINT on the module's connection, so its
+    commits only release a nested SAVEPOINT and nothing persists between
+    tests, while the module's shared rows stay visible.
+    """
+    savepoint = module_connection.begin_nested()
+    session = session_factory(bind=module_connection, join_transaction_mode="create_savepoint")
+    try:
+        yield session
+    finally:
+        session.close()
+        savepoint.rollback()
 
 
 @pytest.fixture(scope="function")
-def db_session(test_engine):
-    """Create a test database session."""
-    TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=test_engine)
-    session = TestingSessionLocal()
+def api_db_session(session_factory):
+    """
+    Create a test database session whose commits the API can see.
+    
+    The API also reads through its own async connections, so data it needs
+    has to be committed for real (and cleaned up by the test).
+    """
+    session = session_factory()
     try:
         yield session
     finally:
@@ -42,21 +122,83 @@ def db_session(test_engine):
 
 
 @pytest.fixture(scope="function")
-def client(db_session):
-    """Create a test client for the FastAPI app."""
-    from fastapi.testclient import TestClient
+def count_queries(test_engine, async_test_engine):
+    """
+    Count the SQL statements the API runs, to catch N+1 regressions.
+    
+    Usage:
+        with count_queries() as queries:
+            client.get("/api/injuries/changes")
+        assert len(queries) <= 1
+    """
+    @contextmanager
+    def _count_queries():
+        queries = []
+        
+        def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+            queries.append(statement)
+        
+        # Routers use both the sync and the async session
+        engines = [test_engine, async_test_engine.sync_engine]
+        for engine in engines:
+            event.listen(engine, "before_cursor_execute", before_cursor_execute)
+        try:
+            yield queries
+        finally:
+            for engine in engines:
+                event.remove(engine, "before_cursor_execute", before_cursor_execute)
+    
+    return _count_queries
+
+
+@pytest.fixture(scope="session")
+def app():
+    """Get the FastAPI app, imported only by the tests that use it."""
+    from backend.api.main import app
+    
+    return app
+
+
+@pytest.fixture(scope="session")
+def app_client(app, async_test_engine):
+    """Create one test client for the FastAPI app, sharing one event loop and skipping its lifespan."""
+    # Override the get_async_db dependency
+    TestingAsyncSessionLocal = async_sessionmaker(async_test_engine, expire_on_commit=False)
+    
+    async def override_get_async_db():
+        async with TestingAsyncSessionLocal() as session:
+            yield session
+    
+    app.dependency_overrides[get_async_db] = override_get_async_db
+    
+    # Entering TestClient as a context manager would also run the app's
+    # startup (init_db() against the configured database and the Redis
+    # WebSocket relay); the test engine creates the tables itself. Without
+    # it each request would start its own event loop, so hold one portal
+    # (and loop) open for the whole session instead
+    client = TestClient(app)
+    with anyio.from_thread.start_blocking_portal(**client.async_backend) as portal:
+        client.portal = portal
+        yield client
+        client.portal = None
     
+    # Remove the overrides after the tests
+    app.dependency_overrides.clear()
+
+
+@pytest.fixture(scope="function")
+def client(app, app_client, api_db_session):
+    """Get the test client, using this test's database session."""
     # Override the get_db dependency
     def override_get_db():
         try:
-            yield db_session
+            yield api_db_session
         finally:
             pass
     
     app.dependency_overrides[get_db] = override_get_db
     
-    with TestClient(app) as client:
-        yield client
+    yield app_client
     
     # Remove the override after the test
-    app.dependency_overrides.clear()
+    del app.dependency_overrides[get_db]
@@ -2,8 +2,14 @@
 Integration tests for the API endpoints.
 """
 import pytest
+from datetime import datetime, timedelta
 from fastapi import status
 
+from backend.api.routers.users import ME_CACHE_MAX_AGE, UserOut, create_access_token
+from backend.models.injury import InjuryReport, InjuryStatus
+from backend.models.player import Player
+from backend.models.user import User
+
 
 def test_health_check(client):
     """Test the health check endpoint."""
@@ -45,7 +51,100 @@ def test_redoc(client):
 )
 def test_api_endpoints_exist(client, endpoint):
     """Test that the API endpoints exist."""
-    response = client.get(endpoint)
+    # A HEAD request matches the route without serializing a response body
     # We don't care about the response code here, just that the endpoint exists
-    # It might return 401 if authentication is required, or 404 if no data exists
+    # It might return 401 if authentication is required, or 405 if the route
+    # only accepts GET
+    response = client.head(endpoint)
     assert response.status_code != status.HTTP_404_NOT_FOUND
+
+
+@pytest.fixture
+def injury_filter_players(api_db_session):
+    """Seed players with a recent injury, an old injury and no injury reported."""
+    now = datetime.now()
+    
+    report = InjuryReport(report_date=now, report_hash="injury-filter-test", raw_content=InjuryReport.compress_content(b"{}"))
+    recent, old, healthy = players = [
+        Player(name=f"Injury Filter Player {name}", team="IFT", nba_id=f"injury-filter-{name}")
+        for name in ("recent", "old", "healthy")
+    ]
+    
+    api_db_session.add(report)
+    api_db_session.add_all(players)
+    api_db_session.flush()
+    
+    for player, created_at in ((recent, now - timedelta(hours=1)), (old, now - timedelta(days=10))):
+        injury_status = InjuryStatus(status="OUT", player_id=player.id, report_id=report.id, created_at=created_at)
+        api_db_session.add(injury_status)
+        api_db_session.flush()
+        player.current_status_id = injury_status.id
+    
+    # The API reads through its own connection, so the data has to be committed
+    api_db_session.commit()
+    
+    yield {"recent": recent.id, "old": old.id, "healthy": healthy.id}
+    
+    # Clean up
+    player_ids = [player.id for player in players]
+    api_db_session.query(Player).filter(Player.id.in_(player_ids)).update(
+        {Player.current_status_id: None}, synchronize_session=False
+    )
+    api_db_session.query(InjuryStatus).filter(InjuryStatus.report_id == report.id).delete()
+    api_db_session.query(Player).filter(Player.id.in_(player_ids)).delete(synchronize_session=False)
+    api_db_session.query(InjuryReport).filter(InjuryReport.id == report.id).delete()
+    api_db_session.commit()
+
+
+@pytest.mark.parametrize(
+    "has_injury, expected",
+    [
+        ("true", {"recent"}),
+        ("false", {"old", "healthy"}),
+    ],
+)
+def test_players_has_injury_filter(client, injury_filter_players, has_injury, expected):
+    """Test that only a non-active status from the last week counts as injured."""
+    response = client.get(f"/api/players/?team=IFT&has_injury={has_injury}")
+    
+    assert response.status_code == status.HTTP_200_OK
+    player_ids = {player["id"] for player in response.json()["players"]}
+    assert player_ids == {injury_filter_players[name] for name in expected}
+
+
+@pytest.fixture
+def auth_headers(api_db_session):
+    """Create a user and return the headers authenticating as them."""
+    user = User(email="etag-test@example.com")
+    api_db_session.add(user)
+    api_db_session.commit()
+
+    yield {"Authorization": f"Bearer {create_access_token({'sub': str(user.id)})}"}
+
+    # Clean up
+    api_db_session.delete(user)
+    api_db_session.commit()
+
+
+def test_me_revalidates_with_etag(client, auth_headers):
+    """Test that /me sends the response model's fields with an ETag, and a 304 once the client has them."""
+    response = client.get("/api/users/me", headers=auth_headers)
+
+    assert response.status_code == status.HTTP_200_OK
+    assert set(response.json()) == set(UserOut.model_fields)
+    assert response.headers["Cache-Control"] == f"private, max-age={ME_CACHE_MAX_AGE}"
+    etag = response.headers["ETag"]
+
+    response = client.get("/api/users/me", headers={**auth_headers, "If-None-Match": etag})
+
+    assert response.status_code == status.HTTP_304_NOT_MODIFIED
+    assert response.content == b""
+    assert response.headers["ETag"] == etag
+
+    # A changed user no longer matches the old ETag
+    client.put("/api/users/me", headers=auth_headers, json={"username": "etag-test"})
+    response = client.get("/api/users/me", headers={**auth_headers, "If-None-Match": etag})
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response.json()["username"] == "etag-test"
+    assert response.headers["ETag"] != etag
@@ -0,0 +1,115 @@
+"""
+Pagination tests for the injury list endpoints.
+"""
+import pytest
+from datetime import datetime, timedelta
+from fastapi import status
+
+from backend.models.injury import InjuryReport, StatusChange
+from backend.models.player import Player
+
+
+@pytest.fixture
+def paged_data(api_db_session):
+    """Seed reports and changes whose dates tie across page boundaries."""
+    now = datetime.now().replace(microsecond=0)
+    # Runs of equal timestamps so that pages of two split a tie
+    dates = [now, now, now, now - timedelta(minutes=1), now - timedelta(minutes=1)]
+
+    reports = [
+        InjuryReport(report_date=date, report_hash=f"pagination-test-{i}", raw_content=InjuryReport.compress_content(b"{}"))
+        for i, date in enumerate(dates)
+    ]
+    player = Player(name="Pagination Player", team="PGN", nba_id="pagination-test", is_top_100=False)
+
+    api_db_session.add_all(reports)
+    api_db_session.add(player)
+    api_db_session.flush()
+
+    changes = [
+        StatusChange(
+            player_id=player.id,
+            old_status="ACTIVE",
+            new_status="OUT",
+            change_date=date,
+            report_id=reports[0].id
+        )
+        for date in dates
+    ]
+    api_db_session.add_all(changes)
+
+    # The API reads through its own connection, so the data has to be committed
+    api_db_session.commit()
+
+    yield {
+        "reports": [report.id for report in reports],
+        "changes": [change.id for change in changes],
+    }
+
+    # Clean up
+    report_ids = [report.id for report in reports]
+    api_db_session.query(StatusChange).filter(StatusChange.player_id == player.id).delete()
+    api_db_session.query(Player).filter(Player.id == player.id).delete()
+    api_db_session.query(InjuryReport).filter(InjuryReport.id.in_(report_ids)).delete(synchronize_session=False)
+    api_db_session.commit()
+
+
+def _walk(client, url, key, filters):
+    """Follow next_cursor from the first page until it runs out, returning the row IDs in order."""
+    ids = []
+    params = {**filters, "limit": 2}
+    while True:
+        response = client.get(url, params=params)
+        assert response.status_code == status.HTTP_200_OK
+        data = response.json()
+        ids.extend(row["id"] for row in data[key])
+        if data["next_cursor"] is None:
+            return ids
+        params = {**filters, "limit": 2, "cursor": data["next_cursor"]}
+
+
+@pytest.mark.parametrize(
+    "url, key, filters",
+    [
+        ("/api/injuries/reports", "reports", {}),
+        ("/api/injuries/changes", "changes", {"top_players_only": False}),
+    ],
+)
+def test_cursor_walk_covers_every_row_once(client, paged_data, url, key, filters):
+    """Test that walking the cursor pages returns each row once, in order, across tied dates."""
+    ids = _walk(client, url, key, filters)
+    seeded = [row_id for row_id in ids if row_id in paged_data[key]]
+
+    assert len(ids) == len(set(ids))
+    # Newest date first, ties broken by descending ID
+    assert seeded == [*sorted(paged_data[key][:3], reverse=True), *sorted(paged_data[key][3:], reverse=True)]
+
+
+@pytest.mark.parametrize("url", ["/api/injuries/reports", "/api/injuries/changes"])
+@pytest.mark.parametrize("cursor", ["not-a-cursor", "bm90LWEtY3Vyc29y"])
+def test_malformed_cursor_is_rejected(client, url, cursor):
+    """Test that a cursor that doesn't decode is a client error."""
+    response = client.get(url, params={"cursor": cursor})
+
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+
+@pytest.mark.parametrize(
+    "url, key, filters",
+    [
+        ("/api/injuries/reports", "reports", {}),
+        ("/api/injuries/changes", "changes", {"top_players_only": False}),
+    ],
+)
+def test_total_when_skipping_past_the_end(client, paged_data, url, key, filters):
+    """Test that an empty page past the end still reports the full total."""
+    total = client.get(url, params=filters).json()["total"]
+    assert total >= len(paged_data[key])
+
+    response = client.get(url, params={**filters, "skip": total + 10})
+
+    assert response.status_code == status.HTTP_200_OK
+    data = response.json()
+    assert data[key] == []
+    assert data["total"] == total
+    assert data["next_cursor"] is None
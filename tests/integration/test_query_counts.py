@@ -0,0 +1,123 @@
+"""
+Query-count tests guarding the API endpoints against N+1 queries.
+"""
+import pytest
+from datetime import datetime
+from fastapi import status
+
+from backend.api.routers.users import create_access_token
+from backend.models.injury import InjuryReport, InjuryStatus, StatusChange
+from backend.models.player import Player
+from backend.models.user import NotificationSetting, Team, User
+
+
+@pytest.fixture
+def injury_data(api_db_session):
+    """Seed a report with statuses and changes for 25 players."""
+    now = datetime.now()
+
+    report = InjuryReport(report_date=now, report_hash="query-count-test", raw_content=InjuryReport.compress_content(b"{}"))
+    players = [
+        Player(
+            name=f"Query Count Player {i}",
+            team=["LAL", "BOS", "MIA"][i % 3],
+            current_rank=i + 1,
+            is_top_100=True,
+            nba_id=f"query-count-{i}"
+        )
+        for i in range(25)
+    ]
+
+    api_db_session.add(report)
+    api_db_session.add_all(players)
+    api_db_session.flush()
+
+    for player in players:
+        injury_status = InjuryStatus(status="OUT", player_id=player.id, report_id=report.id)
+        api_db_session.add(injury_status)
+        api_db_session.flush()
+        player.current_status_id = injury_status.id
+
+        api_db_session.add(StatusChange(
+            player_id=player.id,
+            old_status="ACTIVE",
+            new_status="OUT",
+            change_date=now,
+            report_id=report.id
+        ))
+
+    # The API reads through its own connection, so the data has to be committed
+    api_db_session.commit()
+
+    yield {"report_id": report.id, "player_id": players[0].id}
+
+    # Clean up
+    player_ids = [player.id for player in players]
+    api_db_session.query(Player).filter(Player.id.in_(player_ids)).update(
+        {Player.current_status_id: None}, synchronize_session=False
+    )
+    api_db_session.query(StatusChange).filter(StatusChange.report_id == report.id).delete()
+    api_db_session.query(InjuryStatus).filter(InjuryStatus.report_id == report.id).delete()
+    api_db_session.query(Player).filter(Player.id.in_(player_ids)).delete(synchronize_session=False)
+    api_db_session.query(InjuryReport).filter(InjuryReport.id == report.id).delete()
+    api_db_session.commit()
+
+
+@pytest.mark.parametrize(
+    "endpoint, max_queries",
+    [
+        ("/api/players/?limit=20", 1),
+        ("/api/injuries/reports", 1),
+        ("/api/injuries/reports/{report_id}", 2),
+        ("/api/injuries/changes?limit=20", 1),
+        ("/api/injuries/players/{player_id}/history", 3),
+    ],
+)
+def test_endpoint_query_count(client, count_queries, injury_data, endpoint, max_queries):
+    """Test that list endpoints issue a fixed number of queries regardless of page size."""
+    with count_queries() as queries:
+        response = client.get(endpoint.format(**injury_data))
+
+    assert response.status_code == status.HTTP_200_OK
+    assert len(queries) <= max_queries, "\n".join(queries)
+
+
+@pytest.fixture
+def user_data(api_db_session, injury_data):
+    """Seed a user with favorite teams, favorite players and notification settings."""
+    players = api_db_session.query(Player).filter(Player.nba_id.like("query-count-%")).all()
+    teams = [
+        Team(name=f"Query Count Team {i}", abbreviation=f"QC{i}", city="City", conference="East", division="Atlantic")
+        for i in range(5)
+    ]
+    user = User(email="query-count@example.com", favorite_teams=teams, favorite_players=players)
+    user.notification_settings = [NotificationSetting(player_id=player.id) for player in players]
+
+    api_db_session.add(user)
+    api_db_session.commit()
+
+    yield {"Authorization": f"Bearer {create_access_token({'sub': str(user.id)})}"}
+
+    # Clean up
+    api_db_session.delete(user)
+    api_db_session.flush()
+    for team in teams:
+        api_db_session.delete(team)
+    api_db_session.commit()
+
+
+@pytest.mark.parametrize(
+    "endpoint, max_queries",
+    [
+        ("/api/users/me/favorites/teams", 2),
+        ("/api/users/me/favorites/players", 2),
+        ("/api/users/me/notification-settings", 3),
+    ],
+)
+def test_user_endpoint_query_count(client, count_queries, user_data, endpoint, max_queries):
+    """Test that the user's related rows are loaded in batches rather than per row."""
+    with count_queries() as queries:
+        response = client.get(endpoint, headers=user_data)
+
+    assert response.status_code == status.HTTP_200_OK
+    assert len(queries) <= max_queries, "\n".join(queries)
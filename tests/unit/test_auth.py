@@ -0,0 +1,97 @@
+"""
+Unit tests for the authentication helpers.
+"""
+import pytest
+import time
+from datetime import timedelta
+
+from backend.api.routers import users
+from backend.api.routers.users import (
+    authenticate_user,
+    create_access_token,
+    get_password_hash,
+    user_id_from_token,
+    verify_password,
+)
+from backend.models.user import User
+
+
+@pytest.fixture
+def decodes(monkeypatch):
+    """Count JWT decodes, starting from an empty token cache."""
+    calls = []
+    decode = users.jwt.decode
+
+    def counting_decode(*args, **kwargs):
+        calls.append(args[0])
+        return decode(*args, **kwargs)
+
+    monkeypatch.setattr(users.jwt, "decode", counting_decode)
+    monkeypatch.setattr(users, "_token_cache", users.TTLCache(maxsize=10))
+    return calls
+
+
+def test_token_is_decoded_once(decodes):
+    """Test that a verified token is served from the cache on later requests."""
+    token = create_access_token({"sub": "42"})
+
+    assert user_id_from_token(token) == 42
+    assert user_id_from_token(token) == 42
+    assert len(decodes) == 1
+
+
+def test_invalid_token_is_not_cached(decodes):
+    """Test that tokens failing verification are decoded, and rejected, every time."""
+    token = create_access_token({"sub": "42"})[:-2] + "xx"
+
+    assert user_id_from_token(token) is None
+    assert user_id_from_token(token) is None
+    assert len(decodes) == 2
+
+
+def test_cached_token_does_not_outlive_its_expiry(decodes):
+    """Test that the cache entry expires with the token rather than after the full cache TTL."""
+    token = create_access_token({"sub": "42"}, expires_delta=timedelta(seconds=5))
+    user_id_from_token(token)
+
+    expiry, _ = users._token_cache._entries[token]
+
+    assert expiry - time.monotonic() <= 5
+
+
+@pytest.fixture
+def verified_hashes(monkeypatch):
+    """Record the hashes passwords are checked against."""
+    hashes = []
+
+    def recording_verify(plain_password, hashed_password):
+        hashes.append(hashed_password)
+        return False
+
+    monkeypatch.setattr(users, "verify_password", recording_verify)
+    return hashes
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("email", ["nobody@example.com", "no-password@example.com"])
+async def test_login_without_a_hash_still_runs_bcrypt(db_session, verified_hashes, email):
+    """Test that unknown emails and password-less users cost a bcrypt check like wrong passwords do."""
+    db_session.add(User(email="no-password@example.com"))
+    db_session.flush()
+
+    assert await authenticate_user(db_session, email, "password123") is None
+    assert verified_hashes == [users._DUMMY_HASH]
+
+
+@pytest.mark.parametrize("hashed_password", [None, "", "plaintext", "$1$saltsalt$hash"])
+def test_non_bcrypt_hash_never_verifies(hashed_password):
+    """Test that stored values that aren't bcrypt hashes are rejected without raising."""
+    assert not verify_password("password123", hashed_password)
+
+
+def test_bcrypt_hash_verifies():
+    """Test that a password verifies against its own hash only."""
+    hashed_password = get_password_hash("password123")
+
+    assert verify_password("password123", hashed_password)
+    assert not verify_password("password124", hashed_password)
@@ -0,0 +1,120 @@
+"""
+Unit tests for the HTTP fetcher's retry loop.
+"""
+import httpx
+import pytest
+
+from backend.fetcher import base
+from backend.fetcher.base import MAX_RETRY_DELAY_SECONDS, HttpFetcher
+from backend.fetcher.nba import NBAInjuryFetcher
+from backend.utils.errors import FetcherError
+
+
+class StubFetcher(HttpFetcher):
+    """HTTP fetcher that answers requests with a fixed sequence of responses."""
+    
+    def __init__(self, responses, max_retries=3):
+        super().__init__(base_url="https://api.example.com", max_retries=max_retries)
+        self.responses = list(responses)
+        self.requests = 0
+        self._client = httpx.AsyncClient(transport=httpx.MockTransport(self._respond))
+    
+    def _respond(self, request):
+        self.requests += 1
+        return self.responses.pop(0)
+    
+    async def fetch(self):
+        return {}
+
+
+@pytest.fixture
+def sleeps(monkeypatch):
+    """Record the retry delays instead of waiting them out."""
+    delays = []
+    
+    async def fake_sleep(delay):
+        delays.append(delay)
+    
+    monkeypatch.setattr(base.asyncio, "sleep", fake_sleep)
+    return delays
+
+
+@pytest.mark.asyncio
+async def test_retries_rate_limit_and_server_errors(sleeps):
+    """Test that a 429 and a 5xx are retried, capping the server's Retry-After."""
+    fetcher = StubFetcher([
+        httpx.Response(429, headers={"Retry-After": "3600"}),
+        httpx.Response(503),
+        httpx.Response(200, json={"ok": True}),
+    ])
+    
+    response = await fetcher._make_request("GET", "/injuryreport")
+    
+    assert response.status_code == 200
+    assert fetcher.requests == 3
+    assert sleeps[0] == MAX_RETRY_DELAY_SECONDS
+    assert 2 <= sleeps[1] <= 2.1
+
+
+@pytest.mark.asyncio
+async def test_gives_up_without_waiting_after_last_attempt(sleeps):
+    """Test that the last Retry-After is left to the caller rather than waited out twice."""
+    fetcher = StubFetcher(
+        [httpx.Response(429, headers={"Retry-After": "5"}) for _ in range(3)],
+        max_retries=2
+    )
+    
+    with pytest.raises(FetcherError) as exc_info:
+        await fetcher._make_request("GET", "/injuryreport")
+    
+    assert fetcher.requests == 3
+    assert sleeps == [5, 5]
+    assert exc_info.value.retry_after == 5
+
+
+@pytest.fixture
+def nba_fetcher():
+    """Create an NBA fetcher serving a fixed report and storing it without a database."""
+    requests = []
+    
+    def respond(request):
+        requests.append(request)
+        if request.headers.get("If-None-Match") == '"v1"':
+            return httpx.Response(304)
+        return httpx.Response(200, json={"players": []}, headers={"ETag": '"v1"'})
+    
+    fetcher = NBAInjuryFetcher(base_url="https://api.example.com")
+    fetcher._client = httpx.AsyncClient(transport=httpx.MockTransport(respond))
+    fetcher._known_hashes = set()
+    fetcher._store_report = lambda report_hash, raw_content: 1
+    fetcher.requests = requests
+    return fetcher
+
+
+@pytest.mark.asyncio
+async def test_unchanged_report_is_not_downloaded_again(nba_fetcher):
+    """Test that the stored report's ETag is sent back, and a 304 is reported as no new report."""
+    first = await nba_fetcher.fetch()
+    second = await nba_fetcher.fetch()
+    
+    assert first["is_new"] and first["report_id"] == 1
+    assert second == {"data": None, "hash": None, "is_new": False}
+    assert "If-None-Match" not in nba_fetcher.requests[0].headers
+    assert nba_fetcher.requests[1].headers["If-None-Match"] == '"v1"'
+
+
+@pytest.mark.asyncio
+async def test_failed_store_is_downloaded_again(nba_fetcher):
+    """Test that a report that couldn't be stored isn't hidden behind a 304 on the next poll."""
+    def fail_store(report_hash, raw_content):
+        raise RuntimeError("database unavailable")
+    
+    nba_fetcher._store_report = fail_store
+    with pytest.raises(FetcherError):
+        await nba_fetcher.fetch()
+    
+    nba_fetcher._store_report = lambda report_hash, raw_content: 1
+    result = await nba_fetcher.fetch()
+    
+    assert result["is_new"]
+    assert "If-None-Match" not in nba_fetcher.requests[1].headers
@@ -4,91 +4,104 @@ Unit tests for the database models.
 import pytest
 from datetime import datetime
 
+from sqlalchemy import insert, inspect
+
 from backend.models.player import Player, PlayerRanking
 from backend.models.injury import InjuryReport, InjuryStatus, StatusChange
 from backend.models.user import User, NotificationSetting, Team
 
 
-def test_player_model(db_session):
-    """Test the Player model."""
-    # Create a player
+@pytest.fixture(scope="module")
+def player(module_db_session):
+    """Create a player, once per module, for the models that reference one."""
     player = Player(
         name="LeBron James",
         team="LAL",
         position="F",
         jersey_number="23",
         current_rank=1,
-        is_top_100=True,
-        nba_id="2544",
-        espn_id="1966"
+        is_top_100=True
     )
     
-    db_session.add(player)
-    db_session.commit()
-    
-    # Query the player
-    queried_player = db_session.query(Player).filter(Player.name == "LeBron James").first()
-    
-    # Assert that the player was created correctly
-    assert queried_player is not None
-    assert queried_player.name == "LeBron James"
-    assert queried_player.team == "LAL"
-    assert queried_player.position == "F"
-    assert queried_player.jersey_number == "23"
-    assert queried_player.current_rank == 1
-    assert queried_player.is_top_100 is True
-    assert queried_player.nba_id == "2544"
-    assert queried_player.espn_id == "1966"
+    # Flush to get the ID without committing
+    module_db_session.add(player)
+    module_db_session.flush()
+    return player
 
 
-def test_injury_report_model(db_session):
-    """Test the InjuryReport model."""
-    # Create an injury report
-    report = InjuryReport(
-        report_date=datetime.now(),
-        source_url="https://example.com/injury-report",
-        report_hash="abc123"
-    )
-    
-    db_session.add(report)
+@pytest.mark.parametrize(
+    "model, values, lookup",
+    [
+        (
+            Player,
+            {
+                "name": "LeBron James",
+                "team": "LAL",
+                "position": "F",
+                "jersey_number": "23",
+                "current_rank": 1,
+                "is_top_100": True,
+                "nba_id": "2544",
+                "espn_id": "1966"
+            },
+            "nba_id"
+        ),
+        (
+            InjuryReport,
+            {
+                "report_date": datetime.now(),
+                "source_url": "https://example.com/injury-report",
+                "report_hash": "abc123",
+                "raw_content": InjuryReport.compress_content(b"{}")
+            },
+            "report_hash"
+        ),
+        (
+            User,
+            {
+                "email": "user@example.com",
+                "username": "testuser",
+                "hashed_password": "hashedpassword",
+                "email_notifications": True,
+                "push_notifications": False,
+                "web_notifications": True,
+                "is_active": True,
+                "is_verified": False
+            },
+            "email"
+        ),
+    ],
+    ids=["player", "injury_report", "user"],
+)
+def test_model_roundtrip(db_session, model, values, lookup):
+    """Test that a model's row is created and read back correctly."""
+    # Create the row
+    db_session.execute(insert(model), [values])
     db_session.commit()
     
-    # Query the report
-    queried_report = db_session.query(InjuryReport).first()
+    # Query the row
+    queried = db_session.query(model).filter(getattr(model, lookup) == values[lookup]).first()
     
-    # Assert that the report was created correctly
-    assert queried_report is not None
-    assert queried_report.source_url == "https://example.com/injury-report"
-    assert queried_report.report_hash == "abc123"
+    # Assert that the row was created correctly
+    assert queried is not None
+    for key, value in values.items():
+        assert getattr(queried, key) == value
 
 
-def test_injury_status_model(db_session):
+def test_injury_status_model(db_session, player):
     """Test the InjuryStatus model."""
-    # Create a player
-    player = Player(
-        name="LeBron James",
-        team="LAL",
-        position="F",
-        jersey_number="23",
-        current_rank=1,
-        is_top_100=True
-    )
-    
     # Create an injury report
     report = InjuryReport(
         report_date=datetime.now(),
         source_url="https://example.com/injury-report",
-        report_hash="abc123"
+        report_hash="abc123",
+        raw_content=InjuryReport.compress_content(b"{}")
     )
     
-    db_session.add(player)
-    db_session.add(report)
-    db_session.commit()
-    
     # Create an injury status
     status = InjuryStatus(
         player_id=player.id,
-        report_id=report.id,
+        report=report,
         status="OUT",
         reason="Ankle",
         details="Left ankle sprain",
@@ -98,11 +111,12 @@ def test_injury_status_model(db_session):
         previous_status="QUESTIONABLE"
     )
     
-    db_session.add(status)
+    # Add the report and status together; the flush orders the inserts
+    db_session.add_all([report, status])
     db_session.commit()
     
     # Query the status
-    queried_status = db_session.query(InjuryStatus).first()
+    queried_status = db_session.get(InjuryStatus, status.id)
     
     # Assert that the status was created correctly
     assert queried_status is not None
@@ -116,39 +130,7 @@ def test_injury_status_model(db_session):
     assert queried_status.previous_status == "QUESTIONABLE"
 
 
-def test_user_model(db_session):
-    """Test the User model."""
-    # Create a user
-    user = User(
-        email="user@example.com",
-        username="testuser",
-        hashed_password="hashedpassword",
-        email_notifications=True,
-        push_notifications=False,
-        web_notifications=True,
-        is_active=True,
-        is_verified=False
-    )
-    
-    db_session.add(user)
-    db_session.commit()
-    
-    # Query the user
-    queried_user = db_session.query(User).filter(User.email == "user@example.com").first()
-    
-    # Assert that the user was created correctly
-    assert queried_user is not None
-    assert queried_user.email == "user@example.com"
-    assert queried_user.username == "testuser"
-    assert queried_user.hashed_password == "hashedpassword"
-    assert queried_user.email_notifications is True
-    assert queried_user.push_notifications is False
-    assert queried_user.web_notifications is True
-    assert queried_user.is_active is True
-    assert queried_user.is_verified is False
-
-
-def test_notification_setting_model(db_session):
+def test_notification_setting_model(db_session, player):
     """Test the NotificationSetting model."""
     # Create a user
     user = User(
@@ -157,23 +139,9 @@ def test_notification_setting_model(db_session):
         hashed_password="hashedpassword"
     )
     
-    # Create a player
-    player = Player(
-        name="LeBron James",
-        team="LAL",
-        position="F",
-        jersey_number="23",
-        current_rank=1,
-        is_top_100=True
-    )
-    
-    db_session.add(user)
-    db_session.add(player)
-    db_session.commit()
-    
     # Create a notification setting
     setting = NotificationSetting(
-        user_id=user.id,
+        user=user,
         player_id=player.id,
         email_enabled=True,
         push_enabled=False,
@@ -181,11 +149,12 @@ def test_notification_setting_model(db_session):
         min_importance=3
     )
     
-    db_session.add(setting)
+    # Add the user and setting together; the flush orders the inserts
+    db_session.add_all([user, setting])
     db_session.commit()
     
     # Query the setting
-    queried_setting = db_session.query(NotificationSetting).first()
+    queried_setting = db_session.get(NotificationSetting, setting.id)
     
     # Assert that the setting was created correctly
     assert queried_setting is not None
@@ -197,8 +166,8 @@ def test_notification_setting_model(db_session):
     assert queried_setting.min_importance == 3
 
 
-def test_team_model(db_session):
-    """Test the Team model."""
+def test_team_model():
+    """Test the Team model without the database."""
     # Create a team
     team = Team(
         name="Los Angeles Lakers",
@@ -208,16 +177,21 @@ def test_team_model(db_session):
         division="Pacific"
     )
     
-    db_session.add(team)
-    db_session.commit()
-    
-    # Query the team
-    queried_team = db_session.query(Team).filter(Team.abbreviation == "LAL").first()
-    
     # Assert that the team was created correctly
-    assert queried_team is not None
-    assert queried_team.name == "Los Angeles Lakers"
-    assert queried_team.abbreviation == "LAL"
-    assert queried_team.city == "Los Angeles"
-    assert queried_team.conference == "Western"
-    assert queried_team.division == "Pacific"
+    assert team.name == "Los Angeles Lakers"
+    assert team.abbreviation == "LAL"
+    assert team.city == "Los Angeles"
+    assert team.conference == "Western"
+    assert team.division == "Pacific"
+    
+    # Guard the table's columns against unnoticed schema changes
+    assert set(inspect(Team).columns.keys()) == {
+        "id",
+        "name",
+        "abbreviation",
+        "city",
+        "conference",
+        "division",
+        "created_at",
+        "updated_at"
+    }
@@ -0,0 +1,196 @@
+"""
+Unit tests for the notification channels.
+"""
+import asyncio
+
+import orjson
+import pytest
+import pytest_asyncio
+
+from backend.notifier.base import NotificationFormatter
+from backend.notifier.channels import UNDISCLOSED_RECIPIENTS, EmailNotifier, WebSocketNotifier
+
+
+class FakeSMTP:
+    """SMTP client that records what it sends instead of talking to a server."""
+
+    def __init__(self, server):
+        self.server = server
+        self.is_connected = False
+
+    async def connect(self):
+        self.is_connected = True
+        self.server.sessions.append(0)
+        self.session = len(self.server.sessions) - 1
+        self.server.open += 1
+        self.server.max_open = max(self.server.max_open, self.server.open)
+
+    async def send_message(self, message, recipients=None):
+        self.server.messages.append((message, recipients))
+        self.server.sessions[self.session] += 1
+        refused = {recipient: "550 No such user" for recipient in recipients if recipient in self.server.refuse}
+        return refused, "250 OK"
+
+    async def quit(self):
+        self.close()
+
+    def close(self):
+        self.is_connected = False
+        self.server.open -= 1
+
+
+class FakeServer:
+    """Shared record of the connections and messages of every fake client."""
+
+    def __init__(self, refuse=()):
+        self.refuse = set(refuse)
+        self.sessions = []
+        self.open = 0
+        self.max_open = 0
+        self.messages = []
+
+
+@pytest.fixture
+def server():
+    """Create a fake SMTP server that refuses one recipient."""
+    return FakeServer(refuse=["refused@example.com"])
+
+
+@pytest.fixture
+def notifier(server):
+    """Create an email notifier that sends through fake clients, unpaced."""
+    notifier = EmailNotifier(smtp_server="smtp.example.com", smtp_port=465)
+    notifier._create_client = lambda: FakeSMTP(server)
+    notifier._send_interval = 0.0
+    return notifier
+
+
+def _notification(recipient, subject="Injury update"):
+    return {"recipient": recipient, "subject": subject, "message": "LeBron James is OUT", "html_message": None}
+
+
+@pytest.mark.asyncio
+async def test_batch_reuses_a_capped_pool_of_connections(notifier, server, monkeypatch):
+    """Test that a batch opens at most POOL_SIZE connections, reconnecting after the per-connection cap."""
+    monkeypatch.setattr(EmailNotifier, "MAX_MESSAGES_PER_CONNECTION", 3)
+    notifications = [_notification(f"user{i}@example.com", subject=f"Update {i}") for i in range(30)]
+
+    results = await notifier.send_batch(notifications)
+
+    assert [result["recipient"] for result in results] == [n["recipient"] for n in notifications]
+    assert all(result["success"] for result in results)
+    assert len(server.messages) == 30
+    assert server.max_open <= EmailNotifier.POOL_SIZE
+    assert max(server.sessions) == 3
+    assert server.open == 0
+
+
+@pytest.mark.asyncio
+async def test_identical_emails_share_one_message(notifier, server):
+    """Test that identical notifications go out as one undisclosed message, with per-recipient results."""
+    recipients = ["a@example.com", "refused@example.com", "b@example.com"]
+
+    results = await notifier.send_batch([_notification(recipient) for recipient in recipients])
+
+    assert len(server.messages) == 1
+    message, envelope = server.messages[0]
+    assert envelope == recipients
+    assert message["To"] == UNDISCLOSED_RECIPIENTS
+    assert [result["success"] for result in results] == [True, False, True]
+    assert "550" in results[1]["error"]
+
+
+class FakeWebSocket:
+    """WebSocket that records the frames sent to it, optionally stalling on each one."""
+
+    def __init__(self, stalled=False):
+        self.sent = []
+        self.closed = False
+        self.unstalled = asyncio.Event()
+        if not stalled:
+            self.unstalled.set()
+
+    async def accept(self):
+        pass
+
+    async def send_text(self, payload):
+        await self.unstalled.wait()
+        self.sent.append(payload)
+
+    async def close(self, code=1000):
+        self.closed = True
+
+
+@pytest_asyncio.fixture
+async def websocket_notifier():
+    """Create a WebSocket notifier, disconnecting its clients afterwards."""
+    notifier = WebSocketNotifier()
+    yield notifier
+    for client_id in list(notifier.active_connections):
+        notifier.disconnect(client_id)
+
+
+@pytest.mark.asyncio
+async def test_slow_client_does_not_hold_up_others(websocket_notifier, monkeypatch):
+    """Test that a stalled client's queue drops its oldest frames while other clients keep receiving."""
+    monkeypatch.setattr(WebSocketNotifier, "SEND_QUEUE_SIZE", 2)
+    slow, fast = FakeWebSocket(stalled=True), FakeWebSocket()
+    await websocket_notifier.connect(slow, "slow")
+    await websocket_notifier.connect(fast, "fast")
+
+    for i in range(5):
+        await websocket_notifier.broadcast(f"Update {i}", "message")
+        await asyncio.sleep(0)
+
+    assert len(fast.sent) == 5
+
+    slow.unstalled.set()
+    await asyncio.sleep(0.01)
+    # One frame was in flight when the client stalled; the queue kept the newest two
+    assert [orjson.loads(payload)["subject"] for payload in slow.sent] == ["Update 0", "Update 3", "Update 4"]
+
+
+@pytest.mark.asyncio
+async def test_reconnect_replaces_the_previous_connection(websocket_notifier):
+    """Test that reconnecting closes the old socket, and the old socket can't disconnect the new one."""
+    old, new = FakeWebSocket(), FakeWebSocket()
+    await websocket_notifier.connect(old, "client", user_id="42")
+    await websocket_notifier.connect(new, "client", user_id="42")
+
+    websocket_notifier.disconnect("client", old)
+
+    assert old.closed
+    assert websocket_notifier.active_connections["client"] is new
+    assert websocket_notifier.user_connections == {"42": {"client"}}
+
+    await websocket_notifier.send_notification("42", "Injury update", "message")
+    await asyncio.sleep(0)
+    assert len(new.sent) == 1 and not old.sent
+
+
+@pytest.mark.asyncio
+async def test_change_batches_reach_subscribed_rooms(websocket_notifier):
+    """Test that a room broadcast reaches only that room's clients, in one frame per client."""
+    everything, top100 = FakeWebSocket(), FakeWebSocket()
+    await websocket_notifier.connect(everything, "everything")
+    await websocket_notifier.connect(top100, "top100", rooms={WebSocketNotifier.ROOM_TOP_100})
+    changes = [{"player_id": 1, "new_status": "OUT"}, {"player_id": 2, "new_status": "QUESTIONABLE"}]
+
+    await websocket_notifier.broadcast_batch(changes, room=WebSocketNotifier.ROOM_ALL)
+    await websocket_notifier.broadcast_batch(changes[:1], room=WebSocketNotifier.ROOM_TOP_100)
+    await asyncio.sleep(0)
+
+    assert [orjson.loads(payload) for payload in everything.sent] == [{"type": "changes", "data": changes}]
+    assert [orjson.loads(payload) for payload in top100.sent] == [{"type": "changes", "data": changes[:1]}]
+
+
+def test_formatted_change_is_not_shared_between_callers():
+    """Test that changing one caller's formatted notification doesn't leak into the cached text."""
+    args = ("LeBron James", "LAL", "QUESTIONABLE", "OUT", "Ankle", None)
+    first = NotificationFormatter.format_injury_change(*args)
+    first["subject"] = "changed"
+
+    second = NotificationFormatter.format_injury_change(*args)
+
+    assert second is not first
+    assert second["subject"] == "LeBron James (LAL) status change: QUESTIONABLE → OUT"
@@ -0,0 +1,54 @@
+"""
+Unit tests for the injury report processor.
+"""
+import pytest
+from contextlib import contextmanager
+from datetime import datetime
+
+from backend.models.injury import InjuryReport, InjuryStatus
+from backend.models.player import Player
+from backend.processor import injury
+from backend.processor.injury import InjuryReportProcessor
+
+
+@pytest.fixture
+def processor(db_session, monkeypatch):
+    """Create a processor that stores through the test database session."""
+    @contextmanager
+    def test_db_session():
+        yield db_session
+        db_session.flush()
+    
+    monkeypatch.setattr(injury, "db_session", test_db_session)
+    return InjuryReportProcessor(top_players_only=False)
+
+
+@pytest.fixture
+def report(db_session):
+    """Create the injury report the statuses are stored against."""
+    report = InjuryReport(
+        report_date=datetime.now(),
+        report_hash="processor-test",
+        raw_content=InjuryReport.compress_content(b"{}")
+    )
+    db_session.add(report)
+    db_session.flush()
+    return report
+
+
+@pytest.mark.asyncio
+async def test_process_skips_players_without_nba_id(processor, report, db_session):
+    """Test that feed rows without a personId are skipped instead of failing the report."""
+    report_data = {
+        "players": [
+            {"personId": 2544, "name": "LeBron James", "teamName": "LAL", "status": "OUT"},
+            {"name": "Unknown Player", "teamName": "BOS", "status": "QUESTIONABLE"},
+        ]
+    }
+    
+    processed = await processor.process({"report_id": report.id, "data": report_data})
+    
+    # Only the player with an NBA ID is stored
+    assert [status["player_id"] for status in processed["player_statuses"]] == ["2544"]
+    assert db_session.query(Player).filter(Player.nba_id.is_(None)).count() == 0
+    assert db_session.query(InjuryStatus).filter(InjuryStatus.report_id == report.id).count() == 1
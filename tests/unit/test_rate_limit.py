@@ -0,0 +1,69 @@
+"""
+Unit tests for the Redis rate limiter.
+"""
+import pytest
+from redis.exceptions import ConnectionError
+
+from backend.utils import rate_limit
+from backend.utils.rate_limit import hit
+
+
+class FakePipeline:
+    """Pipeline that counts in a dict, or fails like an unreachable Redis."""
+
+    def __init__(self, counters, down):
+        self.counters = counters
+        self.down = down
+        self.commands = []
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        return False
+
+    def incr(self, key):
+        self.commands.append(("incr", key))
+
+    def expire(self, key, seconds):
+        self.commands.append(("expire", key))
+
+    async def execute(self):
+        if self.down:
+            raise ConnectionError("Connection refused")
+        results = []
+        for command, key in self.commands:
+            if command == "incr":
+                self.counters[key] = self.counters.get(key, 0) + 1
+                results.append(self.counters[key])
+            else:
+                results.append(True)
+        return results
+
+
+class FakeRedis:
+    """Just enough of the Redis client for the rate limiter."""
+
+    def __init__(self, down=False):
+        self.counters = {}
+        self.down = down
+
+    def pipeline(self, transaction=True):
+        return FakePipeline(self.counters, self.down)
+
+
+@pytest.mark.asyncio
+async def test_requests_over_the_limit_are_rejected(monkeypatch):
+    """Test that the limit applies per key within a window."""
+    monkeypatch.setattr(rate_limit, "redis_client", FakeRedis())
+
+    assert [await hit("token:1.2.3.4", 2, 60) for _ in range(3)] == [True, True, False]
+    assert await hit("token:5.6.7.8", 2, 60)
+
+
+@pytest.mark.asyncio
+async def test_fails_open_when_redis_is_down(monkeypatch):
+    """Test that a Redis outage lets requests through instead of locking everyone out."""
+    monkeypatch.setattr(rate_limit, "redis_client", FakeRedis(down=True))
+
+    assert all([await hit("token:1.2.3.4", 1, 60) for _ in range(3)])